@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+
+from aoc_api import SubmitResult
+
+STORE_FILE = "aoc_cache.sqlite"
+LEGACY_FILE = "aoc_cache.json"
+
+# (year, day, part, answer, unix time after which it may be submitted)
+QueuedAnswer = tuple[int, int, int, str, float]
+
+_stores: dict[str, AnswerStore] = {}
+_stores_lock = threading.Lock()
+
+
+class AnswerStore:
+    """
+    Submitted answers and their results, backed by sqlite.
+
+    Lookups go through the primary key index, every write is a single atomic
+    transaction. The database runs in WAL mode with a busy timeout, so several
+    processes can check and store answers at the same time. Answers which have
+    to wait for their submission are kept in a queue, at most one per part.
+    """
+
+    _path: str
+    _connection: sqlite3.Connection
+    _lock: threading.Lock
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        exists = os.path.exists(path)
+
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " year INTEGER, day INTEGER, part INTEGER, answer TEXT, result INTEGER,"
+            " PRIMARY KEY (year, day, part, answer))"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS queue ("
+            " year INTEGER, day INTEGER, part INTEGER, answer TEXT, not_before REAL,"
+            " PRIMARY KEY (year, day, part))"
+        )
+
+        path_legacy = os.path.join(os.path.dirname(path), LEGACY_FILE)
+        if not exists and os.path.exists(path_legacy):
+            self._import_legacy(path_legacy)
+
+    def _import_legacy(self, path: str) -> None:
+        with open(path, encoding="utf-8") as file:
+            cache: dict = json.load(file)
+
+        rows = [
+            (int(year), int(day), int(part), answer, int(result))
+            for year, days in cache.items()
+            for day, parts in days.items()
+            for part, answers in parts.items()
+            for answer, result in answers.items()
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+    def get(self, year: int, day: int, part: int, answer: str) -> SubmitResult | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT result FROM answers"
+                " WHERE year = ? AND day = ? AND part = ? AND answer = ?",
+                (year, day, part, answer),
+            ).fetchone()
+
+        return SubmitResult(row[0]) if row is not None else None
+
+    def put(
+        self, year: int, day: int, part: int, answer: str, result: SubmitResult
+    ) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)",
+                (year, day, part, answer, int(result)),
+            )
+
+    def enqueue(
+        self, year: int, day: int, part: int, answer: str, not_before: float
+    ) -> None:
+        """Queues the answer, replacing a queued answer of the same part."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO queue VALUES (?, ?, ?, ?, ?)",
+                (year, day, part, answer, not_before),
+            )
+
+    def dequeue(self, year: int, day: int, part: int, answer: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM queue"
+                " WHERE year = ? AND day = ? AND part = ? AND answer = ?",
+                (year, day, part, answer),
+            )
+
+    def queued(self) -> list[QueuedAnswer]:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT * FROM queue ORDER BY not_before"
+            ).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def get_answer_store(directory: str) -> AnswerStore:
+    """Returns the answer store of the given directory, opened once per process."""
+    path = os.path.abspath(os.path.join(directory, STORE_FILE))
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = AnswerStore(path)
+        return _stores[path]
+
+
+def test_answer_store(tmp_path) -> None:
+    store = AnswerStore(os.path.join(tmp_path, STORE_FILE))
+
+    assert store.get(2022, 1, 1, "42") is None
+    store.put(2022, 1, 1, "42", SubmitResult.WRONG)
+    store.put(2022, 1, 1, "24000", SubmitResult.RIGHT)
+    assert store.get(2022, 1, 1, "42") == SubmitResult.WRONG
+    assert store.get(2022, 1, 1, "24000") == SubmitResult.RIGHT
+    assert store.get(2022, 1, 2, "24000") is None
+
+    store.put(2022, 1, 1, "42", SubmitResult.ALREADY_DONE)
+    assert store.get(2022, 1, 1, "42") == SubmitResult.ALREADY_DONE
+
+
+def test_answer_store_queue(tmp_path) -> None:
+    store = AnswerStore(os.path.join(tmp_path, STORE_FILE))
+    store.enqueue(2022, 1, 1, "42", 20.0)
+    store.enqueue(2022, 1, 2, "7", 10.0)
+    store.enqueue(2022, 1, 1, "43", 30.0)
+    assert store.queued() == [(2022, 1, 2, "7", 10.0), (2022, 1, 1, "43", 30.0)]
+
+    # only the queued answer of the part is removed
+    store.dequeue(2022, 1, 1, "42")
+    store.dequeue(2022, 1, 2, "7")
+    assert store.queued() == [(2022, 1, 1, "43", 30.0)]
+
+
+def test_answer_store_legacy(tmp_path) -> None:
+    with open(os.path.join(tmp_path, LEGACY_FILE), "w", encoding="utf-8") as file:
+        file.write(json.dumps({2022: {5: {1: {"CMZ": SubmitResult.RIGHT}}}}))
+
+    store = AnswerStore(os.path.join(tmp_path, STORE_FILE))
+    assert store.get(2022, 5, 1, "CMZ") == SubmitResult.RIGHT
@@ -1,84 +1,70 @@
 from __future__ import annotations
 
-import importlib.machinery
-import importlib.util
+import contextlib
 import json
 import os
 import re
 import shutil
+import time
 from datetime import date
-from typing import Callable, Optional
+from functools import cache
+from typing import TYPE_CHECKING, Callable, Optional
 
-import pytest
-from aoc_api import AOC_API, SubmitResult
-from dotenv import load_dotenv
+from aoc_api import AOC_API, SubmitResult, iter_lines
+from registry import Solver, SolverEntry, discover_solvers, get_registry
 
+if TYPE_CHECKING:
+    from submitter import Submitter
+
+# heavy modules (pytest, dotenv, requests, sqlite3, concurrent.futures) are imported
+# where they are used, solvers and the cli import this module on every start
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
+
+RUNTIMES_FILE = ".aoc_runtimes.json"
+# solvers known to take seconds to minutes, used until a runtime was recorded
+SLOW_SOLVERS = {
+    (15, 2): 60.0,
+    (16, 1): 10.0,
+    (16, 2): 60.0,
+    (17, 1): 60.0,
+    (19, 1): 30.0,
+    (19, 2): 60.0,
+    (24, 1): 10.0,
+    (24, 2): 30.0,
+}
+
+
+@cache
+def get_api_token() -> str | None:
+    """Reads 'API_TOKEN' from the environment, loading '.env' on the first call."""
+    from dotenv import load_dotenv
+
+    load_dotenv(os.path.join(HERE, "../.env"))
+    return os.getenv("API_TOKEN")
 
 
 class AOC:
     _aoc_api: AOC_API
     _cache_dir: str
+    _submitter: Optional[Submitter] = None
 
     def __init__(self, session_cookie: str | None, cache_dir: str) -> None:
         self._aoc_api = AOC_API(session_cookie, cache_dir)
         self._cache_dir = cache_dir
 
-    def cache_answer(self, year: int, day: int, part: int, answer: str, res) -> None:
-        path = os.path.join(self._cache_dir, "aoc_cache.json")
-
-        if not os.path.exists(path):
-            with open(path, "w", encoding="utf-8") as file:
-                file.write(
-                    json.dumps({year: {day: {part: {answer: res}}}}, default=str)
-                )
-                return
-
-        with open(path, encoding="utf-8") as file:
-            cache: dict = json.loads(file.read())
-
-        k_year, k_day, k_part = str(year), str(day), str(part)
-
-        _w = False
-        if k_year not in cache:
-            cache[k_year] = {k_day: {k_part: {answer: res}}}
-        elif k_day not in cache[k_year]:
-            cache[k_year][k_day] = {k_part: {answer: res}}
-        elif k_part not in cache[k_year][k_day]:
-            cache[k_year][k_day][k_part] = {answer: res}
-        else:
-            cache[k_year][k_day][k_part][answer] = res
+    def cache_answer(
+        self, year: int, day: int, part: int, answer: str, res: SubmitResult
+    ) -> None:
+        from answer_store import get_answer_store
 
-        with open(path, "w", encoding="utf-8") as file:
-            file.write(json.dumps(cache, default=str))
+        get_answer_store(self._cache_dir).put(year, day, part, answer, res)
 
     def get_cached_answer(
         self, year: int, day: int, part: int, answer: str
     ) -> SubmitResult | None:
-        # get json from file
-        path = os.path.join(self._cache_dir, "aoc_cache.json")
-
-        if not os.path.exists(path):
-            return None
+        from answer_store import get_answer_store
 
-        with open(path, encoding="utf-8") as file:
-            cache: dict = json.load(file)
-
-        dict_year: dict | None = cache.get(str(year))
-        if dict_year is None:
-            return None
-
-        dict_day: dict | None = dict_year.get(str(day))
-        if dict_day is None:
-            return None
-
-        dict_part: dict | None = dict_day.get(str(part))
-        if dict_part is None:
-            return None
-
-        return dict_part.get(answer)
+        return get_answer_store(self._cache_dir).get(year, day, part, answer)
 
     def run_part(
         self,
@@ -88,6 +74,7 @@ class AOC:
         compute: Callable[[str], str] | None = None,
         auto_submit=False,
         test=False,
+        use_cache=True,
     ) -> None:
         input_str = self._aoc_api.get_input(year, day, test)
 
@@ -95,14 +82,71 @@ class AOC:
             print("Skip calculation of answer, 'compute' not provided.")
             return
 
-        answer = str(compute(input_str))
-        print(f"Answer: {answer}")
+        answer = self.compute_answer(compute, input_str, use_cache)
 
         if auto_submit:
             self.submit_solution(year, day, part, answer)
         else:
             print("Skip submission. auto_submit disabled")
 
+    def run_part_stream(
+        self,
+        year: int,
+        day: int,
+        part: int,
+        solver: SolverEntry,
+        auto_submit=False,
+        test=False,
+    ) -> None:
+        """
+        Runs a solver against the memory mapped input instead of a string.
+
+        Solvers opt in by providing 'compute_buffer(buffer)', which gets the
+        mapped input, or 'compute_lines(lines)', which gets a lazy iterator over
+        the lines. The result cache is not used, hashing the input would read it
+        completely.
+        """
+        if solver.compute_buffer is None and solver.compute_lines is None:
+            print("Skip calculation of answer, solver does not support streaming.")
+            return
+
+        with self._aoc_api.open_input(year, day, test) as buffer:
+            start = time.perf_counter()
+            if solver.compute_buffer is not None:
+                answer = str(solver.compute_buffer(buffer))
+            else:
+                answer = str(solver.compute_lines(iter_lines(buffer)))
+            elapsed = time.perf_counter() - start
+        print(f"Answer: {answer} ({elapsed:.3f}s, streamed)")
+
+        if auto_submit:
+            self.submit_solution(year, day, part, answer)
+        else:
+            print("Skip submission. auto_submit disabled")
+
+    def compute_answer(
+        self, compute: Callable[[str], str], input_str: str, use_cache=True
+    ) -> str:
+        if not use_cache:
+            answer, elapsed = _timed_compute(compute, input_str)
+            print(f"Answer: {answer} ({elapsed:.3f}s)")
+            return answer
+
+        from result_cache import get_result_cache, result_key
+
+        cache = get_result_cache(self._cache_dir)
+        key = result_key(compute, input_str)
+        cached = cache.get(key)
+        if cached is not None:
+            answer, elapsed = cached
+            print(f"Answer: {answer} (cached, computed in {elapsed:.3f}s)")
+            return answer
+
+        answer, elapsed = _timed_compute(compute, input_str)
+        print(f"Answer: {answer} ({elapsed:.3f}s)")
+        cache.put(key, answer, elapsed)
+        return answer
+
     def get_input(self, year: int, day: int) -> Optional[str]:
         today = date.today()
         d = date(year, 12, day)
@@ -130,13 +174,39 @@ class AOC:
 
         print(f"Submitting solution '{answer}'.")
 
-        result, txt = self._aoc_api.submit_solution(year, day, part, answer)
-        if result == SubmitResult.RIGHT:
+        result = self._get_submitter().submit(year, day, part, answer)
+        if result is None:
+            print(f"Too quick, '{answer}' is queued until AoC accepts answers again.")
+        elif result == SubmitResult.RIGHT:
             print(f"'{answer}' was correct!")
         else:
-            print(result, txt)
+            print(result)
+
+    def _get_submitter(self) -> Submitter:
+        if self._submitter is None:
+            from answer_store import get_answer_store
+            from submitter import Submitter
 
-        self.cache_answer(year, day, part, answer, result)
+            store = get_answer_store(self._cache_dir)
+            self._submitter = Submitter(self._aoc_api, store)
+            self._submitter.resume()
+        return self._submitter
+
+    def wait_for_submissions(self) -> None:
+        """Blocks until the queued answers are submitted, Ctrl+C keeps them queued."""
+        if self._submitter is None or not self._submitter.pending():
+            return
+        print("Waiting for queued submissions, Ctrl+C keeps them for the next run.")
+        try:
+            self._submitter.wait()
+        except KeyboardInterrupt:
+            print("Left the answers queued.")
+
+
+def _timed_compute(compute: Callable[[str], str], input_str: str) -> tuple[str, float]:
+    start = time.perf_counter()
+    answer = str(compute(input_str))
+    return answer, time.perf_counter() - start
 
 
 def get_input(directory: str, year: int, day: int):
@@ -146,10 +216,30 @@ def get_input(directory: str, year: int, day: int):
     if today < d:
         print(f"Skip getting input, {d} is in the future.")
         return
-    aoc_api = AOC_API(API_TOKEN, directory)
+    aoc_api = AOC_API(get_api_token(), directory)
     aoc_api.get_input(year, day)
 
 
+def prefetch_inputs(directory: str, year: int) -> None:
+    """
+    Downloads the missing inputs of all initialized days concurrently.
+
+        Parameters:
+            directory (str): Base directory of the year.
+            year (int): Year of the inputs.
+
+        Returns:
+            None
+    """
+    today = date.today()
+    days = [day for day in range(1, 26) if date(year, 12, day) <= today]
+    downloaded = AOC_API(get_api_token(), directory).prefetch_inputs(year, days)
+    if downloaded:
+        print(f"Downloaded input for days {', '.join(map(str, downloaded))}.")
+    else:
+        print("Skip prefetch, no input missing.")
+
+
 def init_day(directory: str, year: int, day: int, force=False) -> None:
     """
     Creates the base folder for the given day.
@@ -258,6 +348,14 @@ def run_day(
     test=False,
     skip_pytest=False,
     only_pytest=False,
+    use_cache=True,
+    profile: Optional[str] = None,
+    top=20,
+    stream=False,
+    perf=False,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    spans=False,
 ) -> None:
     print(f"Running: year {year}, day {day}, part {part}")
 
@@ -266,32 +364,230 @@ def run_day(
         print(f"Directory for day {day} does not exist.")
         return
 
-    path_module = os.path.join(path_day, f"part{part}.py")
+    registry = get_registry(directory)
+    entry = registry.entry(day, part)
+
+    tests_cache, key = None, None
+    if not skip_pytest and use_cache and not perf:
+        from result_cache import get_result_cache, module_tests_key
+
+        tests_cache, key = get_result_cache(path_day), module_tests_key(entry.path)
 
     if skip_pytest:
         print("Skip pytests")
+    elif tests_cache is not None and tests_cache.tests_passed(entry.path, key):
+        print("Skip pytests, unchanged since they last passed")
     else:
+        import pytest
+
         print("Running tests...")
-        retcode = pytest.main([path_module])
+        # pytest hands the collected module to the registry, it is imported once
+        plugins = [registry.pytest_plugin()]
+        if perf:
+            from baseline import baseline_plugin
+
+            solver = (entry.day, entry.part, entry.path)
+            plugins.append(baseline_plugin(registry.directory, solver))
+        retcode = pytest.main([entry.path], plugins=plugins)
         if retcode != pytest.ExitCode.OK:
             print("Test did not succeed, aborting run")
             return
+        if tests_cache is not None:
+            tests_cache.put_tests_passed(entry.path, key)
 
     if only_pytest:
         print("Skip run, only_pytest is set")
         return
 
-    loader = importlib.machinery.SourceFileLoader("mymodule", path_module)
-    spec = importlib.util.spec_from_loader("mymodule", loader)
-    module_part = importlib.util.module_from_spec(spec)
-    loader.exec_module(module_part)
+    entry = registry.get(day, part)
+    compute = entry.compute
+
+    if profile is not None:
+        from profiling import profiled
+
+        print(f"Running with {profile}, skip result cache.")
+        path_stats = os.path.join(path_day, f"part{part}.pstats")
+        compute = profiled(compute, profile, path_stats, top)
+        use_cache = False
+
+    if spans:
+        from instrument import instrumented
+
+        print("Recording spans and counters, skip result cache.")
+        compute = instrumented(compute)
+        use_cache = False
 
     if test:
         print("Using test.txt as input.")
 
-    aoc = AOC(API_TOKEN, path_day)
-    aoc.run_part(
-        year, day, part, module_part.compute, auto_submit=auto_submit, test=test
+    aoc = AOC(get_api_token(), path_day)
+    if stream:
+        aoc.run_part_stream(year, day, part, entry, auto_submit=auto_submit, test=test)
+    elif timeout is None and memory_limit is None:
+        aoc.run_part(
+            year,
+            day,
+            part,
+            compute,
+            auto_submit=auto_submit,
+            test=test,
+            use_cache=use_cache,
+        )
+    else:
+        from sandbox import SandboxError, sandboxed
+
+        print("Running in a child process with limits, skip result cache.")
+        solver = (entry.day, entry.part, entry.path)
+        try:
+            aoc.run_part(
+                year,
+                day,
+                part,
+                sandboxed(solver, timeout, memory_limit),
+                auto_submit=auto_submit,
+                test=test,
+                use_cache=False,
+            )
+        except SandboxError as error:
+            print(f"Run failed, {error.report()}")
+    aoc.wait_for_submissions()
+
+
+def _run_solver(
+    year: int,
+    solver: Solver,
+    test: bool,
+    use_cache: bool,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+) -> tuple[Solver, str, float, bool]:
+    day, part, path_module = solver
+    path_day = os.path.dirname(path_module)
+    input_str = AOC_API(get_api_token(), path_day).get_input(year, day, test)
+
+    def timed_compute(compute: Callable[[str], str]) -> tuple[str, float]:
+        if timeout is None and memory_limit is None:
+            return _timed_compute(compute, input_str)
+
+        from sandbox import run_sandboxed
+
+        return run_sandboxed(solver, input_str, timeout, memory_limit, echo=False)
+
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            entry = get_registry(os.path.dirname(path_day)).get(day, part)
+            if not use_cache:
+                return solver, *timed_compute(entry.compute), False
+
+            from result_cache import get_result_cache, result_key
+
+            cache = get_result_cache(path_day)
+            key = result_key(entry.compute, input_str)
+            cached = cache.get(key)
+            if cached is not None:
+                return solver, *cached, True
+
+            answer, elapsed = timed_compute(entry.compute)
+            cache.put(key, answer, elapsed)
+
+    return solver, answer, elapsed, False
+
+
+def load_runtimes(directory: str) -> dict[str, float]:
+    path = os.path.join(directory, RUNTIMES_FILE)
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_runtimes(directory: str, runtimes: dict[str, float]) -> None:
+    with open(os.path.join(directory, RUNTIMES_FILE), "w", encoding="utf-8") as file:
+        file.write(json.dumps(runtimes, indent=2, sort_keys=True))
+
+
+def schedule_solvers(
+    solvers: list[Solver], runtimes: dict[str, float]
+) -> list[Solver]:
+    """
+    Orders the solvers by their expected runtime, slowest first.
+
+    The expected runtime is the last recorded runtime of the solver, solvers
+    without a record fall back to 'SLOW_SOLVERS' or to 0.
+    """
+
+    def expected(solver: Solver) -> float:
+        day, part, _ = solver
+        return runtimes.get(f"{day}.{part}", SLOW_SOLVERS.get((day, part), 0.0))
+
+    return sorted(solvers, key=expected, reverse=True)
+
+
+def run_all(
+    directory: str,
+    year: int,
+    *,
+    test=False,
+    jobs: int | None = None,
+    use_cache=True,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+) -> None:
+    """
+    Runs every solver of the given directory in a process pool.
+
+        Parameters:
+            directory (str): Base directory of the year.
+            year (int): Year of the solvers.
+            test (bool): Use 'test.txt' instead of 'input.txt' as input.
+            jobs (int | None): Number of worker processes, defaults to the cpu count.
+            use_cache (bool): Reuse answers of unchanged solvers and inputs.
+            timeout (float | None): Seconds until a solver is stopped.
+            memory_limit (int | None): Address space limit of a solver in MiB.
+
+        Returns:
+            None
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    runtimes = load_runtimes(directory)
+    solvers = schedule_solvers(discover_solvers(directory), runtimes)
+    print(f"Running {len(solvers)} solvers, year {year}")
+
+    start = time.perf_counter()
+    failed: list[Solver] = []
+    cpu_time = 0.0
+    with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as executor:
+        futures = {
+            executor.submit(
+                _run_solver, year, solver, test, use_cache, timeout, memory_limit
+            ): solver
+            for solver in solvers
+        }
+        for future in as_completed(futures):
+            day, part, _ = futures[future]
+            try:
+                _, answer, elapsed, cached = future.result()
+            except Exception as e:  # pylint: disable=broad-except
+                failed.append(futures[future])
+                print(f"day{day:0>2} part{part}: failed ({type(e).__name__}: {e})")
+                continue
+
+            cpu_time += elapsed
+            runtimes[f"{day}.{part}"] = elapsed
+            info = f"{elapsed:.3f}s"
+            if cached:
+                info = f"cached, computed in {info}"
+            print(f"day{day:0>2} part{part}: {answer} ({info})")
+
+    wall_time = time.perf_counter() - start
+    # the runtimes schedule runs against the real input, test runs don't count
+    if not test:
+        save_runtimes(directory, runtimes)
+    print(
+        f"Finished {len(solvers) - len(failed)}/{len(solvers)} solvers "
+        f"in {wall_time:.2f}s (sum of solver runtimes {cpu_time:.2f}s)"
     )
 
 
@@ -1,9 +1,17 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import mmap
 import os
 import re
+import threading
+import time
 from enum import IntEnum, auto
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, Union
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 
 class SubmitResult(IntEnum):
@@ -18,18 +26,73 @@ TOO_QUICK = re.compile(r"You gave an answer too recently.*to wait\.")
 WRONG = re.compile(r"That's not the right answer.*?.")
 RIGHT = "That's the right answer!"
 ALREADY_DONE = re.compile(r"You don't seem to be solving.*\?")
+WAIT = re.compile(r"You have (?:(\d+)m )?(\d+)s left to wait")
+
+Buffer = Union[mmap.mmap, bytes]
+
+BASE_URL = "https://adventofcode.com"
+# seconds between the start of two requests
+MIN_INTERVAL = 0.25
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the keep-alive session shared by all AOC_API instances of the process.
+
+    GET requests are retried with exponential backoff on connection errors, rate
+    limiting (429, honoring 'Retry-After') and server errors. Answers are never
+    retried, submitting twice could count as two guesses.
+    """
+    # requests takes a noticeable part of the startup, import it on first use
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    global _session  # pylint: disable=global-statement
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+                respect_retry_after_header=True,
+            )
+            _session = requests.Session()
+            _session.mount("http://", HTTPAdapter(max_retries=retry))
+            _session.mount("https://", HTTPAdapter(max_retries=retry))
+        return _session
 
 
 class AOC_API:
     session_cookie: str | None
     cache_dir: str
+    base_url: str
+    _throttle_lock: threading.Lock
+    _last_request: float
 
-    def __init__(self, session_cookie: str | None, cache_dir: str) -> None:
+    def __init__(
+        self, session_cookie: str | None, cache_dir: str, base_url: str = BASE_URL
+    ) -> None:
         self.session_cookie = session_cookie
         self.cache_dir = cache_dir
+        self.base_url = base_url
+        self._throttle_lock = threading.Lock()
+        self._last_request = 0.0
 
     def _get_base_url(self, year, day) -> str:
-        return f"https://adventofcode.com/{year}/day/{day}"
+        return f"{self.base_url}/{year}/day/{day}"
+
+    def _throttle(self) -> None:
+        with self._throttle_lock:
+            wait = self._last_request + MIN_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request = time.monotonic()
 
     def _get_cookies(self) -> dict[str, str]:
         if self.session_cookie is None:
@@ -38,21 +101,97 @@ class AOC_API:
 
     def _get_input(self, year: int, day: int) -> str:
         url = f"{self._get_base_url(year, day)}/input"
-        res = requests.get(url, cookies=self._get_cookies(), timeout=5)
+        self._throttle()
+        res = get_session().get(url, cookies=self._get_cookies(), timeout=5)
+        res.raise_for_status()
         return res.text
 
+    def _download_input(self, year: int, day: int, path_to_file: str) -> str:
+        import tempfile
+
+        res = self._get_input(year, day)
+        # write to a temporary file first, an aborted download leaves no input.txt,
+        # its name is unique, parallel runs of the same day download concurrently
+        fd, path_tmp = tempfile.mkstemp(
+            suffix=".tmp", dir=os.path.dirname(path_to_file)
+        )
+        try:
+            with open(fd, "w", encoding="utf-8") as file:
+                file.write(res)
+            os.chmod(path_tmp, 0o644)
+            os.replace(path_tmp, path_to_file)
+        except BaseException:
+            os.remove(path_tmp)
+            raise
+        return res
+
     def get_input(self, year: int, day: int, test=False) -> str:
-        res: str
         file_name = "test" if test else "input"
         path_to_file = f"{self.cache_dir}/{file_name}.txt"
         if os.path.exists(path_to_file):
             with open(path_to_file, "r", encoding="utf-8") as file:
                 return file.read()
         else:
-            res = self._get_input(year, day)
-            with open(path_to_file, "w", encoding="utf-8") as file:
-                file.write(res)
-            return res
+            return self._download_input(year, day, path_to_file)
+
+    @contextlib.contextmanager
+    def open_input(self, year: int, day: int, test=False) -> Iterator[Buffer]:
+        """
+        Memory maps the cached input, downloading it first if necessary.
+
+        The input is paged in by the os as it is read, the memory footprint does
+        not depend on the size of the input. Use 'iter_lines' to read it lazily
+        line by line.
+        """
+        file_name = "test" if test else "input"
+        path_to_file = f"{self.cache_dir}/{file_name}.txt"
+        if not os.path.exists(path_to_file):
+            self._download_input(year, day, path_to_file)
+
+        with open(path_to_file, "rb") as file:
+            # empty files can't be mapped
+            if os.fstat(file.fileno()).st_size == 0:
+                yield b""
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+    def prefetch_inputs(
+        self, year: int, days: list[int], max_workers: int = 4
+    ) -> list[int]:
+        """
+        Downloads all missing inputs concurrently.
+
+        Here 'cache_dir' is the base directory of the year, the inputs are
+        written to 'dayXX/input.txt'. Missing day directories are skipped.
+
+            Parameters:
+                year (int): Year of the inputs.
+                days (list[int]): Days to download the input for.
+                max_workers (int): Maximal number of concurrent downloads.
+
+            Returns:
+                list[int]: Days which have been downloaded.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        missing: list[tuple[int, str]] = []
+        for day in days:
+            path_day = os.path.join(self.cache_dir, f"day{day:0>2}")
+            path_to_file = os.path.join(path_day, "input.txt")
+            if os.path.isdir(path_day) and not os.path.exists(path_to_file):
+                missing.append((day, path_to_file))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._download_input, year, day, path)
+                for day, path in missing
+            ]
+            for future in futures:
+                future.result()
+
+        return [day for day, _ in missing]
 
     def _post_answer(
         self, year: int, day: int, part: int, answer: str
@@ -60,7 +199,10 @@ class AOC_API:
         url = f"{self._get_base_url(year, day)}/answer"
         payload = dict(level=part, answer=answer)
 
-        return requests.post(url, payload, cookies=self._get_cookies(), timeout=5)
+        self._throttle()
+        return get_session().post(
+            url, payload, cookies=self._get_cookies(), timeout=5
+        )
 
     def submit_solution(
         self, year: int, day: int, part: int, answer: str
@@ -73,6 +215,8 @@ class AOC_API:
         ):
             error_match = error_regex.search(contents.text)
             if error_match:
+                if ret == SubmitResult.TOO_QUICK:
+                    return (ret, parse_wait(contents.text))
                 return (ret, None)
 
         if RIGHT in contents.text:
@@ -82,3 +226,105 @@ class AOC_API:
         # unexpected output?
         print(contents.text)
         return (SubmitResult.UNEXPECTED, None)
+
+
+def parse_wait(text: str) -> Optional[int]:
+    """Seconds to wait before the next submission, from a TOO_QUICK response."""
+    found = WAIT.search(text)
+    if found is None:
+        return None
+    minutes, seconds = found.groups()
+    return int(minutes or 0) * 60 + int(seconds)
+
+
+def iter_lines(buffer: Buffer) -> Iterator[str]:
+    """Lazily decodes the lines of a buffer, without the line endings."""
+    stream = buffer if isinstance(buffer, mmap.mmap) else io.BytesIO(buffer)
+    for line in iter(stream.readline, b""):
+        yield line.rstrip(b"\r\n").decode("utf-8")
+
+
+def test_parse_wait() -> None:
+    text = (
+        "You gave an answer too recently; you have to wait after submitting an"
+        " answer before trying again.  You have {}s left to wait."
+    )
+    assert parse_wait(text.format("32")) == 32
+    assert parse_wait(text.format("4m 12")) == 252
+    assert TOO_QUICK.search(text.format("4m 12"))
+    assert parse_wait("That's the right answer!") is None
+
+
+def test_open_input(tmp_path) -> None:
+    with open(os.path.join(tmp_path, "input.txt"), "w", encoding="utf-8") as file:
+        file.write("1000\n2000\n\n3000")
+
+    aoc_api = AOC_API(None, str(tmp_path))
+    with aoc_api.open_input(2022, 1) as buffer:
+        assert buffer[:4] == b"1000"
+        assert list(iter_lines(buffer)) == ["1000", "2000", "", "3000"]
+
+    assert list(iter_lines(b"")) == []
+
+
+def test_prefetch_inputs(tmp_path, monkeypatch) -> None:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    requested: list[str] = []
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):  # pylint: disable=invalid-name
+            requested.append(self.path)
+            # rate limit the first request of day 2
+            if self.path == "/2022/day/2/input" and requested.count(self.path) == 1:
+                self.send_response(429)
+                self.send_header("Retry-After", "0")
+                self.end_headers()
+                return
+
+            body = f"input {self.path.split('/')[3]}\n".encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        for day in (1, 2, 3):
+            os.mkdir(os.path.join(tmp_path, f"day{day:0>2}"))
+        path_cached = os.path.join(tmp_path, "day03", "input.txt")
+        with open(path_cached, "w", encoding="utf-8") as file:
+            file.write("cached\n")
+
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        aoc_api = AOC_API("cookie", str(tmp_path), base_url)
+        assert aoc_api.prefetch_inputs(2022, [1, 2, 3, 4]) == [1, 2]
+
+        # another download of the same input finishes between writing the
+        # temporary file and renaming it, they must not share the temporary file
+        path_day = os.path.join(tmp_path, "day05")
+        os.mkdir(path_day)
+        path_input = os.path.join(path_day, "input.txt")
+        replace = os.replace
+
+        def replace_after_other_download(src: str, dst: str) -> None:
+            monkeypatch.setattr(os, "replace", replace)
+            aoc_api._download_input(2022, 5, path_input)
+            replace(src, dst)
+
+        monkeypatch.setattr(os, "replace", replace_after_other_download)
+        assert aoc_api._download_input(2022, 5, path_input) == "input 5\n"
+        assert os.listdir(path_day) == ["input.txt"]
+    finally:
+        server.shutdown()
+
+    for day, expected in ((1, "input 1\n"), (2, "input 2\n"), (3, "cached\n")):
+        path_to_file = os.path.join(tmp_path, f"day{day:0>2}", "input.txt")
+        with open(path_to_file, encoding="utf-8") as file:
+            assert file.read() == expected
+    assert requested.count("/2022/day/2/input") == 2
+    assert "/2022/day/3/input" not in requested
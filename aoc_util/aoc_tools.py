@@ -1,7 +1,606 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Callable, Hashable, Iterable, Iterator, Optional, TypeVar
+
+EMPTY = ord(".")
+# distance and predecessor of states the search didn't reach
+UNREACHED = -1
+
+State = TypeVar("State")
+
+# (row, col) offsets of the neighbors, clockwise starting north
+OFFSETS_4 = ((-1, 0), (0, 1), (1, 0), (0, -1))
+OFFSETS_8 = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+
 def manhattan_dist(a: tuple[int, int], b: tuple[int, int]) -> int:
     return sum(abs(_a - _b) for _a, _b in zip(a, b))
 
 
+class Grid:
+    """
+    A rectangular grid of bytes, stored row by row in a single 'bytearray'.
+
+    Cells are addressed by '(row, col)' or by their flat index
+    'row * width + col', 'index' and 'position' convert between both. The
+    value of a cell is its byte, e.g. 'ord("#")', so solvers compare against
+    constants instead of creating an object per cell.
+    """
+
+    width: int
+    height: int
+    cells: bytearray
+    _offsets: dict[bool, tuple[tuple[int, int, int], ...]]
+
+    def __init__(self, width: int, height: int, fill: int = EMPTY) -> None:
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+        self._update_offsets()
+
+    @classmethod
+    def from_str(cls, input_str: str, fill: int = ord(" ")) -> Grid:
+        """Grid of the lines of 'input_str', shorter lines are padded with 'fill'."""
+        lines = [line.encode() for line in input_str.splitlines()]
+        width = max((len(line) for line in lines), default=0)
+        grid = cls(width, 0, fill)
+        grid.height = len(lines)
+        padding = bytes([fill])
+        grid.cells = bytearray(b"".join(line.ljust(width, padding) for line in lines))
+        return grid
+
+    def _update_offsets(self) -> None:
+        # flat index offset next to the row and col offset for the bounds check
+        self._offsets = {
+            diagonal: tuple((dr * self.width + dc, dr, dc) for dr, dc in offsets)
+            for diagonal, offsets in ((False, OFFSETS_4), (True, OFFSETS_8))
+        }
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.width + col
+
+    def position(self, index: int) -> tuple[int, int]:
+        return divmod(index, self.width)
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        row, col = position
+        if not self.in_bounds(row, col):
+            raise IndexError(f"{position} is outside of the grid")
+        return self.cells[row * self.width + col]
+
+    def __setitem__(self, position: tuple[int, int], value: int) -> None:
+        row, col = position
+        if not self.in_bounds(row, col):
+            raise IndexError(f"{position} is outside of the grid")
+        self.cells[row * self.width + col] = value
+
+    def get(self, row: int, col: int, default: Optional[int] = None) -> Optional[int]:
+        """Value of the cell, 'default' outside of the grid."""
+        if not self.in_bounds(row, col):
+            return default
+        return self.cells[row * self.width + col]
+
+    def neighbors(self, index: int, diagonal: bool = False) -> Iterator[int]:
+        """Flat indices of the neighbors inside of the grid."""
+        row, col = divmod(index, self.width)
+        for offset, dr, dc in self._offsets[diagonal]:
+            if 0 <= row + dr < self.height and 0 <= col + dc < self.width:
+                yield index + offset
+
+    def grow(
+        self,
+        top: int = 0,
+        right: int = 0,
+        bottom: int = 0,
+        left: int = 0,
+        fill: int = EMPTY,
+    ) -> None:
+        """
+        Adds rows and columns on the sides of the grid.
+
+        Flat indices change unless only rows are added at the bottom.
+        """
+        width = self.width + left + right
+        if left or right:
+            cells = bytearray()
+            pad_left, pad_right = bytes([fill]) * left, bytes([fill]) * right
+            for row in range(self.height):
+                start = row * self.width
+                cells += pad_left + self.cells[start : start + self.width] + pad_right
+            self.cells = cells
+        row_fill = bytearray([fill]) * width
+        self.cells = row_fill * top + self.cells + row_fill * bottom
+        self.width = width
+        self.height += top + bottom
+        self._update_offsets()
+
+    def find(self, value: int) -> int:
+        """Flat index of the first cell with 'value', -1 if there is none."""
+        return self.cells.find(bytes([value]))
+
+    def find_all(self, value: int) -> list[int]:
+        return [i for i, cell in enumerate(self.cells) if cell == value]
+
+    def count(self, value: int) -> int:
+        return self.cells.count(value)
+
+    def row(self, row: int) -> bytes:
+        return bytes(self.cells[row * self.width : (row + 1) * self.width])
+
+    def column(self, col: int) -> bytes:
+        return bytes(self.cells[col :: self.width])
+
+    def copy(self) -> Grid:
+        grid = Grid(self.width, 0)
+        grid.height = self.height
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.width == other.width and self.cells == other.cells
+
+    def render(self, overlay: Optional[dict[int, int]] = None) -> str:
+        """The grid as text, 'overlay' replaces the values of single cells."""
+        cells = self.cells
+        if overlay:
+            cells = bytearray(cells)
+            for index, value in overlay.items():
+                cells[index] = value
+        rows = (
+            cells[start : start + self.width]
+            for start in range(0, len(cells), self.width)
+        )
+        return b"\n".join(rows).decode()
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return f"Grid(width={self.width}, height={self.height})"
+
+
+# States are integers in 'range(size)', e.g. the flat index of a Grid cell.
+# 'neighbors' returns the next states, for the weighted searches as
+# '(state, cost)' pairs.
+Neighbors = Callable[[int], Iterable[int]]
+WeightedNeighbors = Callable[[int], Iterable[tuple[int, int]]]
+
+
+class SearchResult:
+    """
+    Distances and predecessors of a search, in flat arrays indexed by state.
+
+    A search stops at the first state for which 'is_goal' is true, states
+    which were not reached up to then are UNREACHED.
+    """
+
+    dist: array
+    prev: array
+    goal: int
+
+    def __init__(self, size: int) -> None:
+        self.dist = array("q", [UNREACHED]) * size
+        self.prev = array("q", [UNREACHED]) * size
+        self.goal = UNREACHED
+
+    def distance(self, state: Optional[int] = None) -> Optional[int]:
+        """Distance to 'state' (default the goal), None if it wasn't reached."""
+        state = self.goal if state is None else state
+        if state == UNREACHED or self.dist[state] == UNREACHED:
+            return None
+        return self.dist[state]
+
+    def path(self, state: Optional[int] = None) -> list[int]:
+        """States from a start to 'state' (default the goal), empty if not reached."""
+        if self.distance(state) is None:
+            return []
+        state = self.goal if state is None else state
+        path = []
+        while state != UNREACHED:
+            path.append(state)
+            state = self.prev[state]
+        path.reverse()
+        return path
+
+
+def bfs(
+    size: int,
+    starts: Iterable[int],
+    neighbors: Neighbors,
+    is_goal: Optional[Callable[[int], bool]] = None,
+) -> SearchResult:
+    """Breadth first search from one or more starts, every step costs 1."""
+    result = SearchResult(size)
+    dist, prev = result.dist, result.prev
+    queue: deque[int] = deque()
+    for start in starts:
+        if dist[start] != UNREACHED:
+            continue
+        dist[start] = 0
+        if is_goal is not None and is_goal(start):
+            result.goal = start
+            return result
+        queue.append(start)
+
+    while queue:
+        state = queue.popleft()
+        distance = dist[state] + 1
+        for following in neighbors(state):
+            if dist[following] != UNREACHED:
+                continue
+            dist[following] = distance
+            prev[following] = state
+            if is_goal is not None and is_goal(following):
+                result.goal = following
+                return result
+            queue.append(following)
+    return result
+
+
+def bfs_01(
+    size: int,
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    is_goal: Optional[Callable[[int], bool]] = None,
+) -> SearchResult:
+    """Search for graphs whose steps cost 0 or 1, with a deque instead of a heap."""
+    result = SearchResult(size)
+    dist, prev = result.dist, result.prev
+    done = bytearray(size)
+    queue: deque[int] = deque()
+    for start in starts:
+        dist[start] = 0
+        queue.append(start)
+
+    while queue:
+        state = queue.popleft()
+        if done[state]:
+            continue
+        done[state] = 1
+        if is_goal is not None and is_goal(state):
+            result.goal = state
+            return result
+
+        for following, cost in neighbors(state):
+            distance = dist[state] + cost
+            if dist[following] != UNREACHED and dist[following] <= distance:
+                continue
+            dist[following] = distance
+            prev[following] = state
+            if cost:
+                queue.append(following)
+            else:
+                queue.appendleft(following)
+    return result
+
+
+def a_star(
+    size: int,
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    heuristic: Optional[Callable[[int], int]] = None,
+    is_goal: Optional[Callable[[int], bool]] = None,
+) -> SearchResult:
+    """
+    A* search with a binary heap, Dijkstra without a 'heuristic'.
+
+    The heuristic has to be consistent (never overestimate the cost of a
+    step), otherwise the distance to the goal may not be the shortest.
+    """
+    result = SearchResult(size)
+    dist, prev = result.dist, result.prev
+    done = bytearray(size)
+    heap: list[tuple[int, int, int]] = []
+    for start in starts:
+        dist[start] = 0
+        estimate = heuristic(start) if heuristic is not None else 0
+        heap.append((estimate, 0, start))
+    heapq.heapify(heap)
+
+    while heap:
+        _, distance, state = heapq.heappop(heap)
+        if done[state]:
+            continue
+        done[state] = 1
+        if is_goal is not None and is_goal(state):
+            result.goal = state
+            return result
+
+        for following, cost in neighbors(state):
+            following_distance = distance + cost
+            current = dist[following]
+            if current != UNREACHED and current <= following_distance:
+                continue
+            dist[following] = following_distance
+            prev[following] = state
+            estimate = following_distance
+            if heuristic is not None:
+                estimate += heuristic(following)
+            heapq.heappush(heap, (estimate, following_distance, following))
+    return result
+
+
+def dijkstra(
+    size: int,
+    starts: Iterable[int],
+    neighbors: WeightedNeighbors,
+    is_goal: Optional[Callable[[int], bool]] = None,
+) -> SearchResult:
+    return a_star(size, starts, neighbors, None, is_goal)
+
+
+def manhattan_heuristic(width: int, goal: int) -> Callable[[int], int]:
+    """A* heuristic for Grid cells, steps to the 'goal' cell without obstacles."""
+    goal_row, goal_col = divmod(goal, width)
+
+    def heuristic(state: int) -> int:
+        row, col = divmod(state, width)
+        return abs(row - goal_row) + abs(col - goal_col)
+
+    return heuristic
+
+
+def bidirectional_bfs(
+    size: int,
+    start: int,
+    goal: int,
+    neighbors: Neighbors,
+    reverse_neighbors: Optional[Neighbors] = None,
+) -> list[int]:
+    """
+    Shortest path from 'start' to 'goal', searching from both ends.
+
+    The smaller frontier is expanded one level at a time until both searches
+    meet. 'reverse_neighbors' returns the states with a step to the given
+    state, it defaults to 'neighbors' for undirected graphs. The path is empty
+    if there is none.
+    """
+    reverse_neighbors = reverse_neighbors or neighbors
+    forward, backward = SearchResult(size), SearchResult(size)
+    forward.dist[start] = backward.dist[goal] = 0
+    frontiers = [[start], [goal]]
+    sides = [(forward, backward, neighbors), (backward, forward, reverse_neighbors)]
+
+    meeting = start if start == goal else UNREACHED
+    while meeting == UNREACHED and frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        result, other, step = sides[side]
+        best = None
+        frontier = []
+        for state in frontiers[side]:
+            distance = result.dist[state] + 1
+            for following in step(state):
+                if result.dist[following] != UNREACHED:
+                    continue
+                result.dist[following] = distance
+                result.prev[following] = state
+                frontier.append(following)
+                if other.dist[following] != UNREACHED:
+                    total = distance + other.dist[following]
+                    if best is None or total < best:
+                        best, meeting = total, following
+        frontiers[side] = frontier
+
+    if meeting == UNREACHED:
+        return []
+    forward.goal = backward.goal = meeting
+    return forward.path() + backward.path()[::-1][1:]
+
+
+# half-open interval '[start, stop)' of integers, like 'range(start, stop)'
+Interval = tuple[int, int]
+
+
+def interval_contains(outer: Interval, inner: Interval) -> bool:
+    return outer[0] <= inner[0] and inner[1] <= outer[1]
+
+
+def intervals_overlap(a: Interval, b: Interval) -> bool:
+    return a[0] < b[1] and b[0] < a[1]
+
+
+class IntervalSet:
+    """
+    A set of integers stored as sorted, disjoint half-open intervals.
+
+    The starts and stops are kept in two sorted lists, touching intervals
+    are merged. Adding, removing and lookups find the affected intervals by
+    bisection, building a set from many intervals at once sorts them once.
+    """
+
+    starts: list[int]
+    stops: list[int]
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        self.starts, self.stops = [], []
+        self._extend_sorted(sorted(intervals))
+
+    def _extend_sorted(self, intervals: Iterable[Interval]) -> None:
+        starts, stops = self.starts, self.stops
+        for start, stop in intervals:
+            if start >= stop:
+                continue
+            if stops and start <= stops[-1]:
+                if stop > stops[-1]:
+                    stops[-1] = stop
+                continue
+            starts.append(start)
+            stops.append(stop)
+
+    @classmethod
+    def _from_sorted(cls, intervals: Iterable[Interval]) -> IntervalSet:
+        interval_set = cls()
+        interval_set._extend_sorted(intervals)
+        return interval_set
+
+    def add(self, start: int, stop: int) -> None:
+        if start >= stop:
+            return
+        # every interval from i to j touches '[start, stop)'
+        i = bisect_left(self.stops, start)
+        j = bisect_right(self.starts, stop)
+        if i < j:
+            start = min(start, self.starts[i])
+            stop = max(stop, self.stops[j - 1])
+        self.starts[i:j] = [start]
+        self.stops[i:j] = [stop]
+
+    def remove(self, start: int, stop: int) -> None:
+        if start >= stop:
+            return
+        # every interval from i to j overlaps '[start, stop)'
+        i = bisect_right(self.stops, start)
+        j = bisect_left(self.starts, stop)
+        if i >= j:
+            return
+        starts, stops = [], []
+        if self.starts[i] < start:
+            starts.append(self.starts[i])
+            stops.append(start)
+        if self.stops[j - 1] > stop:
+            starts.append(stop)
+            stops.append(self.stops[j - 1])
+        self.starts[i:j] = starts
+        self.stops[i:j] = stops
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value < self.stops[i]
+
+    def contains_interval(self, start: int, stop: int) -> bool:
+        i = bisect_right(self.starts, start) - 1
+        return i >= 0 and stop <= self.stops[i]
+
+    def overlaps(self, start: int, stop: int) -> bool:
+        i = bisect_right(self.stops, start)
+        return i < len(self.starts) and self.starts[i] < stop
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self.starts, self.stops)
+
+    def __len__(self) -> int:
+        """Number of intervals, see 'coverage' for the number of integers."""
+        return len(self.starts)
+
+    def coverage(self) -> int:
+        """Number of integers in the set."""
+        return sum(self.stops) - sum(self.starts)
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return self._from_sorted(heapq.merge(self, other))
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        intervals = []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            stop = min(self.stops[i], other.stops[j])
+            if start < stop:
+                intervals.append((start, stop))
+            if self.stops[i] < other.stops[j]:
+                i += 1
+            else:
+                j += 1
+        return self._from_sorted(intervals)
+
+    def complement(self, start: int, stop: int) -> IntervalSet:
+        """The integers of '[start, stop)' which are not in the set."""
+        return self._from_sorted(self.gaps(start, stop))
+
+    def gaps(self, start: int, stop: int) -> Iterator[Interval]:
+        """Intervals of '[start, stop)' not covered by the set, in order."""
+        i = bisect_right(self.stops, start)
+        while start < stop and i < len(self.starts) and self.starts[i] < stop:
+            if start < self.starts[i]:
+                yield start, self.starts[i]
+            start = self.stops[i]
+            i += 1
+        if start < stop:
+            yield start, stop
+
+    __or__ = union
+    __and__ = intersection
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.stops == other.stops
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+
+def find_cycle(
+    state: State,
+    step: Callable[[State], State],
+    fingerprint: Callable[[State], Hashable],
+    max_steps: Optional[int] = None,
+) -> Optional[tuple[int, int]]:
+    """
+    First repetition of the fingerprint while stepping from 'state'.
+
+    Returns the step at which the cycle starts and its length, None if there
+    was none within 'max_steps' steps. 'step' is called at most 'max_steps'
+    times and may modify the state in place.
+    """
+    seen: dict[Hashable, int] = {}
+    index = 0
+    while True:
+        key = fingerprint(state)
+        if key in seen:
+            return seen[key], index - seen[key]
+        if index == max_steps:
+            return None
+        seen[key] = index
+        state = step(state)
+        index += 1
+
+
+def extrapolate(
+    state: State,
+    step: Callable[[State], State],
+    fingerprint: Callable[[State], Hashable],
+    counters: Callable[[State], tuple[int, ...]],
+    steps: int,
+) -> tuple[int, ...]:
+    """
+    Values of 'counters' after 'steps' steps from 'state'.
+
+    The steps are simulated until the fingerprint repeats. From then on every
+    cycle adds the same amount to each counter, so the full cycles are
+    multiplied out and the rest is looked up in the recorded values. The
+    fingerprint has to capture everything the following steps depend on.
+    """
+    seen: dict[Hashable, int] = {}
+    history: list[tuple[int, ...]] = []
+    for index in range(steps + 1):
+        key = fingerprint(state)
+        values = counters(state)
+        if key in seen:
+            start = seen[key]
+            cycles, rest = divmod(steps - start, index - start)
+            return tuple(
+                value + cycles * (end - begin)
+                for value, end, begin in zip(
+                    history[start + rest], values, history[start]
+                )
+            )
+        seen[key] = index
+        history.append(values)
+        if index < steps:
+            state = step(state)
+    return history[-1]
+
+
 def test_manhattan_dist() -> None:
     tests = [
         ((0, 0), [
@@ -13,3 +612,149 @@ def test_manhattan_dist() -> None:
     for start, cases in tests:
         for x, y, res in cases:
             assert manhattan_dist(start, (x, y)) == res
+
+
+def test_grid() -> None:
+    grid = Grid.from_str("#..\n.#\n")
+    assert (grid.width, grid.height) == (3, 2)
+    assert str(grid) == "#..\n.# "
+    assert grid[1, 1] == ord("#")
+    assert grid.get(2, 0) is None
+    assert grid.position(grid.index(1, 2)) == (1, 2)
+    assert grid.find(ord("#")) == 0
+    assert grid.find_all(ord("#")) == [0, 4]
+    assert grid.count(EMPTY) == 3
+    assert grid.column(1) == b".#"
+
+    # corners have 2 or 3 neighbors, no wrapping between rows
+    assert sorted(grid.neighbors(0)) == [1, 3]
+    assert sorted(grid.neighbors(2)) == [1, 5]
+    assert sorted(grid.neighbors(2, diagonal=True)) == [1, 4, 5]
+
+    copy = grid.copy()
+    copy[0, 0] = EMPTY
+    assert copy != grid and grid[0, 0] == ord("#")
+    try:
+        grid[0, 3] = EMPTY
+        assert False, "(0, 3) is outside of the grid"
+    except IndexError:
+        pass
+
+
+def test_grid_grow() -> None:
+    grid = Grid.from_str("ab\ncd\n")
+    grid.grow(top=1, right=1, left=2)
+    assert str(grid) == ".....\n..ab.\n..cd."
+    assert sorted(grid.neighbors(grid.index(1, 2))) == [
+        grid.index(0, 2),
+        grid.index(1, 1),
+        grid.index(1, 3),
+        grid.index(2, 2),
+    ]
+    grid.grow(bottom=1, fill=ord("#"))
+    assert grid.row(3) == b"#####"
+    assert grid.render({0: ord("@")}) == "@....\n..ab.\n..cd.\n#####"
+
+
+def test_search() -> None:
+    grid = Grid.from_str("S..#\n.#.#\n...E\n")
+
+    def neighbors(index: int) -> Iterator[int]:
+        for following in grid.neighbors(index):
+            if grid.cells[following] != ord("#"):
+                yield following
+
+    def weighted(index: int) -> Iterator[tuple[int, int]]:
+        # steps down are free
+        for following in neighbors(index):
+            yield following, 0 if following > index + 1 else 1
+
+    start, end = grid.find(ord("S")), grid.find(ord("E"))
+    result = bfs(grid.width * grid.height, [start], neighbors)
+    assert result.distance(end) == 5
+    path = result.path(end)
+    assert path[0] == start and path[-1] == end and len(path) == 6
+    assert result.distance(grid.index(0, 3)) is None
+    assert result.path(grid.index(0, 3)) == []
+
+    # multiple starts, the search stops at the first goal
+    result = bfs(grid.width * grid.height, [start, end], neighbors, lambda i: i == 6)
+    assert (result.goal, result.distance()) == (6, 2)
+
+    size = grid.width * grid.height
+    assert dijkstra(size, [start], weighted).distance(end) == 3
+    assert bfs_01(size, [start], weighted).distance(end) == 3
+
+    def unit(index: int) -> Iterator[tuple[int, int]]:
+        return ((following, 1) for following in neighbors(index))
+
+    heuristic = manhattan_heuristic(grid.width, end)
+    result = a_star(size, [start], unit, heuristic, lambda i: i == end)
+    assert result.distance() == 5
+
+    assert len(bidirectional_bfs(size, start, end, neighbors)) == 6
+    assert bidirectional_bfs(size, start, start, neighbors) == [start]
+    assert bidirectional_bfs(size, start, end, lambda index: []) == []
+
+
+def test_interval_set() -> None:
+    # integers 1..15, merged one interval at a time
+    intervals = IntervalSet()
+    steps = [(1, 3), (4, 6), (2, 4), (3, 5), (10, 16), (7, 9), (4, 11)]
+    outs = [
+        [(1, 3)],
+        [(1, 3), (4, 6)],
+        [(1, 6)],
+        [(1, 6)],
+        [(1, 6), (10, 16)],
+        [(1, 6), (7, 9), (10, 16)],
+        [(1, 16)],
+    ]
+    for (start, stop), out in zip(steps, outs):
+        intervals.add(start, stop)
+        assert list(intervals) == out
+    assert IntervalSet(steps) == intervals
+
+    intervals.remove(5, 8)
+    assert list(intervals) == [(1, 5), (8, 16)]
+    assert intervals.coverage() == 12 and len(intervals) == 2
+    assert 4 in intervals and 5 not in intervals and 0 not in intervals
+    assert intervals.contains_interval(8, 16)
+    assert not intervals.contains_interval(4, 9)
+    assert intervals.overlaps(4, 9) and not intervals.overlaps(5, 8)
+
+    assert list(intervals.gaps(0, 20)) == [(0, 1), (5, 8), (16, 20)]
+    assert list(intervals.complement(2, 10)) == [(5, 8)]
+    other = IntervalSet([(0, 2), (4, 9)])
+    assert list(intervals | other) == [(0, 16)]
+    assert list(intervals & other) == [(1, 2), (4, 5), (8, 9)]
+
+    assert interval_contains((1, 5), (2, 5))
+    assert intervals_overlap((1, 5), (4, 6)) and not intervals_overlap((1, 5), (5, 6))
+
+
+def test_extrapolate() -> None:
+    # 'value' walks 0, 1, 2, 3, 4, 2, 3, 4, ... and 'total' sums it up
+    def step(state: list[int]) -> list[int]:
+        value, total = state
+        value = 2 if value == 4 else value + 1
+        return [value, total + value]
+
+    def fingerprint(state: list[int]) -> int:
+        return state[0]
+
+    def counters(state: list[int]) -> tuple[int, ...]:
+        return (state[1],)
+
+    assert find_cycle([0, 0], step, fingerprint) == (2, 3)
+    assert find_cycle([0, 0], step, fingerprint, max_steps=3) is None
+
+    state = [0, 0]
+    totals = [0]
+    for _ in range(1000):
+        state = step(state)
+        totals.append(state[1])
+    for steps in (0, 3, 4, 5, 10, 999, 1000):
+        assert extrapolate([0, 0], step, fingerprint, counters, steps) == (
+            totals[steps],
+        )
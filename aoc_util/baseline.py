@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+from typing import Optional
+
+from bench import BenchResult, bench_all
+from registry import Solver
+
+BASELINE_FILE = ".aoc_baseline.json"
+# relative slowdown or growth of the peak RSS which counts as a regression
+THRESHOLD = 0.1
+MEMORY_THRESHOLD = 0.1
+# the slowdown also has to be significant at this level
+ALPHA = 0.05
+
+# "dayXX/partN" -> timings, peak RSS and input of the benchmark run
+Baseline = dict[str, dict]
+Comparison = dict
+
+
+def baseline_key(day: int, part: int) -> str:
+    return f"day{day:0>2}/part{part}"
+
+
+def load_baseline(directory: str) -> Baseline:
+    path = os.path.join(directory, BASELINE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_baseline(directory: str, results: list[BenchResult]) -> Baseline:
+    """
+    Stores the successful results in the baseline of the directory.
+
+    Entries of solvers which are not part of 'results' are kept.
+    """
+    baseline = load_baseline(directory)
+    for result in results:
+        if result.get("error"):
+            continue
+        baseline[baseline_key(result["day"], result["part"])] = dict(
+            input=result["input"],
+            input_hash=result["input_hash"],
+            timings=result["timings"],
+            median=result["median"],
+            peak_rss_kb=result["peak_rss_kb"],
+            created=time.strftime("%Y-%m-%dT%H:%M:%S"),
+        )
+
+    path = os.path.join(directory, BASELINE_FILE)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2)
+    return baseline
+
+
+def mann_whitney_p(baseline: list[float], samples: list[float]) -> float:
+    """
+    One-sided p-value of the Mann-Whitney U test that 'samples' are slower.
+
+    Uses the normal approximation with continuity correction. Small p-values
+    mean the slowdown is unlikely to be noise, with a single sample on either
+    side the p-value never drops below 0.5.
+    """
+    n_base, n_samples = len(baseline), len(samples)
+    u = sum(
+        1.0 if sample > base else 0.5 if sample == base else 0.0
+        for sample in samples
+        for base in baseline
+    )
+    mean = n_base * n_samples / 2
+    deviation = math.sqrt(n_base * n_samples * (n_base + n_samples + 1) / 12)
+    z = (u - mean - 0.5) / deviation
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_result(
+    result: BenchResult,
+    baseline: Baseline,
+    threshold: float = THRESHOLD,
+    memory_threshold: float = MEMORY_THRESHOLD,
+    alpha: float = ALPHA,
+) -> Comparison:
+    """
+    Compares a benchmark result with the baseline of its solver.
+
+    A solver regresses if its median is more than 'threshold' slower and the
+    timings are significantly slower than the baseline timings, or if its peak
+    RSS grew by more than 'memory_threshold'. Results for another input than
+    the baseline are not compared.
+    """
+    day, part = result["day"], result["part"]
+    comparison: Comparison = dict(day=day, part=part, regressions=[], error=None)
+    entry = baseline.get(baseline_key(day, part))
+    if result.get("error"):
+        comparison["error"] = result["error"]
+        return comparison
+    if entry is None:
+        comparison["error"] = "no baseline"
+        return comparison
+    if entry["input_hash"] != result["input_hash"]:
+        comparison["error"] = f"'{result['input']}' differs from the baseline input"
+        return comparison
+
+    change = result["median"] / entry["median"] - 1
+    change_rss = result["peak_rss_kb"] / entry["peak_rss_kb"] - 1
+    p_value = mann_whitney_p(entry["timings"], result["timings"])
+    comparison.update(
+        baseline_median=entry["median"],
+        median=result["median"],
+        change=change,
+        p_value=p_value,
+        change_rss=change_rss,
+    )
+
+    if change > threshold and p_value < alpha:
+        comparison["regressions"].append(
+            f"{change:.1%} slower than the baseline (p={p_value:.3f})"
+        )
+    if change_rss > memory_threshold:
+        comparison["regressions"].append(
+            f"peak RSS {change_rss:.1%} above the baseline"
+        )
+    return comparison
+
+
+def compare_all(
+    results: list[BenchResult], baseline: Baseline, **kwargs
+) -> list[Comparison]:
+    return [compare_result(result, baseline, **kwargs) for result in results]
+
+
+def comparisons_to_table(comparisons: list[Comparison]) -> str:
+    header = (
+        f"{'solver':<14}{'baseline':>10}{'median':>10}{'change':>9}"
+        f"{'p':>7}{'rss':>9}  status"
+    )
+    rows = []
+    for comparison in comparisons:
+        name = f"day{comparison['day']:0>2} part{comparison['part']}"
+        if comparison["error"]:
+            rows.append(f"{name:<14}  {comparison['error']}")
+            continue
+
+        status = "; ".join(comparison["regressions"]) or "ok"
+        rows.append(
+            f"{name:<14}"
+            f"{comparison['baseline_median'] * 1000:>8.2f}ms"
+            f"{comparison['median'] * 1000:>8.2f}ms"
+            f"{comparison['change']:>+9.1%}"
+            f"{comparison['p_value']:>7.3f}"
+            f"{comparison['change_rss']:>+9.1%}"
+            f"  {status}"
+        )
+    return "\n".join([header, "-" * len(header), *rows])
+
+
+def baseline_plugin(
+    directory: str,
+    solver: Solver,
+    threshold: float = THRESHOLD,
+    memory_threshold: float = MEMORY_THRESHOLD,
+) -> object:
+    """
+    pytest plugin adding a 'test_performance' item for the solver.
+
+    The item benchmarks the solver like 'aoc-bench' does, in a fresh process
+    and against the input of the baseline, and fails on a regression. It is
+    skipped if the solver has no baseline.
+    """
+    import pytest
+
+    day, part, _ = solver
+
+    def test_performance() -> None:
+        baseline = load_baseline(directory)
+        entry: Optional[dict] = baseline.get(baseline_key(day, part))
+        if entry is None:
+            pytest.skip(f"no baseline in '{BASELINE_FILE}'")
+
+        repeat = len(entry["timings"])
+        test = entry["input"] == "test.txt"
+        result = bench_all([solver], repeat=repeat, test=test)[0]
+        comparison = compare_result(result, baseline, threshold, memory_threshold)
+        if comparison["error"]:
+            pytest.skip(comparison["error"])
+        assert not comparison["regressions"], "; ".join(comparison["regressions"])
+
+    class PerformanceBaseline:
+        def pytest_collection_modifyitems(self, session, items) -> None:
+            if not items:
+                return
+            items.append(
+                pytest.Function.from_parent(
+                    items[0].parent, name="test_performance", callobj=test_performance
+                )
+            )
+
+    return PerformanceBaseline()
+
+
+def test_mann_whitney_p() -> None:
+    baseline = [1.0, 1.1, 0.9, 1.0, 1.05]
+    assert mann_whitney_p(baseline, [2.0, 2.1, 1.9, 2.2, 2.0]) < ALPHA
+    assert mann_whitney_p(baseline, [1.0, 0.95, 1.1, 1.02, 0.9]) > ALPHA
+    assert mann_whitney_p(baseline, [0.5, 0.4, 0.45, 0.5, 0.6]) > 0.99
+    assert mann_whitney_p([1.0], [2.0]) == 0.5
+
+
+def test_compare_result(tmp_path) -> None:
+    result = dict(
+        day=1,
+        part=2,
+        input="input.txt",
+        input_hash="abc",
+        timings=[1.0, 1.1, 0.9, 1.0, 1.05],
+        median=1.0,
+        peak_rss_kb=10000,
+        error=None,
+    )
+    baseline = save_baseline(str(tmp_path), [result])
+    assert load_baseline(str(tmp_path)) == baseline
+    assert compare_result(result, baseline)["regressions"] == []
+
+    slower = {**result, "timings": [1.5, 1.6, 1.4, 1.5, 1.55], "median": 1.5}
+    assert len(compare_result(slower, baseline)["regressions"]) == 1
+
+    # a single slow sample is noise
+    noisy = {**result, "timings": [0.9, 1.0, 1.0, 1.05, 9.0], "median": 1.2}
+    assert compare_result(noisy, baseline)["regressions"] == []
+
+    bigger = {**result, "peak_rss_kb": 20000}
+    assert len(compare_result(bigger, baseline)["regressions"]) == 1
+
+    other_input = {**slower, "input_hash": "def"}
+    assert compare_result(other_input, baseline)["error"] is not None
+    assert compare_result({**result, "day": 2}, baseline)["error"] == "no baseline"
+
+
+def test_baseline_plugin(tmp_path) -> None:
+    import subprocess
+    import sys
+
+    import pytest
+
+    from registry import discover_solvers
+
+    path_day = os.path.join(tmp_path, "day01")
+    os.mkdir(path_day)
+    with open(os.path.join(path_day, "part1.py"), "w", encoding="utf-8") as file:
+        file.write(
+            "def compute(input_str):\n"
+            "    return str(sum(map(int, input_str.split())))\n"
+            "\n"
+            "\n"
+            "def test():\n"
+            "    assert compute('1 2') == '3'\n"
+        )
+    with open(os.path.join(path_day, "test.txt"), "w", encoding="utf-8") as file:
+        file.write("1\n2\n3\n")
+
+    # saved by 'aoc-bench --test --save-baseline' moments before
+    here = os.path.dirname(os.path.abspath(__file__))
+    subprocess.run(
+        [sys.executable, "-c", "from cli import cli_bench; cli_bench()"]
+        + ["1", "--test", "--repeat", "3", "--save-baseline"],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": here},
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    assert baseline_key(1, 1) in load_baseline(str(tmp_path))
+
+    # 'aoc-run --test --perf' checks it from within pytest
+    solver = discover_solvers(str(tmp_path))[0]
+    plugin = baseline_plugin(str(tmp_path), solver)
+    args = ["-q", "-p", "no:cacheprovider", solver[2]]
+    assert pytest.main(args, plugins=[plugin]) == pytest.ExitCode.OK
@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib.util
+import json
+import math
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Optional
+
+from instrument import Recorder, recording
+from registry import Solver, get_registry
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# cumulative import time budget in milliseconds
+STARTUP_BUDGET = {
+    "cli": 15.0,
+    "aoc": 30.0,
+    "aoc_api": 15.0,
+    "aoc_tools": 5.0,
+    "instrument": 5.0,
+}
+
+BenchResult = dict
+
+# generate(scale, seed) of 'dayXX/generate.py'
+Generator = Callable[[int, int], str]
+GENERATOR_FILE = "generate.py"
+# larger scales are skipped once a scale takes longer (seconds)
+MAX_TIME = 10.0
+PLOT_WIDTH = 30
+
+
+def _get_base_dir(path_module: str) -> str:
+    return os.path.dirname(os.path.dirname(path_module))
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of 'values' for 0 < q <= 1."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+def peak_rss_kb() -> int:
+    """
+    Peak RSS of the process in kilobytes.
+
+    Linux keeps 'ru_maxrss' across fork and exec, a worker would report the
+    peak RSS of its parent. 'VmHWM' only covers the memory of the process.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def bench_solver(solver: Solver, repeat: int = 5, test: bool = False) -> BenchResult:
+    """
+    Runs 'compute' of a single solver 'repeat' times against its cached input.
+
+    If the solver exposes a 'parse' function it is timed separately to split the
+    runtime into parse and solve time. The spans and counters the solver records
+    with 'instrument' are averaged over the runs. All output of the solver is
+    discarded.
+    """
+    day, part, path_module = solver
+    file_name = "test.txt" if test else "input.txt"
+    path_input = os.path.join(os.path.dirname(path_module), file_name)
+    result: BenchResult = dict(day=day, part=part, input=file_name, repeat=repeat)
+
+    if not os.path.exists(path_input):
+        result["error"] = f"'{file_name}' does not exist"
+        return result
+
+    with open(path_input, encoding="utf-8") as file:
+        input_str = file.read()
+
+    timings: list[float] = []
+    timings_parse: list[float] = []
+    recorder = Recorder()
+    try:
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                entry = get_registry(_get_base_dir(path_module)).get(day, part)
+                parse = entry.parse
+                for _ in range(repeat):
+                    with recording(recorder):
+                        start = time.perf_counter()
+                        answer = entry.compute(input_str)
+                        timings.append(time.perf_counter() - start)
+
+                    if parse is not None:
+                        start = time.perf_counter()
+                        parse(input_str)
+                        timings_parse.append(time.perf_counter() - start)
+    except Exception as e:  # pylint: disable=broad-except
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    median = statistics.median(timings)
+    median_parse = statistics.median(timings_parse) if timings_parse else None
+    result.update(
+        answer=str(answer),
+        input_hash=hashlib.sha256(input_str.encode()).hexdigest(),
+        timings=timings,
+        min=min(timings),
+        median=median,
+        p95=percentile(timings, 0.95),
+        parse_median=median_parse,
+        solve_median=max(median - median_parse, 0.0)
+        if median_parse is not None
+        else None,
+        peak_rss_kb=peak_rss_kb(),
+        **recorder.to_dict(runs=repeat),
+        error=None,
+    )
+    return result
+
+
+def load_generator(path_day: str) -> Optional[Generator]:
+    """Returns 'generate' of 'dayXX/generate.py', None if the day has none."""
+    path = os.path.join(path_day, GENERATOR_FILE)
+    if not os.path.exists(path):
+        return None
+
+    # a unique name, 'generate' of every day would clash otherwise
+    name = f"{os.path.basename(path_day)}_generate"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.generate
+
+
+def growth_order(size_a: int, time_a: float, size_b: int, time_b: float) -> float:
+    """Slope of the runtime over the input size on a log-log scale."""
+    return math.log(time_b / time_a) / math.log(size_b / size_a)
+
+
+def bench_scaling(
+    solver: Solver,
+    scales: list[int],
+    repeat: int = 5,
+    seed: int = 0,
+    max_time: float = MAX_TIME,
+) -> list[BenchResult]:
+    """
+    Runs 'compute' of a single solver against generated inputs of every scale.
+
+    The inputs come from 'generate' of 'dayXX/generate.py'. 'order' is the slope
+    of the runtime over the input size between the scale and the previous one,
+    about 1 for linear and 2 for quadratic solvers. Once the median runtime of a
+    scale exceeds 'max_time' seconds the larger scales are skipped.
+    """
+    day, part, path_module = solver
+    results: list[BenchResult] = []
+    generate = load_generator(os.path.dirname(path_module))
+    if generate is None:
+        error = f"'{GENERATOR_FILE}' does not exist"
+        return [dict(day=day, part=part, scale=None, error=error)]
+
+    previous: Optional[BenchResult] = None
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            for scale in sorted(set(scales)):
+                result: BenchResult = dict(day=day, part=part, scale=scale)
+                results.append(result)
+                if previous is not None and previous["median"] > max_time:
+                    result["error"] = f"skipped, scale {previous['scale']} too slow"
+                    continue
+
+                try:
+                    input_str = generate(scale, seed)
+                    entry = get_registry(_get_base_dir(path_module)).get(day, part)
+                    timings: list[float] = []
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        answer = entry.compute(input_str)
+                        timings.append(time.perf_counter() - start)
+                        if timings[-1] > max_time:
+                            break
+                except Exception as e:  # pylint: disable=broad-except
+                    result["error"] = f"{type(e).__name__}: {e}"
+                    break
+
+                size, median = len(input_str), statistics.median(timings)
+                order = None
+                if previous is not None:
+                    order = growth_order(
+                        previous["size"], previous["median"], size, median
+                    )
+                result.update(
+                    size=size,
+                    repeat=len(timings),
+                    answer=str(answer),
+                    min=min(timings),
+                    median=median,
+                    order=order,
+                    error=None,
+                )
+                previous = result
+    return results
+
+
+def _run_in_workers(function: Callable, solvers: list[Solver], jobs: int, *args):
+    """
+    Runs 'function' for every solver in a fresh worker process.
+
+    Each process only runs a single solver to keep the peak RSS of the solvers
+    apart and to avoid clashes between the 'partN' modules of different days.
+    The processes are spawned, a forked process would start with the memory of
+    the caller, which is much larger inside pytest than inside 'aoc-bench'.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=jobs, max_tasks_per_child=1, mp_context=context
+    ) as executor:
+        futures = [executor.submit(function, solver, *args) for solver in solvers]
+        return [future.result() for future in futures]
+
+
+def bench_all(
+    solvers: list[Solver], repeat: int = 5, test: bool = False, jobs: int = 1
+) -> list[BenchResult]:
+    """Benchmarks every solver in a fresh worker process."""
+    return _run_in_workers(bench_solver, solvers, jobs, repeat, test)
+
+
+def bench_scaling_all(
+    solvers: list[Solver],
+    scales: list[int],
+    repeat: int = 5,
+    seed: int = 0,
+    jobs: int = 1,
+    max_time: float = MAX_TIME,
+) -> list[BenchResult]:
+    """Runs 'bench_scaling' for every solver in a fresh worker process."""
+    results = _run_in_workers(
+        bench_scaling, solvers, jobs, scales, repeat, seed, max_time
+    )
+    return [result for solver_results in results for result in solver_results]
+
+
+def _format_time(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value < 1:
+        return f"{value * 1000:.2f}ms"
+    return f"{value:.2f}s"
+
+
+def _format_row(result: BenchResult) -> str:
+    name = f"day{result['day']:0>2} part{result['part']}"
+    if result.get("error"):
+        return f"{name:<14} {result['error']}"
+
+    return (
+        f"{name:<14}"
+        f"{_format_time(result['min']):>10}"
+        f"{_format_time(result['median']):>10}"
+        f"{_format_time(result['p95']):>10}"
+        f"{_format_time(result['parse_median']):>10}"
+        f"{_format_time(result['solve_median']):>10}"
+        f"{result['peak_rss_kb'] / 1024:>9.1f}M"
+    )
+
+
+def results_to_table(results: list[BenchResult]) -> str:
+    header = (
+        f"{'solver':<14}{'min':>10}{'median':>10}{'p95':>10}"
+        f"{'parse':>10}{'solve':>10}{'rss':>10}"
+    )
+    return "\n".join([header, "-" * len(header), *map(_format_row, results)])
+
+
+def _format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size}B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f}K"
+    return f"{size / 1024 / 1024:.1f}M"
+
+
+def scaling_to_table(results: list[BenchResult]) -> str:
+    """Table of the runtime per scale, the bars plot the runtime per solver."""
+    slowest: dict[tuple[int, int], float] = {}
+    for result in results:
+        if not result.get("error"):
+            key = result["day"], result["part"]
+            slowest[key] = max(slowest.get(key, 0.0), result["median"])
+
+    header = f"{'solver':<14}{'scale':>7}{'size':>9}{'median':>10}{'order':>7}  plot"
+    rows = []
+    for result in results:
+        name = f"day{result['day']:0>2} part{result['part']}"
+        scale = result["scale"] if result["scale"] is not None else "-"
+        if result.get("error"):
+            rows.append(f"{name:<14}{scale:>7}  {result['error']}")
+            continue
+
+        order = result["order"]
+        slowest_median = slowest[(result["day"], result["part"])]
+        bar = round(PLOT_WIDTH * result["median"] / slowest_median)
+        rows.append(
+            f"{name:<14}{scale:>7}"
+            f"{_format_size(result['size']):>9}"
+            f"{_format_time(result['median']):>10}"
+            f"{f'{order:.2f}' if order is not None else '-':>7}"
+            f"  {'#' * bar}"
+        )
+    return "\n".join([header, "-" * len(header), *rows])
+
+
+def results_to_json(results: list[BenchResult]) -> str:
+    return json.dumps(dict(results=results), indent=2)
+
+
+def parse_importtime(output: str, module: str) -> float:
+    """Cumulative import time of 'module' in ms from the output of '-X importtime'."""
+    for line in output.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module and name.startswith(" " + module):
+            return int(cumulative) / 1000
+    raise ValueError(f"'{module}' not found in importtime output")
+
+
+def bench_startup(repeat: int = 5) -> list[BenchResult]:
+    """
+    Measures the import time of the modules in 'STARTUP_BUDGET'.
+
+    Every module is imported 'repeat' times in a fresh interpreter with
+    '-X importtime', the fastest run is compared against the budget.
+    """
+    results: list[BenchResult] = []
+    for module, budget in STARTUP_BUDGET.items():
+        timings: list[float] = []
+        for _ in range(repeat):
+            res = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                capture_output=True,
+                check=True,
+                cwd=HERE,
+                text=True,
+            )
+            timings.append(parse_importtime(res.stderr, module))
+        results.append(dict(module=module, time_ms=min(timings), budget_ms=budget))
+    return results
+
+
+def startup_to_table(results: list[BenchResult]) -> str:
+    header = f"{'module':<14}{'import':>10}{'budget':>10}"
+    rows = [
+        f"{result['module']:<14}"
+        f"{result['time_ms']:>8.2f}ms"
+        f"{result['budget_ms']:>8.2f}ms"
+        + (" over budget" if result["time_ms"] > result["budget_ms"] else "")
+        for result in results
+    ]
+    return "\n".join([header, "-" * len(header), *rows])
+
+
+def test_parse_importtime() -> None:
+    output = """\
+import time: self [us] | cumulative | imported package
+import time:       339 |        339 |   __future__
+import time:       408 |       1832 |     aoc_api
+import time:      3163 |       7369 |   bench
+import time:      2364 |      12341 | aoc
+"""
+    assert parse_importtime(output, "aoc") == 12.341
+    try:
+        parse_importtime(output, "bench")
+        assert False, "'bench' is not imported at the top level"
+    except ValueError:
+        pass
+
+
+def test_percentile() -> None:
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(values, 0.5) == 3.0
+    assert percentile(values, 0.95) == 5.0
+    assert percentile([1.0], 0.95) == 1.0
+
+
+def test_growth_order() -> None:
+    assert growth_order(100, 1.0, 1000, 10.0) == 1.0
+    assert round(growth_order(100, 1.0, 1000, 100.0), 6) == 2.0
+    assert round(growth_order(100, 1.0, 1000, 1.0), 6) == 0.0
+
+
+def test_load_generator() -> None:
+    # every day has a generator, the checks of its format are in its own test
+    base_dir = os.path.dirname(HERE)
+    for day in range(1, 26):
+        generate = load_generator(os.path.join(base_dir, f"day{day:0>2}"))
+        assert generate is not None, f"day {day} has no '{GENERATOR_FILE}'"
+        input_s = generate(2, 1)
+        assert input_s == generate(2, 1), f"day {day} isn't deterministic"
+        assert input_s != generate(2, 2), f"day {day} ignores the seed"
+        assert len(generate(4, 1)) > len(input_s), f"day {day} ignores the scale"
+    assert load_generator(os.path.join(base_dir, "day00")) is None
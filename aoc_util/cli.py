@@ -1,7 +1,23 @@
 import argparse
 import os
 
-from aoc import get_input, get_year, get_year_day, init_day, init_day_auto, run_day
+# The cli functions import 'aoc' and 'bench' only after parsing the arguments,
+# '--help' and argument errors don't pay for importing them.
+
+
+def _get_base_dir() -> str:
+    cwd = os.getcwd()
+    if os.path.basename(cwd).startswith("day"):
+        return os.path.dirname(cwd)
+    return cwd
+
+
+def _day(value: str) -> int:
+    """Day argument, 'choices' would reject an empty list of days for nargs='*'."""
+    day = int(value) if value.isdigit() else 0
+    if not 1 <= day <= 25:
+        raise argparse.ArgumentTypeError(f"invalid day {value!r} (choose from 1 to 25)")
+    return day
 
 
 def cli_init_day() -> None:
@@ -9,10 +25,24 @@ def cli_init_day() -> None:
     parser.add_argument("day", type=int, nargs="?")
     parser.add_argument("--force", action=argparse.BooleanOptionalAction)
     parser.add_argument("--download", action=argparse.BooleanOptionalAction)
+    parser.add_argument("--prefetch", action=argparse.BooleanOptionalAction)
     args = parser.parse_args()
 
+    from aoc import (
+        get_input,
+        get_year,
+        get_year_day,
+        init_day,
+        init_day_auto,
+        prefetch_inputs,
+    )
+
     day = args.day
     cwd = os.getcwd()
+    if args.prefetch:
+        prefetch_inputs(cwd, get_year(cwd))
+        return
+
     if args.download:
         if day is None:
             year, day = get_year_day(cwd)
@@ -37,8 +67,102 @@ def cli_run_day() -> None:
     parser.add_argument("--test", action=argparse.BooleanOptionalAction)
     parser.add_argument("--skip-pytest", action=argparse.BooleanOptionalAction)
     parser.add_argument("--only-pytest", action=argparse.BooleanOptionalAction)
+    parser.add_argument("--all", action=argparse.BooleanOptionalAction)
+    parser.add_argument("--jobs", type=int)
+    parser.add_argument("--cache", action=argparse.BooleanOptionalAction, default=True)
+    group_profile = parser.add_mutually_exclusive_group()
+    group_profile.add_argument(
+        "--profile",
+        action="store_const",
+        const="profile",
+        dest="profile",
+        help="run compute with cProfile, writes partN.pstats",
+    )
+    group_profile.add_argument(
+        "--trace-memory",
+        action="store_const",
+        const="trace-memory",
+        dest="profile",
+        help="run compute with tracemalloc",
+    )
+    group_profile.add_argument(
+        "--sample",
+        action="store_const",
+        const="sample",
+        dest="profile",
+        help="run compute with a sampling profiler",
+    )
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument(
+        "--stream",
+        action=argparse.BooleanOptionalAction,
+        help="feed the memory mapped input to compute_lines/compute_buffer",
+    )
+    parser.add_argument(
+        "--perf",
+        action=argparse.BooleanOptionalAction,
+        help="also test the performance against .aoc_baseline.json",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="run compute in a child process, stop it after this many seconds",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        help="run compute in a child process, limit its memory to this many MiB",
+    )
+    parser.add_argument(
+        "--spans",
+        action=argparse.BooleanOptionalAction,
+        help="print the spans and counters compute records with 'instrument'",
+    )
+    parser.add_argument(
+        "--watch",
+        action=argparse.BooleanOptionalAction,
+        help="re-run the tests and the solver whenever a file of the day changes",
+    )
 
     args = parser.parse_args()
+    if args.stream and (args.profile or args.perf):
+        parser.error("--stream can't be combined with profiling or --perf")
+    if args.watch and (args.all or args.submit or args.stream or args.profile):
+        parser.error(
+            "--watch can't be combined with --all, --submit, --stream or profiling"
+        )
+    limits = args.timeout is not None or args.memory_limit is not None
+    if limits and (args.watch or args.stream or args.profile):
+        parser.error(
+            "--timeout and --memory-limit can't be combined with --watch, --stream "
+            "or profiling"
+        )
+    if args.spans and (args.watch or args.stream or limits):
+        parser.error(
+            "--spans can't be combined with --watch, --stream, --timeout or "
+            "--memory-limit"
+        )
+    single = args.spans or args.profile or args.stream or args.perf or args.submit
+    if args.all and (single or args.skip_pytest or args.only_pytest):
+        parser.error(
+            "--all can't be combined with --spans, profiling, --stream, --perf, "
+            "--submit, --skip-pytest or --only-pytest"
+        )
+
+    from aoc import get_year, get_year_day, run_all, run_day
+
+    if args.all:
+        cwd = _get_base_dir()
+        run_all(
+            cwd,
+            args.year or get_year(cwd),
+            test=args.test,
+            jobs=args.jobs,
+            use_cache=args.cache,
+            timeout=args.timeout,
+            memory_limit=args.memory_limit,
+        )
+        return
 
     year_a = args.year
     day_a = args.day
@@ -61,6 +185,19 @@ def cli_run_day() -> None:
         path = cwd
         path = os.path.join(cwd, "..")
 
+    if args.watch:
+        from watch import watch_day
+
+        watch_day(
+            path,
+            year,
+            day,
+            args.part,
+            test=args.test,
+            skip_pytest=args.skip_pytest,
+        )
+        return
+
     run_day(
         path,
         year,
@@ -70,7 +207,141 @@ def cli_run_day() -> None:
         test=args.test,
         skip_pytest=args.skip_pytest,
         only_pytest=args.only_pytest,
+        use_cache=args.cache,
+        profile=args.profile,
+        top=args.top,
+        stream=args.stream,
+        perf=args.perf,
+        timeout=args.timeout,
+        memory_limit=args.memory_limit,
+        spans=args.spans,
+    )
+
+
+def cli_bench() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("days", type=_day, nargs="*")
+    parser.add_argument("--part", type=int, choices=range(1, 3))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--test", action=argparse.BooleanOptionalAction)
+    parser.add_argument(
+        "--json", type=str, help="write results as json ('-' for stdout)"
+    )
+    parser.add_argument(
+        "--startup",
+        action=argparse.BooleanOptionalAction,
+        help="measure the import time of the cli and the aoc library",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        nargs="+",
+        help="run against inputs of dayXX/generate.py of these scales",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    group_baseline = parser.add_mutually_exclusive_group()
+    group_baseline.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store the results in .aoc_baseline.json",
+    )
+    group_baseline.add_argument(
+        "--compare",
+        action="store_true",
+        help="compare the results with .aoc_baseline.json, fail on regressions",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="slowdown in percent which counts as a regression",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=10.0,
+        help="peak RSS growth in percent which counts as a regression",
+    )
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=10.0,
+        help="skip larger scales once a scale takes longer (seconds)",
+    )
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.scale and (args.save_baseline or args.compare):
+        parser.error("--scale can't be combined with --save-baseline or --compare")
+
+    from bench import (
+        bench_all,
+        bench_scaling_all,
+        bench_startup,
+        results_to_json,
+        results_to_table,
+        scaling_to_table,
+        startup_to_table,
     )
+    from registry import discover_solvers
+
+    if args.startup:
+        startup = bench_startup(repeat=args.repeat)
+        print(startup_to_table(startup))
+        if any(result["time_ms"] > result["budget_ms"] for result in startup):
+            raise SystemExit(1)
+        return
+
+    parts = [args.part] if args.part else None
+    base_dir = _get_base_dir()
+    solvers = discover_solvers(base_dir, args.days, parts)
+    if not solvers:
+        print("No solvers found, are you in the right directory?")
+        return
+
+    if args.scale:
+        results = bench_scaling_all(
+            solvers,
+            args.scale,
+            repeat=args.repeat,
+            seed=args.seed,
+            jobs=args.jobs,
+            max_time=args.max_time,
+        )
+        to_table = scaling_to_table
+    else:
+        results = bench_all(
+            solvers, repeat=args.repeat, test=args.test, jobs=args.jobs
+        )
+        to_table = results_to_table
+
+    if args.save_baseline:
+        from baseline import save_baseline
+
+        save_baseline(base_dir, results)
+    elif args.compare:
+        from baseline import compare_all, comparisons_to_table, load_baseline
+
+        comparisons = compare_all(
+            results,
+            load_baseline(base_dir),
+            threshold=args.threshold / 100,
+            memory_threshold=args.memory_threshold / 100,
+        )
+        print(comparisons_to_table(comparisons))
+        if any(comparison["regressions"] for comparison in comparisons):
+            raise SystemExit(1)
+        return
+
+    if args.json == "-":
+        print(results_to_json(results))
+        return
+
+    print(to_table(results))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            file.write(results_to_json(results))
 
 
 def main():
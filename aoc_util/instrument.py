@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import time
+from typing import Callable, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+# the active recorder, None while instrumentation is disabled
+_recorder: Optional[Recorder] = None
+
+
+class Recorder:
+    """Total time and calls of named spans and the totals of named counters."""
+
+    spans: dict[str, list[float]]
+    counters: dict[str, int]
+
+    def __init__(self) -> None:
+        self.spans = {}
+        self.counters = {}
+
+    def add_span(self, name: str, elapsed: float) -> None:
+        totals = self.spans.setdefault(name, [0.0, 0])
+        totals[0] += elapsed
+        totals[1] += 1
+
+    def add_count(self, name: str, n: int) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self, runs: int = 1) -> dict:
+        """Spans and counters averaged over 'runs', e.g. for the bench json."""
+        return dict(
+            spans={
+                name: dict(seconds=seconds / runs, calls=calls / runs)
+                for name, (seconds, calls) in self.spans.items()
+            },
+            counters={name: value / runs for name, value in self.counters.items()},
+        )
+
+    def report(self) -> str:
+        if not self.spans and not self.counters:
+            return "No spans or counters recorded."
+        lines = [f"{'span':<30}{'time':>12}{'calls':>10}"]
+        for name, (seconds, calls) in self.spans.items():
+            lines.append(f"{name:<30}{seconds * 1000:>10.2f}ms{calls:>10}")
+        for name, value in self.counters.items():
+            lines.append(f"{name:<30}{value:>12}")
+        return "\n".join(lines)
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> _Span:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if _recorder is not None:
+            _recorder.add_span(self.name, time.perf_counter() - self.start)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enabled() -> bool:
+    """True while recording, guards counters which are expensive to compute."""
+    return _recorder is not None
+
+
+def span(name: str) -> _Span | _NullSpan:
+    """Context manager timing a phase of a solver, a shared no-op if disabled."""
+    if _recorder is None:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def count(name: str, n: int = 1) -> None:
+    """
+    Adds 'n' to a counter.
+
+    Count in a local variable inside hot loops and add the total once, the
+    call is cheap but not free.
+    """
+    if _recorder is not None:
+        _recorder.add_count(name, n)
+
+
+def spanned(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator recording every call of the function as a span."""
+
+    def decorator(function: F) -> F:
+        span_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return function(*args, **kwargs)
+            with _Span(span_name):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextlib.contextmanager
+def recording(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    """Enables instrumentation, spans and counters go to 'recorder' or a new one."""
+    global _recorder  # pylint: disable=global-statement
+    previous = _recorder
+    _recorder = recorder if recorder is not None else Recorder()
+    try:
+        yield _recorder
+    finally:
+        _recorder = previous
+
+
+def instrumented(compute: Callable[[str], str]) -> Callable[[str], str]:
+    """Wraps 'compute' to record its spans and counters and print them."""
+
+    def wrapper(input_str: str) -> str:
+        with recording() as recorder:
+            answer = compute(input_str)
+        print(recorder.report())
+        return answer
+
+    return wrapper
+
+
+def test_instrument() -> None:
+    @spanned()
+    def parse(input_str: str) -> list[int]:
+        return [int(line) for line in input_str.splitlines()]
+
+    def compute(input_str: str) -> str:
+        numbers = parse(input_str)
+        with span("solve"):
+            count("numbers", len(numbers))
+            count("numbers")
+            return str(sum(numbers))
+
+    # disabled, nothing is recorded and no recorder is created
+    assert compute("1\n2\n") == "3"
+    assert span("solve") is span("parse")
+    assert not enabled()
+
+    recorder = Recorder()
+    for _ in range(2):
+        with recording(recorder):
+            assert enabled()
+            assert compute("1\n2\n") == "3"
+    assert not enabled()
+    assert list(recorder.spans) == ["parse", "solve"]
+    assert recorder.spans["solve"][1] == 2
+    assert recorder.counters == {"numbers": 6}
+
+    summary = recorder.to_dict(runs=2)
+    assert summary["spans"]["parse"]["calls"] == 1
+    assert summary["counters"] == {"numbers": 3}
+    assert "solve" in recorder.report()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import signal
+import sys
+import tracemalloc
+from collections import Counter
+from types import FrameType
+from typing import Callable, Optional
+
+PROFILE = "profile"
+TRACE_MEMORY = "trace-memory"
+SAMPLE = "sample"
+MODES = (PROFILE, TRACE_MEMORY, SAMPLE)
+
+# seconds of cpu time between two samples
+SAMPLE_INTERVAL = 0.005
+
+
+def run_profiled(
+    compute: Callable[[str], str], input_str: str, path_stats: str, top: int = 20
+) -> str:
+    """
+    Runs 'compute' with cProfile.
+
+    The stats are dumped to 'path_stats' (open with 'python -m pstats' or
+    snakeviz), the 'top' functions by cumulative time are printed.
+    """
+    with cProfile.Profile() as profile:
+        answer = compute(input_str)
+
+    profile.dump_stats(path_stats)
+    print(f"Profile written to '{path_stats}'.")
+    stats = pstats.Stats(profile, stream=sys.stdout)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return answer
+
+
+def run_trace_memory(
+    compute: Callable[[str], str], input_str: str, top: int = 10
+) -> str:
+    """Runs 'compute' with tracemalloc, prints the peak and the top allocation sites."""
+    tracemalloc.start()
+    try:
+        answer = compute(input_str)
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+    print(f"Peak traced memory: {peak / 1024 / 1024:.2f} MiB")
+    print(f"Top {top} allocation sites still allocated after 'compute':")
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        location = f"{os.path.basename(frame.filename)}:{frame.lineno}"
+        print(f"{location:<30} {stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks")
+    return answer
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_firstlineno}({code.co_name})"
+
+
+def run_sampled(
+    compute: Callable[[str], str],
+    input_str: str,
+    top: int = 20,
+    interval: float = SAMPLE_INTERVAL,
+) -> str:
+    """
+    Runs 'compute' with a statistical profiler.
+
+    Every 'interval' seconds of cpu time the current stack is sampled. The
+    overhead is much lower than with cProfile, which helps for solvers with
+    many small function calls. Only available on unix.
+    """
+    self_samples: Counter[str] = Counter()
+    total_samples: Counter[str] = Counter()
+
+    def on_sample(_signum: int, frame: Optional[FrameType]) -> None:
+        if frame is None:
+            return
+        self_samples[_frame_name(frame)] += 1
+        seen = set()
+        while frame is not None:
+            name = _frame_name(frame)
+            if name not in seen:
+                total_samples[name] += 1
+                seen.add(name)
+            frame = frame.f_back
+
+    previous = signal.signal(signal.SIGPROF, on_sample)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        answer = compute(input_str)
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, previous)
+
+    count = sum(self_samples.values())
+    print(f"{count} samples, {interval * 1000:.1f}ms interval")
+    if count == 0:
+        return answer
+
+    print(f"{'self':>7} {'total':>7}  function")
+    for name, samples in self_samples.most_common(top):
+        print(
+            f"{samples / count:>7.1%} {total_samples[name] / count:>7.1%}  {name}"
+        )
+    return answer
+
+
+def profiled(
+    compute: Callable[[str], str], mode: str, path_stats: str, top: int = 20
+) -> Callable[[str], str]:
+    """Wraps 'compute' to run it with the profiler of the given mode."""
+    if mode not in MODES:
+        raise ValueError(f"Unknown profiling mode {mode}")
+
+    def wrapper(input_str: str) -> str:
+        if mode == PROFILE:
+            return run_profiled(compute, input_str, path_stats, top)
+        if mode == TRACE_MEMORY:
+            return run_trace_memory(compute, input_str, top)
+        return run_sampled(compute, input_str, top)
+
+    return wrapper
+
+
+def test_run_sampled(capsys) -> None:
+    def busy(input_str: str) -> str:
+        return str(sum(i * i for i in range(int(input_str))))
+
+    assert run_sampled(busy, "2000000", top=5) == str(
+        sum(i * i for i in range(2000000))
+    )
+    assert "samples" in capsys.readouterr().out
+
+
+def test_run_trace_memory(capsys) -> None:
+    def allocate(input_str: str) -> str:
+        return str(len([[0] * 1000 for _ in range(int(input_str))]))
+
+    assert run_trace_memory(allocate, "100") == "100"
+    assert "Peak traced memory" in capsys.readouterr().out
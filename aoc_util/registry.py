@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import importlib
+import os
+import re
+import sys
+from types import ModuleType
+from typing import Callable, Optional
+
+RE_DAY = re.compile(r"^day([0-9]{2})$")
+RE_PART = re.compile(r"^part([0-9])\.py$")
+
+# (day, part, path to partN.py)
+Solver = tuple[int, int, str]
+
+_registries: dict[str, SolverRegistry] = {}
+
+
+def discover_solvers(
+    directory: str, days: Optional[list[int]] = None, parts: Optional[list[int]] = None
+) -> list[Solver]:
+    """
+    Finds every 'dayXX/partN.py' in the given directory.
+
+        Parameters:
+            directory (str): Base directory of the year.
+            days (list[int] | None): Only include these days.
+            parts (list[int] | None): Only include these parts.
+
+        Returns:
+            list[Solver]: (day, part, path) sorted by day and part, 'day00' is skipped.
+    """
+    solvers: list[Solver] = []
+    for folder in os.listdir(directory):
+        path_day = os.path.join(directory, folder)
+        found_day = RE_DAY.search(folder)
+        if not found_day or not os.path.isdir(path_day):
+            continue
+
+        day = int(found_day.group(1))
+        if day == 0 or (days and day not in days):
+            continue
+
+        for file in os.listdir(path_day):
+            found_part = RE_PART.search(file)
+            if not found_part:
+                continue
+            part = int(found_part.group(1))
+            if parts and part not in parts:
+                continue
+            path_module = os.path.abspath(os.path.join(path_day, file))
+            solvers.append((day, part, path_module))
+
+    solvers.sort()
+    return solvers
+
+
+class SolverEntry:
+    """
+    A single 'dayXX/partN.py' and its module, once it has been imported.
+
+    'parse' and 'solve' are the phases of 'compute' if the solver provides them,
+    'solve' takes the result of 'parse'.
+    """
+
+    day: int
+    part: int
+    path: str
+    module: Optional[ModuleType] = None
+
+    def __init__(self, day: int, part: int, path: str) -> None:
+        self.day = day
+        self.part = part
+        self.path = path
+
+    def __repr__(self) -> str:
+        day, part, loaded = self.day, self.part, self.module is not None
+        return f"SolverEntry({day=}, {part=}, {loaded=})"
+
+    @property
+    def path_day(self) -> str:
+        return os.path.dirname(self.path)
+
+    @property
+    def is_package(self) -> bool:
+        return os.path.exists(os.path.join(self.path_day, "__init__.py"))
+
+    @property
+    def module_name(self) -> str:
+        """Name of the module, the same name pytest imports it as."""
+        if self.is_package:
+            return f"{os.path.basename(self.path_day)}.part{self.part}"
+        return f"part{self.part}"
+
+    def _get(self, name: str) -> Optional[Callable]:
+        assert self.module is not None, f"{self!r} is not loaded"
+        return getattr(self.module, name, None)
+
+    @property
+    def compute(self) -> Callable[[str], str]:
+        return self._get("compute")
+
+    @property
+    def parse(self) -> Optional[Callable]:
+        return self._get("parse")
+
+    @property
+    def solve(self) -> Optional[Callable]:
+        return self._get("solve")
+
+    @property
+    def compute_lines(self) -> Optional[Callable]:
+        """Streaming variant of 'compute' taking an iterator over the input lines."""
+        return self._get("compute_lines")
+
+    @property
+    def compute_buffer(self) -> Optional[Callable]:
+        """Streaming variant of 'compute' taking the memory mapped input."""
+        return self._get("compute_buffer")
+
+    @property
+    def title(self) -> str:
+        """First line of the module docstring, e.g. 'Day 1: Calorie Counting'."""
+        doc = self.module.__doc__ if self.module is not None else None
+        if not doc or not doc.strip():
+            return f"Day {self.day} - Part {self.part}"
+        return doc.strip().splitlines()[0]
+
+
+class SolverRegistry:
+    """
+    Discovers the solvers of a year directory and imports each of them once.
+
+    Modules are imported under the same names pytest uses ('day16.part1' for
+    days with an '__init__.py', 'part1' otherwise), so a module collected by
+    pytest can be adopted by the registry and vice versa.
+    """
+
+    directory: str
+    _entries: dict[tuple[int, int], SolverEntry]
+
+    def __init__(self, directory: str) -> None:
+        self.directory = os.path.abspath(directory)
+        self._entries = {
+            (day, part): SolverEntry(day, part, path)
+            for day, part, path in discover_solvers(self.directory)
+        }
+
+    def entries(
+        self, days: Optional[list[int]] = None, parts: Optional[list[int]] = None
+    ) -> list[SolverEntry]:
+        return [
+            entry
+            for (day, part), entry in sorted(self._entries.items())
+            if (not days or day in days) and (not parts or part in parts)
+        ]
+
+    def entry(self, day: int, part: int) -> SolverEntry:
+        if (day, part) not in self._entries:
+            raise KeyError(f"No solver for day {day}, part {part}")
+        return self._entries[(day, part)]
+
+    def get(self, day: int, part: int) -> SolverEntry:
+        """Returns the entry of the solver, importing its module on first use."""
+        entry = self.entry(day, part)
+        if entry.module is None:
+            entry.module = self._import(entry)
+        return entry
+
+    def _import(self, entry: SolverEntry) -> ModuleType:
+        path = self.directory if entry.is_package else entry.path_day
+        if path in sys.path:
+            sys.path.remove(path)
+        sys.path.insert(0, path)
+
+        if not entry.is_package:
+            # 'partN' of another day might be imported already, make sure
+            # 'from part1 import ...' resolves to this day
+            for sibling in self.entries([entry.day]):
+                name = sibling.module_name
+                if sibling.module is not None:
+                    sys.modules[name] = sibling.module
+                elif _module_path(sys.modules.get(name)) != sibling.path:
+                    sys.modules.pop(name, None)
+
+        return importlib.import_module(entry.module_name)
+
+    def invalidate(self, day: int, part: int = 1) -> None:
+        """
+        Forgets the modules of 'part' and the following parts of the day.
+
+        The next 'get' imports them again, e.g. after their files changed. The
+        following parts go as well, they may import names from 'part'.
+        """
+        for entry in self.entries([day]):
+            if entry.part < part:
+                continue
+            # also modules imported by another part, e.g. 'from part1 import ...'
+            if _module_path(sys.modules.get(entry.module_name)) == entry.path:
+                del sys.modules[entry.module_name]
+            entry.module = None
+        importlib.invalidate_caches()
+
+    def adopt(self, module: ModuleType) -> None:
+        """Registers a module which has been imported elsewhere, e.g. by pytest."""
+        path = _module_path(module)
+        for entry in self._entries.values():
+            if entry.path == path and entry.module is None:
+                entry.module = module
+
+    def pytest_plugin(self) -> object:
+        """pytest plugin adopting the solver modules collected by pytest."""
+        registry = self
+
+        class AdoptCollected:
+            def pytest_collection_modifyitems(self, items) -> None:
+                for item in items:
+                    module = getattr(item, "module", None)
+                    if module is not None:
+                        registry.adopt(module)
+
+        return AdoptCollected()
+
+
+def _module_path(module: Optional[ModuleType]) -> Optional[str]:
+    path = getattr(module, "__file__", None)
+    return os.path.abspath(path) if path else None
+
+
+def get_registry(directory: str) -> SolverRegistry:
+    """Returns the registry of the given directory, created once per process."""
+    path = os.path.abspath(directory)
+    if path not in _registries:
+        _registries[path] = SolverRegistry(path)
+    return _registries[path]
+
+
+def test_registry() -> None:
+    registry = SolverRegistry(os.path.join(os.path.dirname(__file__), ".."))
+
+    assert [(e.day, e.part) for e in registry.entries([1, 16])] == [
+        (1, 1),
+        (1, 2),
+        (16, 1),
+        (16, 2),
+    ]
+    assert registry.entry(16, 2).module_name == "day16.part2"
+    assert registry.entry(1, 2).module_name == "part2"
+
+    entry = registry.get(2, 2)
+    assert entry.compute("A Y\nB X\nC Z\n") == "12"
+    assert entry.title == "Day 2: Rock Paper Scissors - Part 2"
+    # part2 imports part1, both are the same module object
+    assert registry.get(2, 1).module is sys.modules["part1"]
+
+    # part1 of day 3 replaces part1 of day 2
+    group = "\n".join(
+        [
+            "vJrwpWtwJgWrhcsFMMfFFhFp",
+            "jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL",
+            "PmmdzqPrVvPwwTWBwg",
+        ]
+    )
+    assert registry.get(3, 2).compute(group) == "18"
+    assert registry.get(3, 1).module is sys.modules["part1"]
+    assert registry.get(2, 1).module is not registry.get(3, 1).module
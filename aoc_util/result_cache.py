@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_FILE = "aoc_results.sqlite"
+MAX_ENTRIES = 256
+MAX_AGE = 30 * 24 * 60 * 60  # seconds
+
+# only used by the 'main' of the solvers, changes don't affect 'compute'
+HARNESS_MODULES = {"aoc"}
+
+# answer, runtime of the original computation in seconds
+CachedResult = tuple[str, float]
+
+_caches: dict[str, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _resolve_import(name: str, search_paths: list[str]) -> Optional[str]:
+    parts = name.split(".")
+    for path in search_paths:
+        candidate = os.path.join(path, *parts) + ".py"
+        if os.path.exists(candidate):
+            return candidate
+        candidate = os.path.join(path, *parts, "__init__.py")
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def _local_imports(path_module: str, search_paths: list[str]) -> list[str]:
+    with open(path_module, "rb") as file:
+        tree = ast.parse(file.read(), path_module)
+
+    modules: list[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            modules.append(node.module)
+
+    # 'day16.part1' also imports the package 'day16'
+    names = [
+        ".".join(module.split(".")[: i + 1])
+        for module in modules
+        for i in range(module.count(".") + 1)
+    ]
+    found = (
+        _resolve_import(name, search_paths)
+        for name in names
+        if name not in HARNESS_MODULES
+    )
+    return [path for path in found if path is not None]
+
+
+def module_dependencies(path_module: str) -> list[str]:
+    """
+    Returns the module and every local module it imports, recursively.
+
+    Imports are resolved like the solvers resolve them: relative to the day
+    directory ('part1'), to the base directory ('day16.part1') and to 'aoc_util'
+    ('aoc_tools'). Anything else (stdlib, site-packages, 'HARNESS_MODULES') is
+    ignored.
+    """
+    path_module = os.path.abspath(path_module)
+    path_day = os.path.dirname(path_module)
+    search_paths = [path_day, os.path.dirname(path_day), HERE]
+
+    found: list[str] = []
+    to_visit = [path_module]
+    while to_visit:
+        path = to_visit.pop()
+        if path in found:
+            continue
+        found.append(path)
+        to_visit.extend(_local_imports(path, search_paths))
+
+    return sorted(found)
+
+
+def module_fingerprint(path_module: str) -> str:
+    """Hash over the sources of the module and all of its local imports."""
+    digest = hashlib.sha256()
+    for path in module_dependencies(path_module):
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def result_key(compute: Callable[[str], str], input_str: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(module_fingerprint(compute.__code__.co_filename).encode())
+    digest.update(compute.__qualname__.encode())
+    digest.update(input_str.encode())
+    return digest.hexdigest()
+
+
+def module_tests_key(path_module: str) -> str:
+    """Hash over the sources of the module, its local imports and 'test.txt'."""
+    digest = hashlib.sha256()
+    digest.update(module_fingerprint(path_module).encode())
+    path_test = os.path.join(os.path.dirname(path_module), "test.txt")
+    if os.path.exists(path_test):
+        with open(path_test, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Answers of 'compute' keyed by the hash of the solver sources and the input.
+
+    Entries older than 'max_age' seconds are dropped, if there are more than
+    'max_entries' the least recently used entries are dropped.
+
+    Also remembers the last green pytest run of every module, keyed by
+    'module_tests_key', so unchanged modules don't need to be tested again.
+    """
+
+    _connection: sqlite3.Connection
+    _lock: threading.Lock
+    max_entries: int
+    max_age: float
+
+    def __init__(
+        self, path: str, max_entries: int = MAX_ENTRIES, max_age: float = MAX_AGE
+    ) -> None:
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, answer TEXT, elapsed REAL,"
+            " created REAL, last_used REAL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tests (path TEXT PRIMARY KEY, key TEXT)"
+        )
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT answer, elapsed, created FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if row[2] < now - self.max_age:
+                self._connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                return None
+
+            self._connection.execute(
+                "UPDATE results SET last_used = ? WHERE key = ?", (now, key)
+            )
+        return row[0], row[1]
+
+    def put(self, key: str, answer: str, elapsed: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, answer, elapsed, now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        self._connection.execute(
+            "DELETE FROM results WHERE created < ?", (now - self.max_age,)
+        )
+        self._connection.execute(
+            "DELETE FROM results WHERE key NOT IN"
+            " (SELECT key FROM results ORDER BY last_used DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+    def tests_passed(self, path_module: str, key: str) -> bool:
+        """True if the tests of the module passed with the same 'module_tests_key'."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT key FROM tests WHERE path = ?", (path_module,)
+            ).fetchone()
+        return row is not None and row[0] == key
+
+    def put_tests_passed(self, path_module: str, key: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO tests VALUES (?, ?)", (path_module, key)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def get_result_cache(directory: str) -> ResultCache:
+    """Returns the result cache of the given directory, opened once per process."""
+    path = os.path.abspath(os.path.join(directory, CACHE_FILE))
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = ResultCache(path)
+        return _caches[path]
+
+
+def test_module_dependencies() -> None:
+    path_base = os.path.dirname(HERE)
+    path_module = os.path.join(path_base, "day16", "part2.py")
+
+    dependencies = module_dependencies(path_module)
+    assert os.path.join(path_base, "day16", "part1.py") in dependencies
+    assert os.path.join(path_base, "day16", "__init__.py") in dependencies
+    assert os.path.join(HERE, "aoc.py") not in dependencies
+
+
+def test_result_cache(tmp_path) -> None:
+    cache = ResultCache(os.path.join(tmp_path, CACHE_FILE), max_entries=2)
+
+    assert cache.get("a") is None
+    cache.put("a", "1", 0.5)
+    assert cache.get("a") == ("1", 0.5)
+
+    cache.put("b", "2", 0.5)
+    cache.get("a")
+    cache.put("c", "3", 0.5)
+    assert cache.get("b") is None
+    assert cache.get("a") == ("1", 0.5)
+
+    cache.max_age = -1
+    assert cache.get("a") is None
+
+
+def test_tests_passed(tmp_path) -> None:
+    path_module = os.path.join(tmp_path, "part1.py")
+    with open(path_module, "w", encoding="utf-8") as file:
+        file.write("def test() -> None:\n    pass\n")
+    cache = ResultCache(os.path.join(tmp_path, CACHE_FILE))
+
+    key = module_tests_key(path_module)
+    assert not cache.tests_passed(path_module, key)
+    cache.put_tests_passed(path_module, key)
+    assert cache.tests_passed(path_module, key)
+
+    with open(os.path.join(tmp_path, "test.txt"), "w", encoding="utf-8") as file:
+        file.write("1\n")
+    assert not cache.tests_passed(path_module, module_tests_key(path_module))
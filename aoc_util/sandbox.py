@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import IO, Callable, Optional, Sequence
+
+from registry import Solver, get_registry
+
+# lines of the solver output kept to report the progress of a failed run
+TAIL_LINES = 10
+RE_LINE_END = re.compile(rb"[\r\n]")
+
+
+class SandboxError(Exception):
+    """A sandboxed solver failed, 'output' are the last lines it printed."""
+
+    reason: str
+    output: list[str]
+
+    def __init__(self, reason: str, output: Sequence[str] = ()) -> None:
+        super().__init__(reason, list(output))
+        self.reason = reason
+        self.output = list(output)
+
+    def __str__(self) -> str:
+        return self.reason
+
+    def report(self) -> str:
+        if not self.output:
+            return f"{self.reason}, no output"
+        lines = "\n".join(f"  {line}" for line in self.output)
+        return f"{self.reason}, last output:\n{lines}"
+
+
+def _limit_memory(memory_limit: int) -> Callable[[], None]:
+    def limit() -> None:
+        import resource
+
+        limit_bytes = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+    return limit
+
+
+def _read_output(stream: IO[bytes], tail: deque[str], echo: bool) -> None:
+    """Forwards the output of the child and keeps its last lines, '\\r' ends a line."""
+    pending = b""
+    while chunk := stream.read1(4096):
+        if echo:
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+        *lines, pending = RE_LINE_END.split(pending + chunk)
+        tail.extend(line.decode(errors="replace") for line in lines if line.strip())
+    if pending.strip():
+        tail.append(pending.decode(errors="replace"))
+
+
+def run_sandboxed(
+    solver: Solver,
+    input_str: str,
+    timeout: Optional[float] = None,
+    memory_limit: Optional[int] = None,
+    echo: bool = True,
+) -> tuple[str, float]:
+    """
+    Runs 'compute' of the solver in a child process.
+
+        Parameters:
+            solver (Solver): The solver to run.
+            input_str (str): Input of 'compute', passed through stdin.
+            timeout (float | None): Wall clock seconds until the child is killed.
+            memory_limit (int | None): Address space limit of the child in MiB.
+            echo (bool): Forward the output of the child while it runs.
+
+        Returns:
+            tuple[str, float]: The answer and the runtime of 'compute'.
+
+        Raises:
+            SandboxError: The solver timed out, ran out of memory or failed.
+    """
+    day, part, path_module = solver
+    directory = os.path.dirname(os.path.dirname(path_module))
+    fd, path_result = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    tail: deque[str] = deque(maxlen=TAIL_LINES)
+    args = [sys.executable, "-u", __file__, directory, str(day), str(part), path_result]
+    try:
+        with subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            preexec_fn=_limit_memory(memory_limit) if memory_limit else None,
+        ) as process:
+            reader = threading.Thread(
+                target=_read_output, args=(process.stdout, tail, echo), daemon=True
+            )
+            reader.start()
+            try:
+                process.stdin.write(input_str.encode())
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                reader.join()
+                raise SandboxError(f"timed out after {timeout}s", tail) from None
+            reader.join()
+
+        if process.returncode < 0:
+            name = signal.Signals(-process.returncode).name
+            raise SandboxError(f"killed by {name}", tail)
+        if process.returncode != 0:
+            if any("MemoryError" in line for line in tail):
+                raise SandboxError(f"ran out of memory ({memory_limit} MiB)", tail)
+            raise SandboxError(f"failed with exit code {process.returncode}", tail)
+
+        with open(path_result, encoding="utf-8") as file:
+            result = json.load(file)
+        return result["answer"], result["elapsed"]
+    finally:
+        os.remove(path_result)
+
+
+def sandboxed(
+    solver: Solver, timeout: Optional[float] = None, memory_limit: Optional[int] = None
+) -> Callable[[str], str]:
+    """Wraps 'compute' of the solver to run in a child process with limits."""
+
+    def compute(input_str: str) -> str:
+        answer, _ = run_sandboxed(solver, input_str, timeout, memory_limit)
+        return answer
+
+    return compute
+
+
+def _run_child(directory: str, day: int, part: int, path_result: str) -> None:
+    entry = get_registry(directory).get(day, part)
+    input_str = sys.stdin.read()
+    start = time.perf_counter()
+    answer = str(entry.compute(input_str))
+    elapsed = time.perf_counter() - start
+    with open(path_result, "w", encoding="utf-8") as file:
+        json.dump(dict(answer=answer, elapsed=elapsed), file)
+
+
+def _write_solver(tmp_path, body: str) -> Solver:
+    path_day = tmp_path / "day01"
+    path_day.mkdir(exist_ok=True)
+    path_module = path_day / "part1.py"
+    path_module.write_text(f"def compute(input_str):\n{body}", encoding="utf-8")
+    return 1, 1, str(path_module)
+
+
+def test_run_sandboxed(tmp_path) -> None:
+    solver = _write_solver(tmp_path, "    return input_str.upper()\n")
+    answer, elapsed = run_sandboxed(solver, "abc", timeout=30, memory_limit=1024)
+    assert answer == "ABC" and elapsed >= 0
+
+    solver = _write_solver(tmp_path, "    raise ValueError('nope')\n")
+    try:
+        run_sandboxed(solver, "", echo=False)
+        assert False, "the solver fails"
+    except SandboxError as error:
+        assert error.reason == "failed with exit code 1"
+        assert error.output[-1] == "ValueError: nope"
+
+
+def test_run_sandboxed_limits(tmp_path) -> None:
+    solver = _write_solver(
+        tmp_path,
+        "    import time\n"
+        "    for i in range(1000):\n"
+        "        print(f'\\r{i}', end='')\n"
+        "        time.sleep(0.01)\n",
+    )
+    try:
+        run_sandboxed(solver, "", timeout=1, echo=False)
+        assert False, "the solver times out"
+    except SandboxError as error:
+        assert error.reason == "timed out after 1s"
+        assert int(error.output[-1]) > 0
+        assert "last output:" in error.report()
+
+    solver = _write_solver(tmp_path, "    return str(len(bytearray(2 ** 31)))\n")
+    try:
+        run_sandboxed(solver, "", memory_limit=256, echo=False)
+        assert False, "the solver runs out of memory"
+    except SandboxError as error:
+        assert error.reason == "ran out of memory (256 MiB)"
+
+
+if __name__ == "__main__":
+    _run_child(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]), sys.argv[4])
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+from answer_store import AnswerStore
+from aoc_api import AOC_API, SubmitResult
+
+# seconds added to the wait time AoC asks for
+WAIT_MARGIN = 1.0
+# wait time if a TOO_QUICK response doesn't say how long to wait
+DEFAULT_WAIT = 60
+# results which settle an answer, it is never submitted again
+FINAL_RESULTS = (SubmitResult.RIGHT, SubmitResult.WRONG, SubmitResult.ALREADY_DONE)
+
+# (year, day, part)
+Key = tuple[int, int, int]
+
+
+class Submitter:
+    """
+    Submits answers and honors the wait time of TOO_QUICK responses.
+
+    An answer which is submitted too quickly is queued in the answer store
+    together with the time it may be submitted again, a timer thread submits it
+    once that time has come. The caller keeps computing while the queue drains.
+    Answers left queued by an earlier process are picked up by 'resume'.
+    Answers with a final result in the answer store are never submitted again.
+    """
+
+    _api: AOC_API
+    _store: AnswerStore
+    _margin: float
+    _timers: dict[Key, threading.Timer]
+
+    def __init__(
+        self, api: AOC_API, store: AnswerStore, margin: float = WAIT_MARGIN
+    ) -> None:
+        self._api = api
+        self._store = store
+        self._margin = margin
+        self._timers = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self, year: int, day: int, part: int, answer: str
+    ) -> Optional[SubmitResult]:
+        """Submits the answer, returns its result or None if it was queued."""
+        cached = self._store.get(year, day, part, answer)
+        if cached in FINAL_RESULTS:
+            self._store.dequeue(year, day, part, answer)
+            return cached
+
+        result, wait = self._api.submit_solution(year, day, part, answer)
+        if result == SubmitResult.TOO_QUICK:
+            wait = DEFAULT_WAIT if wait is None else wait
+            self.schedule(year, day, part, answer, wait)
+            return None
+
+        self._store.put(year, day, part, answer, result)
+        self._store.dequeue(year, day, part, answer)
+        return result
+
+    def schedule(
+        self, year: int, day: int, part: int, answer: str, wait: float
+    ) -> None:
+        """Queues the answer to be submitted in 'wait' seconds."""
+        not_before = time.time() + wait + self._margin
+        self._store.enqueue(year, day, part, answer, not_before)
+        self._start_timer((year, day, part), not_before)
+
+    def resume(self) -> int:
+        """Schedules the answers queued in the store, returns their number."""
+        queued = self._store.queued()
+        for year, day, part, _, not_before in queued:
+            self._start_timer((year, day, part), not_before)
+        return len(queued)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._timers)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits until the queue is drained, False if 'timeout' passed before."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                timers = list(self._timers.values())
+            if not timers:
+                return True
+            for timer in timers:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                timer.join(remaining)
+
+    def _start_timer(self, key: Key, not_before: float) -> None:
+        timer = threading.Timer(max(0.0, not_before - time.time()), self._retry, (key,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.get(key)
+            if previous is not None:
+                previous.cancel()
+            self._timers[key] = timer
+        timer.start()
+
+    def _retry(self, key: Key) -> None:
+        year, day, part = key
+        queued = [entry for entry in self._store.queued() if entry[:3] == key]
+        try:
+            if queued:
+                answer = queued[0][3]
+                result = self.submit(year, day, part, answer)
+                if result is not None:
+                    name = f"day {day} part {part}"
+                    print(f"Queued answer '{answer}' of {name}: {result.name}")
+        finally:
+            with self._lock:
+                if self._timers.get(key) is threading.current_thread():
+                    del self._timers[key]
+
+
+def test_submitter(tmp_path) -> None:
+    import os
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from answer_store import STORE_FILE
+
+    responses = [
+        "You gave an answer too recently; you have to wait after submitting an"
+        " answer before trying again.  You have 0s left to wait.",
+        "That's the right answer!",
+        "That's the right answer!",
+    ]
+    posted: list[str] = []
+
+    class FakeAoC(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length = int(self.headers["Content-Length"])
+            posted.append(self.rfile.read(length).decode())
+            body = f"<article><p>{responses[len(posted) - 1]}</p></article>".encode()
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAoC)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        api = AOC_API("session", str(tmp_path), base_url)
+        store = AnswerStore(os.path.join(tmp_path, STORE_FILE))
+        submitter = Submitter(api, store, margin=0.0)
+
+        assert submitter.submit(2022, 1, 1, "42") is None
+        assert store.queued()[0][:4] == (2022, 1, 1, "42")
+        assert submitter.wait(timeout=10)
+        assert len(posted) == 2
+        assert store.get(2022, 1, 1, "42") == SubmitResult.RIGHT
+        assert store.queued() == []
+
+        # deduplicated against the answer store
+        assert submitter.submit(2022, 1, 1, "42") == SubmitResult.RIGHT
+        assert len(posted) == 2
+
+        # queued by an earlier process
+        store.enqueue(2022, 1, 2, "7", time.time() - 1)
+        submitter = Submitter(api, store, margin=0.0)
+        assert submitter.resume() == 1
+        assert submitter.wait(timeout=10)
+        assert len(posted) == 3 and "answer=7" in posted[2]
+        assert store.get(2022, 1, 2, "7") == SubmitResult.RIGHT
+    finally:
+        server.shutdown()
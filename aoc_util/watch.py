@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+import traceback
+from typing import Optional
+
+from aoc import get_api_token
+from aoc_api import AOC_API
+from registry import SolverRegistry, get_registry
+
+# seconds between two scans of the day directory
+POLL_INTERVAL = 0.5
+WATCHED_SUFFIXES = (".py", ".txt")
+RE_PART = re.compile(r"^part([0-9])\.py$")
+
+# "tests" and "compute" -> seconds
+Timings = dict[str, float]
+
+
+def snapshot(path_day: str) -> dict[str, int]:
+    """Modification times of the sources and inputs of a day directory."""
+    mtimes = {}
+    with os.scandir(path_day) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(WATCHED_SUFFIXES):
+                mtimes[entry.name] = entry.stat().st_mtime_ns
+    return mtimes
+
+
+def changed_files(before: dict[str, int], after: dict[str, int]) -> list[str]:
+    names = before.keys() | after.keys()
+    return sorted(name for name in names if before.get(name) != after.get(name))
+
+
+def first_changed_part(changed: list[str]) -> Optional[int]:
+    """
+    First part whose module has to be imported again, None if no source changed.
+
+    A changed 'partN.py' affects part N and the following parts, any other
+    module of the day might be imported by every part.
+    """
+    parts = []
+    for name in changed:
+        if not name.endswith(".py"):
+            continue
+        found = RE_PART.search(name)
+        parts.append(int(found.group(1)) if found else 1)
+    return min(parts, default=None)
+
+
+def wait_for_changes(
+    path_day: str, mtimes: dict[str, int], interval: float = POLL_INTERVAL
+) -> tuple[list[str], dict[str, int]]:
+    """Polls the day directory until a file changed, returns them and the new state."""
+    while True:
+        time.sleep(interval)
+        current = snapshot(path_day)
+        changed = changed_files(mtimes, current)
+        if changed:
+            return changed, current
+
+
+def _format_elapsed(elapsed: float, previous: Optional[float]) -> str:
+    if previous is None:
+        return f"{elapsed:.3f}s"
+    return f"{elapsed:.3f}s, {elapsed - previous:+.3f}s"
+
+
+def run_once(
+    registry: SolverRegistry,
+    year: int,
+    day: int,
+    part: int,
+    previous: Timings,
+    test=False,
+    skip_pytest=False,
+) -> Timings:
+    """Runs the tests and 'compute' of the solver, returns the timings of the run."""
+    timings: Timings = {}
+    entry = registry.entry(day, part)
+    if not skip_pytest:
+        import pytest
+
+        start = time.perf_counter()
+        retcode = pytest.main(["-q", entry.path], plugins=[registry.pytest_plugin()])
+        timings["tests"] = time.perf_counter() - start
+        elapsed = _format_elapsed(timings["tests"], previous.get("tests"))
+        if retcode != pytest.ExitCode.OK:
+            print(f"Tests did not succeed ({elapsed})")
+            return timings
+        print(f"Tests passed ({elapsed})")
+
+    entry = registry.get(day, part)
+    input_str = AOC_API(get_api_token(), entry.path_day).get_input(year, day, test)
+    start = time.perf_counter()
+    answer = str(entry.compute(input_str))
+    timings["compute"] = time.perf_counter() - start
+    elapsed = _format_elapsed(timings["compute"], previous.get("compute"))
+    print(f"Answer: {answer} ({elapsed})")
+    return timings
+
+
+def watch_day(
+    directory: str,
+    year: int,
+    day: int,
+    part: int,
+    *,
+    test=False,
+    skip_pytest=False,
+    interval: float = POLL_INTERVAL,
+    runs: Optional[int] = None,
+) -> None:
+    """
+    Runs the tests and the solver of a day every time a file of the day changes.
+
+    The interpreter stays warm between the runs: pytest, the aoc library and
+    the input are loaded once, only the changed solver modules are imported
+    again. Timings are printed next to their change since the previous run.
+    Stops after 'runs' runs, or on Ctrl+C.
+    """
+    registry = get_registry(directory)
+    path_day = os.path.join(registry.directory, f"day{day:0>2}")
+    mtimes = snapshot(path_day)
+    previous: Timings = {}
+    count = 0
+    print(f"Watching '{path_day}', stop with Ctrl+C")
+    try:
+        while True:
+            try:
+                previous.update(
+                    run_once(registry, year, day, part, previous, test, skip_pytest)
+                )
+            except Exception:  # pylint: disable=broad-except
+                # a half edited solver must not end the session
+                traceback.print_exc()
+
+            count += 1
+            if runs is not None and count >= runs:
+                return
+
+            changed, mtimes = wait_for_changes(path_day, mtimes, interval)
+            print(f"\nChanged: {', '.join(changed)}")
+            first_part = first_changed_part(changed)
+            if first_part is not None:
+                registry.invalidate(day, first_part)
+    except KeyboardInterrupt:
+        print("Stopped watching")
+
+
+def test_snapshot(tmp_path) -> None:
+    (tmp_path / "part1.py").write_text("", encoding="utf-8")
+    (tmp_path / "test.txt").write_text("", encoding="utf-8")
+    (tmp_path / "part1.pstats").write_text("", encoding="utf-8")
+    before = snapshot(str(tmp_path))
+    assert sorted(before) == ["part1.py", "test.txt"]
+
+    os.utime(tmp_path / "test.txt", ns=(0, 0))
+    (tmp_path / "part2.py").write_text("", encoding="utf-8")
+    changed = changed_files(before, snapshot(str(tmp_path)))
+    assert changed == ["part2.py", "test.txt"]
+    assert first_changed_part(changed) == 2
+    assert first_changed_part(["test.txt"]) is None
+    assert first_changed_part(["part2.py", "tools.py"]) == 1
+
+
+def test_watch_day(tmp_path, capsys) -> None:
+    path_day = tmp_path / "day01"
+    path_day.mkdir()
+    (path_day / "test.txt").write_text("1\n2\n", encoding="utf-8")
+    path_part1 = path_day / "part1.py"
+    path_part1.write_text(
+        "def compute(input_str):\n    return sum(map(int, input_str.split()))\n",
+        encoding="utf-8",
+    )
+    (path_day / "part2.py").write_text(
+        "from part1 import compute as compute_part1\n\n\n"
+        "def compute(input_str):\n    return compute_part1(input_str) * 2\n",
+        encoding="utf-8",
+    )
+
+    registry = get_registry(str(tmp_path))
+    try:
+        watch_day(str(tmp_path), 2022, 1, 2, test=True, skip_pytest=True, runs=1)
+        assert "Answer: 6 (" in capsys.readouterr().out
+
+        # part 2 picks up the new part 1 once both are imported again
+        path_part1.write_text(
+            "def compute(input_str):\n    return len(input_str.split())\n",
+            encoding="utf-8",
+        )
+        registry.invalidate(1, first_changed_part(["part1.py"]))
+        previous = {"compute": 1.0}
+        run_once(registry, 2022, 1, 2, previous, test=True, skip_pytest=True)
+        out = capsys.readouterr().out
+        assert "Answer: 4 (" in out and "s, -" in out
+    finally:
+        registry.invalidate(1)
@@ -0,0 +1,26 @@
+"""
+Day 1: Calorie Counting - Input generator
+https://adventofcode.com/2022/day/1
+
+'scale' multiplies the number of elves of the example input.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    elves = []
+    for _ in range(5 * scale):
+        items = [str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15))]
+        elves.append("\n".join(items))
+    return "\n\n".join(elves) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute, parse
+
+    input_s = generate(10)
+    elves = parse(input_s)
+    assert len(elves) == 50
+    assert all(1 <= len(elf) <= 15 for elf in elves)
+    assert compute(input_s) == str(max(map(sum, elves)))
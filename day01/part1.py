@@ -4,14 +4,13 @@ https://adventofcode.com/2022/day/1
 """
 from __future__ import annotations
 
+import heapq
 import os
+from typing import Iterable, Iterator
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 Calories = int
 Elf = list[Calories]
@@ -21,8 +20,53 @@ def parse(input_str: str) -> list[Elf]:
     return [[int(line) for line in elf.splitlines()] for elf in input_str.split("\n\n")]
 
 
+def iter_calories(lines: Iterable[str]) -> Iterator[Calories]:
+    """Lazily yields the total calories of every elf."""
+    total: Calories | None = None
+    for line in lines:
+        if line == "":
+            if total is not None:
+                yield total
+            total = None
+            continue
+        total = (total or 0) + int(line)
+
+    if total is not None:
+        yield total
+
+
+def iter_totals(input_str: str) -> Iterator[Calories]:
+    """Lazily yields the total calories of every elf, one group at a time."""
+    start = 0
+    while start < len(input_str):
+        end = input_str.find("\n\n", start)
+        if end == -1:
+            end = len(input_str)
+        items = input_str[start:end].split()
+        if items:
+            yield sum(map(int, items))
+        start = end + 2
+
+
+def top_k(totals: Iterable[Calories], k: int) -> list[Calories]:
+    """The 'k' largest totals in descending order, keeps only k of them at a time."""
+    heap: list[Calories] = []
+    if k <= 0:
+        return heap
+    for total in totals:
+        if len(heap) < k:
+            heapq.heappush(heap, total)
+        elif total > heap[0]:
+            heapq.heapreplace(heap, total)
+    return sorted(heap, reverse=True)
+
+
+def compute_lines(lines: Iterable[str]) -> str:
+    return str(max(iter_calories(lines)))
+
+
 def compute(input_str: str) -> str:
-    return str(max(sum(elf) for elf in parse(input_str)))
+    return str(max(iter_totals(input_str)))
 
 
 def test() -> None:
@@ -30,10 +74,24 @@ def test() -> None:
         input_s = file.read()
 
     assert compute(input_s) == "24000"
+    assert compute_lines(iter(input_s.splitlines())) == "24000"
+
+
+def test_top_k() -> None:
+    with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
+        input_s = file.read()
+
+    totals = list(iter_totals(input_s))
+    assert totals == [sum(elf) for elf in parse(input_s)]
+    assert totals == list(iter_calories(input_s.splitlines()))
+    assert list(iter_totals(input_s + "\n\n")) == totals
+    assert top_k(totals, 3) == [24000, 11000, 10000]
+    assert top_k(totals, 10) == sorted(totals, reverse=True)
+    assert top_k(totals, 0) == []
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 1, 1
 
     aoc.run_part(year, day, part, compute, auto_submit=True)
@@ -4,31 +4,34 @@ https://adventofcode.com/2022/day/1#part2
 """
 import os
 import sys
+from typing import Iterable
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(HERE))
-from part1 import parse
+from part1 import iter_calories, iter_totals, top_k
 
-load_dotenv("../.venv")
-API_TOKEN = os.getenv("API_TOKEN")
+TOP = 3
+
+
+def compute_lines(lines: Iterable[str]) -> str:
+    return str(sum(top_k(iter_calories(lines), TOP)))
 
 
 def compute(input_str: str) -> str:
-    calories = map(sum, parse(input_str))
-    return str(sum(sorted(calories, reverse=True)[0:3]))
+    return str(sum(top_k(iter_totals(input_str), TOP)))
 
 
 def test() -> None:
     with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
         input_s = file.read()
     assert compute(input_s) == "45000"
+    assert compute_lines(iter(input_s.splitlines())) == "45000"
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 1, 2
 
     aoc.run_part(year, day, part, compute, auto_submit=True)
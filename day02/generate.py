@@ -0,0 +1,23 @@
+"""
+Day 2: Rock Paper Scissors - Input generator
+https://adventofcode.com/2022/day/2
+
+'scale' multiplies the number of rounds of the example input.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    rounds = [f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(3 * scale)]
+    return "\n".join(rounds) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import SCORES, compute, count_rounds
+
+    input_s = generate(10)
+    rounds = count_rounds(input_s.splitlines())
+    assert sum(rounds.values()) == 30
+    assert set(rounds) <= set(SCORES)
+    assert 30 <= int(compute(input_s)) <= 270
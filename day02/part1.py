@@ -3,13 +3,12 @@ Day 2: Rock Paper Scissors - Part 1
 https://adventofcode.com/2022/day/2
 """
 import os
+from collections import Counter
+from typing import Iterable
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 # A(1): Rock , B(2): Paper, C(3): Scissor
 #
@@ -53,13 +52,37 @@ def calc_round(a: str, b: str) -> tuple[int, int]:
     return calc_player(a, _b), calc_player(_b, a)
 
 
+# every possible round line, e.g. "A X"
+ROUNDS = [f"{a} {b}" for a in "ABC" for b in "XYZ"]
+# score of each round line, reading the second column as the shape to play
+SCORES = {line: calc_round(*line.split())[1] for line in ROUNDS}
+
+
+def count_rounds(lines: Iterable[str]) -> Counter[str]:
+    """
+    Histogram of the round lines, there are only 9 distinct ones.
+
+    The raw lines are counted and only the few distinct ones are normalised,
+    trailing whitespace or a carriage return doesn't make a line unknown.
+    """
+    rounds: Counter[str] = Counter()
+    for line, n in Counter(lines).items():
+        key = " ".join(line.split())
+        if key:
+            rounds[key] += n
+    return rounds
+
+
+def total_score(rounds: Counter[str], scores: dict[str, int]) -> int:
+    return sum(scores[line] * n for line, n in rounds.items())
+
+
+def compute_lines(lines: Iterable[str]) -> str:
+    return str(total_score(count_rounds(lines), SCORES))
+
+
 def compute(input_str: str) -> str:
-    return str(
-        sum(
-            calc_round(a, b)[1]
-            for a, b in [line.split() for line in input_str.splitlines()]
-        )
-    )
+    return compute_lines(input_str.splitlines())
 
 
 def test_token_worth() -> None:
@@ -84,10 +107,13 @@ def test() -> None:
         input_s = file.read()
 
     assert compute(input_s) == "15"
+    assert compute_lines(iter(input_s.splitlines())) == "15"
+    assert count_rounds(input_s.splitlines()) == {"A Y": 1, "B X": 1, "C Z": 1}
+    assert compute("A Y \r\nB  X\r\nC Z\t\n\n") == "15"
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 2, 1
 
     aoc.run_part(year, day, part, compute)
@@ -6,16 +6,14 @@ from __future__ import annotations
 
 import os
 import sys
+from typing import Iterable
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(HERE)
-from part1 import calc_player
+from part1 import ROUNDS, calc_player, count_rounds, total_score
 
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 map_needed_token = {
     "AX": "C",
@@ -35,13 +33,16 @@ def calc_round(a: str, b: str) -> tuple[int, int]:
     return calc_player(a, _b), calc_player(_b, a)
 
 
+# score of each round line, reading the second column as the outcome
+SCORES = {line: calc_round(*line.split())[1] for line in ROUNDS}
+
+
+def compute_lines(lines: Iterable[str]) -> str:
+    return str(total_score(count_rounds(lines), SCORES))
+
+
 def compute(input_str: str) -> str:
-    return str(
-        sum(
-            calc_round(a, b)[1]
-            for a, b in [line.split() for line in input_str.splitlines()]
-        )
-    )
+    return compute_lines(input_str.splitlines())
 
 
 def test() -> None:
@@ -49,10 +50,11 @@ def test() -> None:
         input_s = file.read()
 
     assert compute(input_s) == "12"
+    assert compute_lines(iter(input_s.splitlines())) == "12"
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 2, 2
 
     aoc.run_part(year, day, part, compute)
@@ -0,0 +1,52 @@
+"""
+Day 3: Rucksack Reorganization - Input generator
+https://adventofcode.com/2022/day/3
+
+'scale' multiplies the number of groups of the example input. The compartments
+of every rucksack share exactly one item, the rucksacks of a group share exactly
+one item (the badge).
+"""
+import random
+import string
+
+ITEMS = string.ascii_lowercase + string.ascii_uppercase
+
+
+def generate_rucksack(rng: random.Random, badge: str, items: list[str]) -> str:
+    common, *others = items
+    first, second = others[: len(others) // 2], others[len(others) // 2 :]
+    size = rng.randint(4, 12)
+    compartment_a = [common, badge, *rng.choices(first, k=size)]
+    compartment_b = [common, *rng.choices(second, k=size + 1)]
+    rng.shuffle(compartment_a)
+    rng.shuffle(compartment_b)
+    return "".join(compartment_a + compartment_b)
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    rucksacks = []
+    for _ in range(2 * scale):
+        badge = rng.choice(ITEMS)
+        others = [item for item in ITEMS if item != badge]
+        rng.shuffle(others)
+        # every rucksack of the group uses its own items besides the badge
+        for i in range(3):
+            items = others[i * 17 : (i + 1) * 17]
+            rucksacks.append(generate_rucksack(rng, badge, items))
+    return "\n".join(rucksacks) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import get_common
+    from part2 import compute
+
+    input_s = generate(10)
+
+    lines = input_s.splitlines()
+    assert len(lines) == 60
+    for line in lines:
+        half = len(line) // 2
+        assert len(set(line[:half]) & set(line[half:])) == 1
+        assert get_common(line) in line[:half]
+    assert int(compute(input_s)) > 0
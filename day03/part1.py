@@ -3,43 +3,66 @@ Day 3: Rucksack Reorganization - Part 1
 https://adventofcode.com/2022/day/3
 """
 import os
+import string
+from typing import Iterable, Iterator
 
-from aoc import AOC
-from dotenv import load_dotenv
+import pytest
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
+
+# item types in the order of their priority
+ITEMS = (string.ascii_lowercase + string.ascii_uppercase).encode()
+# 'translate' marks the items of a rucksack with FLAG, the other item types keep
+# their ascii value, which is below FLAG
+FLAG = b"\x80"
+# the FLAG bit of every item type, bit 8 * priority - 1 marks an item type
+FLAGS = int.from_bytes(FLAG * len(ITEMS), "little")
+
+
+def item_mask(items: bytes) -> int:
+    """Bitmask of the item types, the items are marked in C by 'translate'."""
+    marked = ITEMS.translate(bytes.maketrans(items, FLAG * len(items)))
+    return int.from_bytes(marked, "little") & FLAGS
+
+
+def mask_priority(mask: int) -> int:
+    """Priority of the item type of a mask with a single item type."""
+    if not mask or mask & (mask - 1):
+        raise ValueError(f"expected one common item type, found {mask.bit_count()}")
+    return mask.bit_length() >> 3
+
+
+def rucksack_priorities(rucksacks: Iterable[bytes]) -> Iterator[int]:
+    """
+    Priority of the item in both compartments of every rucksack.
+
+    The masks are built inline, a call per compartment costs more than the mask.
+    """
+    marked, maketrans, from_bytes = ITEMS.translate, bytes.maketrans, int.from_bytes
+    for rucksack in rucksacks:
+        half = len(rucksack) // 2
+        flags = FLAG * half
+        first = from_bytes(marked(maketrans(rucksack[:half], flags)), "little")
+        second = from_bytes(marked(maketrans(rucksack[half:], flags)), "little")
+        yield mask_priority(first & second & FLAGS)
 
 
 def get_common(input_str: str) -> str:
-    half = len(input_str) // 2
-    a, b = input_str[:half], input_str[half:]
-    in_a = {}
-    in_b = {}
-    for _a, _b in zip(a, b):
-        if _a == _b:
-            return _a
-        if _b in in_a:
-            return _b
-        if _a in in_b:
-            return _a
-
-        in_a[_a] = True
-        in_b[_b] = True
+    [priority] = rucksack_priorities([input_str.encode()])
+    return chr(ITEMS[priority - 1])
 
 
 def get_priority(c: str) -> int:
-    value = ord(c)
-    if value >= 97:
-        return value - 96
-    if value >= 65:
-        return value - 38
+    return mask_priority(item_mask(c.encode()))
+
+
+def compute_lines(lines: Iterable[str]) -> str:
+    return str(sum(rucksack_priorities(map(str.encode, filter(None, lines)))))
 
 
 def compute(input_str: str) -> str:
-    commons = map(get_common, input_str.splitlines())
-    return str(sum(map(get_priority, commons)))
+    return str(sum(rucksack_priorities(input_str.encode().split())))
 
 
 def test() -> None:
@@ -47,10 +70,21 @@ def test() -> None:
         input_s = file.read()
 
     assert compute(input_s) == "157"
+    assert compute_lines(iter(input_s.splitlines())) == "157"
+
+
+def test_get_common() -> None:
+    assert get_common("vJrwpWtwJgWrhcsFMMfFFhFp") == "p"
+    assert get_common("jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL") == "L"
+    assert [get_priority(item) for item in "azAZ"] == [1, 26, 27, 52]
+
+    for rucksack in ("abcd", "abab"):
+        with pytest.raises(ValueError):
+            get_common(rucksack)
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 3, 1
 
     aoc.run_part(year, day, part, compute)
@@ -7,47 +7,38 @@ from __future__ import annotations
 import os
 import sys
 from functools import reduce
+from operator import and_
+from typing import Iterable, Iterator
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(HERE)
-from part1 import get_priority
+from part1 import ITEMS, item_mask, mask_priority
 
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
+GROUP_SIZE = 3
 
 
 def get_common_grp(rucksacks: list[str]) -> str:
-    found = {}
-    for rucksack, match_local in zip(rucksacks, [{} for _ in range(len(rucksacks))]):
-        for item in rucksack:
-            if item not in match_local:
-                if item in found:
-                    found[item] += 1
-                else:
-                    found[item] = 1
+    [priority] = group_priorities(map(str.encode, rucksacks), len(rucksacks))
+    return chr(ITEMS[priority - 1])
 
-                match_local[item] = 1
-                if found[item] >= 3:
-                    return item
 
+def group_priorities(
+    rucksacks: Iterable[bytes], size: int = GROUP_SIZE
+) -> Iterator[int]:
+    """Priority of the item shared by every group of 'size' consecutive rucksacks."""
+    masks = map(item_mask, rucksacks)
+    for group in zip(*[masks] * size):
+        yield mask_priority(reduce(and_, group))
 
-def compute(input_str: str) -> str:
-    rucksacks = input_str.splitlines()
 
-    def reducer(acc: list[list[str]], item: list[str]) -> list[list[str]]:
-        if len(acc[-1]) >= 3:
-            acc.append([item])
-        else:
-            acc[-1].append(item)
-        return acc
+def compute_lines(lines: Iterable[str]) -> str:
+    return str(sum(group_priorities(map(str.encode, filter(None, lines)))))
+
 
-    groups = reduce(reducer, rucksacks, [[]])
-    # groups = reduce(lambda acc, r: acc.append(r) if len(acc[-1]) >= 3 else acc[-1].extend([r]),rucksacks,  [[]])
-    prios = list(map(get_priority, map(get_common_grp, groups)))
-    return str(sum(prios))
+def compute(input_str: str) -> str:
+    return str(sum(group_priorities(input_str.encode().split())))
 
 
 def test_get_common_grp() -> None:
@@ -69,16 +60,21 @@ def test_get_common_grp() -> None:
     for group, e in zip(groups, expected):
         assert get_common_grp(group) == e
 
+    rucksacks = [rucksack.encode() for group in groups for rucksack in group]
+    assert list(group_priorities(rucksacks)) == [18, 52]
+    assert list(group_priorities([b"abc", b"cde", b"xyZ", b"Zq"], 2)) == [3, 52]
+
 
 def test() -> None:
     with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
         input_s = file.read()
 
     assert compute(input_s) == "70"
+    assert compute_lines(iter(input_s.splitlines())) == "70"
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 3, 2
 
     aoc.run_part(year, day, part, compute)
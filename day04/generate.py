@@ -0,0 +1,28 @@
+"""
+Day 4: Camp Cleanup - Input generator
+https://adventofcode.com/2022/day/4
+
+'scale' multiplies the number of pairs of the example input.
+"""
+import random
+
+
+def generate_range(rng: random.Random) -> str:
+    start = rng.randint(1, 99)
+    return f"{start}-{rng.randint(start, 99)}"
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    pairs = [f"{generate_range(rng)},{generate_range(rng)}" for _ in range(6 * scale)]
+    return "\n".join(pairs) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute, parse_pair
+
+    input_s = generate(10)
+    pairs = [parse_pair(line) for line in input_s.splitlines()]
+    assert len(pairs) == 60
+    assert all(1 <= start < end <= 100 for pair in pairs for start, end in pair)
+    assert 0 <= int(compute(input_s)) <= 60
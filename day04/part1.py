@@ -5,35 +5,66 @@ https://adventofcode.com/2022/day/4
 from __future__ import annotations
 
 import os
+from itertools import repeat
+from operator import le, mul, sub
+from typing import Iterable
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
+from aoc_tools import Interval, interval_contains
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
+SEPARATORS = str.maketrans("-,", "  ")
+# first and last section of the first and the second assignment of every pair
+Columns = tuple[list[int], list[int], list[int], list[int]]
 
-def compute(input_str: str) -> str:
+
+def parse_pair(line: str) -> tuple[Interval, Interval]:
+    """The two sections of a line like '2-4,6-8' as half-open intervals."""
+    r0, r1 = ((int(a), int(b) + 1) for a, b in [r.split("-") for r in line.split(",")])
+    return r0, r1
+
+
+def parse_columns(input_str: str) -> Columns:
+    """Parses all pairs in one pass over the whole input, one list per column."""
+    numbers = list(map(int, input_str.translate(SEPARATORS).split()))
+    return numbers[0::4], numbers[1::4], numbers[2::4], numbers[3::4]
+
+
+def count_containing(columns: Columns) -> int:
+    """Pairs where one assignment contains the other, (a0 - a1) * (b0 - b1) <= 0."""
+    a0, b0, a1, b1 = columns
+    return sum(map(le, map(mul, map(sub, a0, a1), map(sub, b0, b1)), repeat(0)))
+
+
+def compute_lines(lines: Iterable[str]) -> str:
     count = 0
-    for line in input_str.splitlines():
-        r0, r1 = ((int(a), int(b)) for a, b in [r.split("-") for r in line.split(",")])
-        if r0[0] <= r1[0] and r0[1] >= r1[1]:
-            count += 1
-        elif r0[0] >= r1[0] and r0[1] <= r1[1]:
+    for line in lines:
+        r0, r1 = parse_pair(line)
+        if interval_contains(r0, r1) or interval_contains(r1, r0):
             count += 1
 
     return str(count)
 
 
+def compute(input_str: str) -> str:
+    return str(count_containing(parse_columns(input_str)))
+
+
 def test() -> None:
     with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
         input_s = file.read()
     assert compute(input_s) == "2"
+    assert compute_lines(iter(input_s.splitlines())) == "2"
+
+
+def test_parse_pair() -> None:
+    assert parse_pair("2-4,6-8") == ((2, 5), (6, 9))
+    assert parse_columns("2-4,6-8\n12-40,3-99\n") == ([2, 12], [4, 40], [6, 3], [8, 99])
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 4, 1
     aoc.run_part(year, day, part, compute)
 
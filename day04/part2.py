@@ -2,36 +2,99 @@
 Day 4: Camp Cleanup - Part 2
 https://adventofcode.com/2022/day/4#part2
 """
+from __future__ import annotations
+
 import os
+from bisect import bisect_right
+from operator import and_, le
+from typing import Iterable
+
+from aoc import AOC, get_api_token
+from aoc_tools import intervals_overlap
 
-from aoc import AOC
-from dotenv import load_dotenv
+from part1 import Columns, parse_columns, parse_pair
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
-def compute(input_str: str) -> str:
+def count_overlapping(columns: Columns) -> int:
+    a0, b0, a1, b1 = columns
+    return sum(map(and_, map(le, a0, b1), map(le, a1, b0)))
+
+
+class SectionIndex:
+    """
+    Answers which assignments cover a section.
+
+    Assignments are numbered in input order, pair i holds the assignments 2i
+    and 2i + 1. They are sorted by their first section, a query only checks
+    those starting at or before the section. Counting bisects the sorted first
+    and last sections and takes O(log n).
+    """
+
+    _order: list[int]
+    _firsts: list[int]
+    _lasts: list[int]
+    _sorted_lasts: list[int]
+
+    def __init__(self, columns: Columns) -> None:
+        a0, b0, a1, b1 = columns
+        firsts = [section for pair in zip(a0, a1) for section in pair]
+        self._lasts = [section for pair in zip(b0, b1) for section in pair]
+        self._order = sorted(range(len(firsts)), key=firsts.__getitem__)
+        self._firsts = [firsts[i] for i in self._order]
+        self._sorted_lasts = sorted(self._lasts)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def count(self, section: int) -> int:
+        """Number of assignments covering the section."""
+        started = bisect_right(self._firsts, section)
+        ended = bisect_right(self._sorted_lasts, section - 1)
+        return started - ended
+
+    def covering(self, section: int) -> list[int]:
+        """Assignments covering the section, in input order."""
+        started = self._order[: bisect_right(self._firsts, section)]
+        lasts = self._lasts
+        return sorted(i for i in started if lasts[i] >= section)
+
+
+def compute_lines(lines: Iterable[str]) -> str:
     count = 0
-    for line in input_str.splitlines():
-        r0, r1 = [(int(a), int(b)) for a, b in [r.split("-") for r in line.split(",")]]
-        if r0[0] <= r1[1] <= r0[1]:
-            count += 1
-        elif r1[0] <= r0[1] <= r1[1]:
+    for line in lines:
+        if intervals_overlap(*parse_pair(line)):
             count += 1
 
     return str(count)
 
 
+def compute(input_str: str) -> str:
+    return str(count_overlapping(parse_columns(input_str)))
+
+
 def test() -> None:
     with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
         input_s = file.read()
     assert compute(input_s) == "4"
+    assert compute_lines(iter(input_s.splitlines())) == "4"
+
+
+def test_section_index() -> None:
+    with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
+        input_s = file.read()
+
+    index = SectionIndex(parse_columns(input_s))
+    assert len(index) == 12
+    assert index.covering(1) == []
+    assert index.covering(4) == [0, 3, 6, 7, 9, 10, 11]
+    for section in range(10):
+        assert index.count(section) == len(index.covering(section))
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 4, 2
 
     aoc.run_part(year, day, part, compute)
@@ -0,0 +1,52 @@
+"""
+Day 5: Supply Stacks - Input generator
+https://adventofcode.com/2022/day/5
+
+'scale' multiplies the height of the stacks and the number of moves of the
+example input. There are always 9 stacks, moves never empty a stack, so the
+input is valid for the CrateMover 9000 and 9001.
+"""
+import random
+import string
+
+STACKS = 9
+
+
+def draw_stacks(stacks: list[list[str]]) -> str:
+    height = max(len(stack) for stack in stacks)
+    lines = []
+    for row in reversed(range(height)):
+        cells = [f"[{stack[row]}]" if row < len(stack) else "   " for stack in stacks]
+        lines.append(" ".join(cells))
+    lines.append(" ".join(f" {i + 1} " for i in range(len(stacks))))
+    return "\n".join(lines)
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(1, 3 * scale))
+        for _ in range(STACKS)
+    ]
+    drawing = draw_stacks(stacks)
+
+    sizes = [len(stack) for stack in stacks]
+    moves = []
+    while len(moves) < 4 * scale:
+        src, dst = rng.sample(range(STACKS), 2)
+        if sizes[src] < 2:
+            continue
+        count = rng.randint(1, sizes[src] - 1)
+        sizes[src] -= count
+        sizes[dst] += count
+        moves.append(f"move {count} from {src + 1} to {dst + 1}")
+
+    return drawing + "\n\n" + "\n".join(moves) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute
+
+    input_s = generate(10)
+    assert len(input_s.split("\n\n")[1].splitlines()) == 40
+    assert len(compute(input_s)) == STACKS
@@ -1,13 +1,10 @@
 import os
-from functools import reduce
 from typing import List, Tuple
 
-from aoc import AOC
-from dotenv import load_dotenv
+import pytest
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def parse_state(input_str: str) -> List[List[str]]:
@@ -36,24 +33,51 @@ def parse_actions(input_str: str) -> List[Tuple[int, int, int]]:
     ]
 
 
+def move_crates(
+    state: List[List[str]], count: int, src: int, dst: int, reverse: bool
+) -> None:
+    """
+    Moves the top 'count' crates from stack 'src' to 'dst' (1-based).
+
+    Only the moved crates are copied, the source stack is truncated in place
+    with 'del'. 'reverse' moves them one at a time like the CrateMover 9000,
+    otherwise they keep their order like with the CrateMover 9001. Moving more
+    crates than the stack holds raises ValueError.
+    """
+    source = state[src - 1]
+    if not 0 <= count <= len(source):
+        raise ValueError(
+            f"can't move {count} crates from stack {src}, it has {len(source)}"
+        )
+    start = len(source) - count
+    moved = source[start:]
+    del source[start:]
+    if reverse:
+        moved.reverse()
+    state[dst - 1].extend(moved)
+
+
 def apply_action(
     state: List[List[str]], count: int, src: int, dst: int
 ) -> List[List[str]]:
-    _dst = dst - 1
-    _src = src - 1
-    state[_dst].extend(list(reversed(state[_src][-count:])))
-    state[_src] = state[_src][:-count]
+    move_crates(state, count, src, dst, reverse=True)
     return state
 
 
-def compute(input_str: str) -> str:
+def run_crane(input_str: str, reverse: bool) -> str:
+    """Applies all moves of the input, returns the crates on top of the stacks."""
     [state_str, actions_str] = input_str.split("\n\n")
 
     state = parse_state(state_str)
-    actions = parse_actions(actions_str)
-    for action in actions:
-        state = apply_action(state, *action)
-    return reduce(lambda a, b: a + b[-1], state, "")
+    for count, src, dst in parse_actions(actions_str):
+        move_crates(state, count, src, dst, reverse)
+    if not all(state):
+        raise ValueError("a stack is empty after the moves, it has no top crate")
+    return "".join(stack[-1] for stack in state)
+
+
+def compute(input_str: str) -> str:
+    return run_crane(input_str, reverse=True)
 
 
 def test_apply_action() -> None:
@@ -73,6 +97,22 @@ def test_apply_action_move2() -> None:
     assert state_new == expected
 
 
+def test_move_crates() -> None:
+    state = [["Z", "N"], ["M", "C", "D"], ["P"]]
+
+    move_crates(state, 3, 2, 3, reverse=False)
+    assert state == [["Z", "N"], [], ["P", "M", "C", "D"]]
+    move_crates(state, 0, 1, 2, reverse=True)
+    assert state == [["Z", "N"], [], ["P", "M", "C", "D"]]
+    move_crates(state, 2, 3, 1, reverse=True)
+    assert state == [["Z", "N", "D", "C"], [], ["P", "M"]]
+
+    for count in (3, -1):
+        with pytest.raises(ValueError):
+            move_crates(state, count, 3, 1, reverse=True)
+    assert state == [["Z", "N", "D", "C"], [], ["P", "M"]]
+
+
 def test_parse_state() -> None:
     input_str = """\
     [D]    
@@ -113,9 +153,13 @@ move 1 from 1 to 2
 """
     assert compute(input_s) == "CMZ"
 
+    # stack 2 is empty at the end
+    with pytest.raises(ValueError):
+        compute(input_s + "move 1 from 2 to 1\n")
+
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 5, 1
 
     aoc.run_part(year, day, part, compute)
@@ -1,59 +1,23 @@
 import os
-from functools import reduce
-from typing import List, Tuple
+import sys
+from typing import List
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
-
-
-def parse_state(input_str: str) -> List[List[str]]:
-    lines = input_str.splitlines()
-    buckets = int(lines[-1].split(" ")[-2])
-    state = [[] for _ in range(buckets)]
-    offset = 4
-
-    for line in lines[:-1]:
-        i = 0
-        while 1 + (i * offset) < len(line):
-            index = 1 + (i * offset)
-            value = line[index]
-            if value != " ":
-                state[i].append(value)
-            i += 1
-    for _s in state:
-        _s.reverse()
-    return state
-
-
-def parse_actions(input_str: str) -> List[Tuple[int, int, int]]:
-    return [
-        (int(values[1]), int(values[3]), int(values[5]))
-        for values in [line.split(" ") for line in input_str.splitlines()]
-    ]
+sys.path.append(HERE)
+from part1 import move_crates, parse_actions, parse_state, run_crane
 
 
 def apply_action(
     state: List[List[str]], count: int, src: int, dst: int
 ) -> List[List[str]]:
-    _dst = dst - 1
-    _src = src - 1
-    state[_dst].extend(state[_src][-count:])
-    state[_src] = state[_src][:-count]
+    move_crates(state, count, src, dst, reverse=False)
     return state
 
 
 def compute(input_str: str) -> str:
-    [state_str, actions_str] = input_str.split("\n\n")
-
-    state = parse_state(state_str)
-    actions = parse_actions(actions_str)
-    for action in actions:
-        state = apply_action(state, *action)
-    return reduce(lambda a, b: a + b[-1], state, "")
+    return run_crane(input_str, reverse=False)
 
 
 def test_apply_action() -> None:
@@ -113,7 +77,7 @@ move 1 from 1 to 2
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 5, 2
 
     aoc.run_part(year, day, part, compute)
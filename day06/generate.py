@@ -0,0 +1,24 @@
+"""
+Day 6: Tuning Trouble - Input generator
+https://adventofcode.com/2022/day/6
+
+'scale' multiplies the length of the datastream of the example input. The
+datastream only uses three characters until the very end, the start-of-packet
+and start-of-message markers are the last 14 characters.
+"""
+import random
+import string
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    noise = rng.choices("abc", k=30 * scale)
+    marker = rng.sample(string.ascii_lowercase, 14)
+    return "".join(noise + marker) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute_buffer
+
+    input_s = generate(10)
+    assert 300 < compute_buffer(input_s.encode()) <= 314
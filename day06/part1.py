@@ -1,12 +1,9 @@
 import os
-from typing import List
+from typing import List, Optional
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def all_tokens_unique(*tokens: List[str]) -> bool:
@@ -18,6 +15,29 @@ def all_tokens_unique(*tokens: List[str]) -> bool:
     return True
 
 
+def find_marker(buffer: bytes, window_size: int) -> Optional[int]:
+    """
+    Position after the first 'window_size' distinct bytes of the buffer.
+
+    Single pass over the buffer remembering where each byte was seen last, works
+    on memory mapped input without copying it.
+    """
+    last_seen = [-1] * 256
+    start = 0
+    with memoryview(buffer) as view:
+        for i, token in enumerate(view):
+            if last_seen[token] >= start:
+                start = last_seen[token] + 1
+            last_seen[token] = i
+            if i - start + 1 == window_size:
+                return i + 1
+    return None
+
+
+def compute_buffer(buffer: bytes) -> Optional[int]:
+    return find_marker(buffer, 4)
+
+
 def compute(input_str: str) -> str:
     window_size = 4
     i = 0
@@ -41,10 +61,11 @@ def test() -> None:
 
     for i, e in zip(inputs, expected):
         assert compute(i) == e
+        assert compute_buffer(i.encode()) == e
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 6, 1
 
     aoc.run_part(year, day, part, compute)
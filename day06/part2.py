@@ -1,12 +1,12 @@
 import os
-from typing import List
+import sys
+from typing import List, Optional
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
+sys.path.append(HERE)
+from part1 import find_marker
 
 
 def all_tokens_unique(*tokens: List[str]) -> bool:
@@ -18,6 +18,10 @@ def all_tokens_unique(*tokens: List[str]) -> bool:
     return True
 
 
+def compute_buffer(buffer: bytes) -> Optional[int]:
+    return find_marker(buffer, 14)
+
+
 def compute(input_str: str) -> str:
     window_size = 14
     i = 0
@@ -42,10 +46,11 @@ def test() -> None:
 
     for i, e in zip(inputs, expected):
         assert compute(i) == e
+        assert compute_buffer(i.encode()) == e
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 6, 2
 
     aoc.run_part(year, day, part, compute)
@@ -0,0 +1,61 @@
+"""
+Day 7: No Space Left On Device - Input generator
+https://adventofcode.com/2022/day/7
+
+'scale' multiplies the number of directories and files of the example input.
+The terminal output walks the tree depth first, listing every directory once.
+"""
+from __future__ import annotations
+
+import random
+import string
+
+
+def get_name(index: int) -> str:
+    name = ""
+    index += 1
+    while index > 0:
+        index, rest = divmod(index - 1, 26)
+        name = string.ascii_lowercase[rest] + name
+    return name
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    # directory -> (sub directories, file sizes)
+    children: list[list[int]] = [[]]
+    files: list[list[int]] = [[]]
+    for i in range(1, 4 * scale):
+        children[rng.randrange(i)].append(i)
+        children.append([])
+        files.append([])
+    for _ in range(10 * scale):
+        files[rng.randrange(len(files))].append(rng.randint(1000, 300000))
+
+    lines = ["$ cd /"]
+
+    def walk(directory: int) -> None:
+        lines.append("$ ls")
+        lines.extend(f"dir {get_name(child)}" for child in children[directory])
+        lines.extend(
+            f"{size} {get_name(i)}.{rng.choice(['txt', 'dat', 'log', 'lst'])}"
+            for i, size in enumerate(files[directory])
+        )
+        for child in children[directory]:
+            lines.append(f"$ cd {get_name(child)}")
+            walk(child)
+            lines.append("$ cd ..")
+
+    walk(0)
+    return "\n".join(lines) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import parse
+
+    input_s = generate(10)
+
+    root, folders = parse(input_s)
+    assert len(folders) == 40
+    sizes = [int(line.split()[0]) for line in input_s.splitlines() if line[0].isdigit()]
+    assert root.size == sum(sizes)
@@ -2,12 +2,9 @@ from __future__ import annotations
 from typing import Dict, Optional, Union
 import os
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 class File(object):
@@ -156,7 +153,7 @@ $ ls
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 7, 2
 
     aoc.run_part(year, day, part, compute)
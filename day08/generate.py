@@ -0,0 +1,25 @@
+"""
+Day 8: Treetop Tree House - Input generator
+https://adventofcode.com/2022/day/8
+
+'scale' multiplies the width and the height of the grid of the example input.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = 5 * scale
+    rows = ["".join(rng.choices("0123456789", k=size)) for _ in range(size)]
+    return "\n".join(rows) + "\n"
+
+
+def test_generate() -> None:
+    from aoc_tools import Grid
+    from part1 import compute
+
+    input_s = generate(10)
+    grid = Grid.from_str(input_s)
+    assert grid.width == grid.height == 50
+    # at least the edge is visible
+    assert int(compute(input_s)) >= 4 * 50 - 4
@@ -1,79 +1,38 @@
 import os
-from typing import Optional
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
+from aoc_tools import Grid
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
-def transpose_matrix(matrix: list[list]) -> list[list]:
-    return list(map(list, zip(*matrix)))
-
-
-def visible_to_str(visible: list[list[bool]]):
-    res = ""
-    for row in visible:
-        for tree in row:
-            if tree:
-                res += "*"
-            else:
-                res += " "
-        res += "\n"
-
-    return res
-
-
-def trees_to_str(visible: list[list[int]]):
-    res = ""
-    for row in visible:
-        for tree in row:
-            res += str(tree)
-        res += "\n"
-
-    return res
-
-
-def mark_visible_row(
-    row: list[int], visible: Optional[list[bool]] = None
-) -> list[bool]:
-    if visible is None:
-        visible = [False for _ in range(len(row))]
-
-    min_height = -1
-    for i, height in enumerate(row):
-        if height > min_height:
-            visible[i] = True
-            min_height = height
-    visible = list(reversed(visible))
-
-    min_height = -1
-    for i, height in enumerate(reversed(row)):
-        if height > min_height:
-            min_height = height
-            visible[i] = True
-    return list(reversed(visible))
-
-
-def mark_visible_matrix(
-    matrix: list[list[int]], visible: Optional[list[list[bool]]] = None
-) -> list[list[bool]]:
-    if visible is None:
-        visible = [[False for _ in range(len(matrix[0]))] for _ in range(len(matrix))]
-
-    for i, row in enumerate(matrix):
-        visible[i] = mark_visible_row(row, visible[i])
-
+def mark_visible_line(
+    grid: Grid, visible: bytearray, start: int, step: int, count: int
+) -> None:
+    """Marks the trees visible from 'start' looking along the line in 'visible'."""
+    tallest = -1
+    for index in range(start, start + step * count, step):
+        height = grid.cells[index]
+        if height > tallest:
+            visible[index] = 1
+            tallest = height
+
+
+def mark_visible(grid: Grid) -> bytearray:
+    """One byte per tree, 1 if it is visible from outside of the grid."""
+    visible = bytearray(len(grid.cells))
+    width, height = grid.width, grid.height
+    for row in range(height):
+        mark_visible_line(grid, visible, grid.index(row, 0), 1, width)
+        mark_visible_line(grid, visible, grid.index(row, width - 1), -1, width)
+    for col in range(width):
+        mark_visible_line(grid, visible, grid.index(0, col), width, height)
+        mark_visible_line(grid, visible, grid.index(height - 1, col), -width, height)
     return visible
 
 
 def compute(input_str: str) -> str:
-    matrix = [[int(c) for c in line] for line in input_str.splitlines()]
-    step1 = mark_visible_matrix(matrix)
-    step2 = mark_visible_matrix(transpose_matrix(matrix), transpose_matrix(step1))
-    return str(sum(sum(row) for row in step2))
+    return str(sum(mark_visible(Grid.from_str(input_str))))
 
 
 def test() -> None:
@@ -83,15 +42,13 @@ def test() -> None:
     assert compute(input_s) == "21"
 
 
-def test_transpose_matrix() -> None:
-    matrix = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]
-    res = [[1, 5, 9], [2, 6, 10], [3, 7, 11], [4, 8, 12]]
-
-    assert transpose_matrix(matrix) == res
+def test_mark_visible() -> None:
+    visible = mark_visible(Grid.from_str("30373\n25512\n65332\n33549\n35390\n"))
+    assert "".join(map(str, visible)) == "11111" "11101" "11011" "10101" "11111"
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
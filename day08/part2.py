@@ -1,67 +1,34 @@
 import os
-from typing import Optional
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
+from aoc_tools import Grid
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
-def trees_to_str(visible: list[list[int]]):
-    res = ""
-    for row in visible:
-        for tree in row:
-            res += str(tree)
-        res += "\n"
-
-    return res
-
-
-def compute_scenic_score(tree: tuple[int, int], height_map: list[list[int]]) -> int:
-    up, down, left, right = 0, 0, 0, 0
-    height = height_map[tree[0]][tree[1]]
-
-    while tree[0] + down + 1 < len(height_map):
-        down += 1
-        if height <= height_map[tree[0] + down][tree[1]]:
-            break
-
-    while tree[0] - (up + 1) >= 0:
-        up += 1
-        if height <= height_map[tree[0] - up][tree[1]]:
-            break
-
-    while tree[1] + right + 1 < len(height_map):
-        right += 1
-        if height <= height_map[tree[0]][tree[1] + right]:
-            break
-
-    while tree[1] - (left + 1) >= 0:
-        left += 1
-        if height <= height_map[tree[0]][tree[1] - left]:
-            break
-
-    print(f"{tree}: {height=}, {up=}, {down=}, {left=}, {right=}")
-
-    return up * down * left * right
-
-
-def compute_scenic_scores(height_map: list[list[int]]) -> list[list[int]]:
-    res = []
-    for i, row in enumerate(height_map):
-        res.append([])
-        for j, tree in enumerate(row):
-            res[i].append(compute_scenic_score((i, j), height_map))
-
-    return res
+def compute_scenic_score(grid: Grid, index: int) -> int:
+    row, col = grid.position(index)
+    height = grid.cells[index]
+    score = 1
+    # (step of the flat index, number of trees until the edge)
+    for step, count in (
+        (-grid.width, row),
+        (grid.width, grid.height - 1 - row),
+        (-1, col),
+        (1, grid.width - 1 - col),
+    ):
+        distance = 0
+        for other in range(index + step, index + step * (count + 1), step):
+            distance += 1
+            if grid.cells[other] >= height:
+                break
+        score *= distance
+    return score
 
 
 def compute(input_str: str) -> str:
-    matrix = [[int(c) for c in line] for line in input_str.splitlines()]
-    scores = compute_scenic_scores(matrix)
-    return str(max(max(row) for row in scores))
+    grid = Grid.from_str(input_str)
+    return str(max(compute_scenic_score(grid, i) for i in range(len(grid.cells))))
 
 
 def test() -> None:
@@ -71,8 +38,15 @@ def test() -> None:
     assert compute(input_s) == "8"
 
 
+def test_compute_scenic_score() -> None:
+    grid = Grid.from_str("30373\n25512\n65332\n33549\n35390\n")
+    assert compute_scenic_score(grid, grid.index(1, 2)) == 4
+    assert compute_scenic_score(grid, grid.index(3, 2)) == 8
+    assert compute_scenic_score(grid, grid.index(0, 0)) == 0
+
+
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
@@ -0,0 +1,23 @@
+"""
+Day 9: Rope Bridge - Input generator
+https://adventofcode.com/2022/day/9
+
+'scale' multiplies the number of motions of the example input.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    motions = [f"{rng.choice('RULD')} {rng.randint(1, 19)}" for _ in range(8 * scale)]
+    return "\n".join(motions) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute, parse
+
+    input_s = generate(10)
+    motions = parse(input_s)
+    assert len(motions) == 80
+    assert all(direction in "RULD" and steps > 0 for direction, steps in motions)
+    assert int(compute(input_s)) > 0
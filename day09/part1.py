@@ -2,12 +2,9 @@ from __future__ import annotations
 
 import os
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def grid_to_str(grid: list[list[int]]) -> str:
@@ -131,7 +128,7 @@ R 2
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part)
@@ -3,11 +3,8 @@ from __future__ import annotations
 import os
 
 from aoc import AOC
-from dotenv import load_dotenv
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def grid_to_str(rope: list[tuple[int, int]], visited: set[tuple[int, int]]) -> str:
@@ -0,0 +1,32 @@
+"""
+Day 10: Cathode-Ray Tube - Input generator
+https://adventofcode.com/2022/day/10
+
+'scale' multiplies the number of instructions of the example input. The value
+of the 'x' register stays on the screen.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    x = 1
+    instructions = []
+    for _ in range(146 * scale):
+        if rng.random() < 0.3:
+            instructions.append("noop")
+            continue
+        number = rng.randint(-x, 39 - x)
+        instructions.append(f"addx {number}")
+        x += number
+    return "\n".join(instructions) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute_lines, iter_cycles
+
+    input_s = generate(10)
+    assert len(input_s.splitlines()) == 1460
+    # the sprite never leaves the screen
+    assert all(0 <= x <= 39 for _, x in iter_cycles(input_s.splitlines()))
+    assert int(compute_lines(iter(input_s.splitlines()))) >= 0
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from aoc import AOC
-from dotenv import load_dotenv
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def parse(input_str: str) -> list[tuple[str, int]]:
@@ -41,6 +38,27 @@ def tick(
     raise ValueError(f"Unknown operation {operation}")
 
 
+def iter_cycles(lines: Iterable[str]) -> Iterator[tuple[int, int]]:
+    """Lazily yields every cycle and the value of 'x' during the cycle."""
+    cycle, x = 1, 1
+    for line in lines:
+        operation, *number = line.split(" ")
+        if operation == "noop":
+            yield cycle, x
+            cycle += 1
+        elif operation == "addx":
+            yield cycle, x
+            yield cycle + 1, x
+            cycle += 2
+            x += int(number[0])
+        else:
+            raise ValueError(f"Unknown operation {operation}")
+
+
+def compute_lines(lines: Iterable[str]) -> str:
+    return str(sum(cycle * x for cycle, x in iter_cycles(lines) if cycle % 40 == 20))
+
+
 def compute(input_str: str) -> str:
     actions = parse(input_str)
     registers = dict(x=1)
@@ -61,6 +79,7 @@ def test() -> None:
         input_s = file.read()
 
     assert compute(input_s) == "13140"
+    assert compute_lines(iter(input_s.splitlines())) == "13140"
 
 
 def main():
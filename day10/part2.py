@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+import sys
+from typing import Iterable, Optional
 
 from aoc import AOC
-from dotenv import load_dotenv
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
+sys.path.append(HERE)
+from part1 import iter_cycles
 
 
 def get_screen(active: list[int], width: int, lines: int) -> str:
@@ -55,6 +55,18 @@ def tick(
     raise ValueError(f"Unknown operation {operation}")
 
 
+def compute_lines(lines: Iterable[str]) -> str:
+    width, height = 40, 6
+    screen = bytearray(b"." * (width * height))
+    for cycle, x in iter_cycles(lines):
+        pixel = cycle - 1
+        if pixel < len(screen) and x - 1 <= pixel % width <= x + 1:
+            screen[pixel] = ord("#")
+
+    rows = (screen[i : i + width].decode() for i in range(0, len(screen), width))
+    return "\n".join(rows)
+
+
 def compute(input_str: str) -> str:
     actions = parse(input_str)
     registers = dict(x=1)
@@ -84,6 +96,7 @@ def test() -> None:
 ######......######......######......####
 #######.......#######.......#######....."""
     assert compute(input_s) == out
+    assert compute_lines(iter(input_s.splitlines())) == out
 
 
 def main():
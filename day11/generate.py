@@ -0,0 +1,64 @@
+"""
+Day 11: Monkey in the Middle - Input generator
+https://adventofcode.com/2022/day/11
+
+'scale' multiplies the number of monkeys of the example input. Every monkey
+tests against its own prime and throws to two other monkeys. One in four
+monkeys squares the worry level, like in the example, nobody throws to them so
+the worry levels of part 1 stay small.
+"""
+from __future__ import annotations
+
+import random
+
+
+def get_primes(count: int) -> list[int]:
+    primes: list[int] = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    count = 4 * scale
+    primes = get_primes(count)
+    rng.shuffle(primes)
+
+    squaring = {i for i in range(count) if i % 4 == 2}
+    monkeys = []
+    for i, prime in enumerate(primes):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        if i in squaring:
+            operation = "old * old"
+        elif rng.random() < 0.5:
+            operation = f"old + {rng.randint(1, 8)}"
+        else:
+            operation = f"old * {rng.randint(2, 19)}"
+        success, fail = rng.sample(
+            [j for j in range(count) if j != i and j not in squaring], 2
+        )
+        monkeys.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {prime}\n"
+            f"    If true: throw to monkey {success}\n"
+            f"    If false: throw to monkey {fail}"
+        )
+    return "\n\n".join(monkeys) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute, parse_monkey
+
+    input_s = generate(2)
+    monkeys = [parse_monkey(monkey) for monkey in input_s.split("\n\n")]
+    assert len(monkeys) == 8
+    # every monkey throws to another monkey
+    for i, (_, _, get_next) in enumerate(monkeys):
+        assert {get_next(0), get_next(1)} <= set(range(8)) - {i}
+    assert int(compute(input_s)) > 0
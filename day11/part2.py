@@ -3,12 +3,10 @@ from __future__ import annotations
 import os
 from typing import Callable
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
+from aoc_tools import find_cycle
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 functions: dict[str, Callable[[int, int], int]] = {
@@ -58,6 +56,52 @@ def parse_monkey(
     return items, operation, get_next
 
 
+Monkey = tuple[list[int], Callable[[int], int], tuple[int, int, int]]
+
+
+def count_item_inspections(
+    monkeys: list[Monkey], magic: int, monkey: int, worry: int, rounds: int
+) -> list[int]:
+    """
+    Inspections per monkey of a single item in 'rounds' rounds.
+
+    An item moves independently of the others, its monkey and its worry level
+    at the start of a round determine the rest, so the rounds repeat once
+    that pair does. Only the rounds up to the first repetition are played.
+    """
+    # every inspecting monkey in order, and where each round starts in there
+    inspected: list[int] = []
+    round_starts = [0]
+
+    def play_round(state: tuple[int, int]) -> tuple[int, int]:
+        monkey, worry = state
+        while True:
+            inspected.append(monkey)
+            _, operation, (divisor, success, fail) = monkeys[monkey]
+            worry = operation(worry) % magic
+            next_monkey = success if worry % divisor == 0 else fail
+            # monkeys after this one still have their turn in this round
+            if next_monkey < monkey:
+                round_starts.append(len(inspected))
+                return next_monkey, worry
+            monkey = next_monkey
+
+    cycle = find_cycle((monkey, worry), play_round, lambda state: state, rounds)
+    inspections = [0 for _ in monkeys]
+    if cycle is None:
+        for monkey in inspected:
+            inspections[monkey] += 1
+        return inspections
+
+    start, length = cycle
+    cycles, rest = divmod(rounds - start, length)
+    for monkey in inspected[: round_starts[start + rest]]:
+        inspections[monkey] += 1
+    for monkey in inspected[round_starts[start] : round_starts[start + length]]:
+        inspections[monkey] += cycles
+    return inspections
+
+
 def compute(input_str: str) -> str:
     monkeys = [parse_monkey(string) for string in input_str.split("\n\n")]
     magic = 1
@@ -67,19 +111,40 @@ def compute(input_str: str) -> str:
     inspections = [0 for _ in enumerate(monkeys)]
     rounds = 10000
 
-    for _ in range(rounds):
-        for i, (items, operation, get_next) in enumerate(monkeys):
-            monkeys[i] = ([], operation, get_next)
-            inspections[i] += len(items)
-            for item in items:
-                worry = operation(item) % magic
-                next_monkey = get_next[1] if worry % get_next[0] == 0 else get_next[2]
-                monkeys[next_monkey][0].append(worry)
+    for i, (items, _, _) in enumerate(monkeys):
+        for item in items:
+            counts = count_item_inspections(monkeys, magic, i, item, rounds)
+            inspections = [a + b for a, b in zip(inspections, counts)]
 
     x = sorted(enumerate(inspections), key=lambda a: a[1])
     return str(x[-1][1] * x[-2][1])
 
 
+def test_count_item_inspections() -> None:
+    with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
+        monkeys = [parse_monkey(string) for string in file.read().split("\n\n")]
+    magic = 23 * 19 * 13 * 17
+
+    # every item on its own, compared with playing all of the rounds
+    rounds = 1000
+    items = [list(items) for items, _, _ in monkeys]
+    inspections = [0 for _ in monkeys]
+    for _ in range(rounds):
+        for i, (_, operation, (divisor, success, fail)) in enumerate(monkeys):
+            inspections[i] += len(items[i])
+            for item in items[i]:
+                worry = operation(item) % magic
+                items[success if worry % divisor == 0 else fail].append(worry)
+            items[i] = []
+
+    counts = [
+        count_item_inspections(monkeys, magic, i, item, rounds)
+        for i, (items, _, _) in enumerate(monkeys)
+        for item in items
+    ]
+    assert [sum(column) for column in zip(*counts)] == inspections
+
+
 def test() -> None:
     with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
         input_s = file.read()
@@ -88,7 +153,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part)
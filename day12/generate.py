@@ -0,0 +1,41 @@
+"""
+Day 12: Hill Climbing Algorithm - Input generator
+https://adventofcode.com/2022/day/12
+
+'scale' multiplies the width and the height of the heightmap of the example
+input. The heights rise along a snake through every row, from 'S' in the top
+left corner to 'E', so 'E' is always reachable.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    rows, cols = 5 * scale, 8 * scale
+    cells = rows * cols
+    snake = [
+        (i, j if i % 2 == 0 else cols - 1 - j) for i in range(rows) for j in range(cols)
+    ]
+    # the heightmap is mirrored at random, 'S' is in one of the corners
+    flip_rows, flip_cols = rng.random() < 0.5, rng.random() < 0.5
+
+    grid = [[""] * cols for _ in range(rows)]
+    for k, (i, j) in enumerate(snake):
+        if k == 0:
+            char = "S"
+        elif k == cells - 1:
+            char = "E"
+        else:
+            char = chr(ord("a") + (k - 1) * 25 // (cells - 3))
+        grid[rows - 1 - i if flip_rows else i][cols - 1 - j if flip_cols else j] = char
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute, parse
+
+    input_s = generate(2)
+    (start, end), heights = parse(input_s)
+    assert (heights.height, heights.width) == (10, 16)
+    assert start in (0, 15, 144, 159) and end != start
+    assert int(compute(input_s)) > 0
@@ -0,0 +1,45 @@
+"""
+Day 13: Distress Signal - Input generator
+https://adventofcode.com/2022/day/13
+
+'scale' multiplies the number of packet pairs of the example input.
+"""
+from __future__ import annotations
+
+import random
+
+MAX_DEPTH = 4
+
+
+def generate_packet(rng: random.Random, depth: int = 0) -> list:
+    packet: list = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < MAX_DEPTH and rng.random() < 0.3:
+            packet.append(generate_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+    return packet
+
+
+def packet_to_str(packet: list | int) -> str:
+    if isinstance(packet, int):
+        return str(packet)
+    return "[" + ",".join(map(packet_to_str, packet)) + "]"
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    pairs = [
+        f"{packet_to_str(generate_packet(rng))}\n{packet_to_str(generate_packet(rng))}"
+        for _ in range(8 * scale)
+    ]
+    return "\n\n".join(pairs) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import parse
+
+    input_s = generate(10)
+    pairs = parse(input_s.strip())
+    assert len(pairs) == 80
+    assert all(packet_to_str(a) + "\n" + packet_to_str(b) in input_s for a, b in pairs)
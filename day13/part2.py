@@ -4,13 +4,9 @@ import json
 import os
 from functools import cmp_to_key
 
-from dotenv import load_dotenv
-
-from aoc import AOC
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def parse_list(packet_str: str, offset: int = 0) -> tuple[list, int]:
@@ -152,7 +148,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part)
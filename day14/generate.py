@@ -0,0 +1,40 @@
+"""
+Day 14: Regolith Reservoir - Input generator
+https://adventofcode.com/2022/day/14
+
+'scale' multiplies the number of rock paths and the size of the cave of the
+example input. The paths are placed below and around the sand source at 500,0.
+"""
+import random
+
+
+def generate_path(rng: random.Random, scale: int) -> str:
+    x = 500 + rng.randint(-10 * scale, 10 * scale)
+    y = rng.randint(2, 10 * scale)
+    points = [f"{x},{y}"]
+    horizontal = rng.random() < 0.5
+    for _ in range(rng.randint(1, 4)):
+        if horizontal:
+            x = max(x + rng.choice([-1, 1]) * rng.randint(1, 6), 1)
+        else:
+            y += rng.randint(1, 6)
+        points.append(f"{x},{y}")
+        horizontal = not horizontal
+    return " -> ".join(points)
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    paths = [generate_path(rng, scale) for _ in range(2 * scale)]
+    return "\n".join(paths) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import parse_vector
+
+    input_s = generate(10)
+    vectors = [parse_vector(line) for line in input_s.splitlines()]
+    assert len(vectors) == 20
+    for vector in vectors:
+        for (x0, y0), (x1, y1) in zip(vector, vector[1:]):
+            assert x0 == x1 or y0 == y1
@@ -3,13 +3,9 @@ from __future__ import annotations
 import os
 from enum import Enum
 
-from dotenv import load_dotenv
-
-from aoc import AOC
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 class Terrain(Enum):
@@ -164,7 +160,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
@@ -1,41 +1,14 @@
 from __future__ import annotations
 
 import os
-from enum import Enum
 
-from dotenv import load_dotenv
-
-from aoc import AOC
+from aoc import AOC, get_api_token
+from aoc_tools import Grid
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
-
-
-class Terrain(Enum):
-    AIR = "."
-    ROCK = "#"
-    SAND = "o"
-    ORIGIN = "+"
-
-
-def terrain_to_str(terrain: list[list[Terrain]], floor: int) -> str:
-    lines = []
-    left = len(terrain[0])
-    for row in terrain:
-        line = ""
-        l, r = None, None
-        for i, cell in enumerate(row):
-            line += cell.value
-            if cell is not Terrain.AIR and l is None:
-                l = i
-        if l is not None and l < left:
-            left = l
-        lines.append(line)
-    while len(lines) < floor + 1:
-        lines.append("".join([str(Terrain.AIR.value) for _ in enumerate(terrain[0])]))
-    lines[floor] = "".join([str(Terrain.ROCK.value) for _ in enumerate(terrain[0])])
-    return "\n".join(line[left:] for line in lines)
+
+AIR, ROCK, SAND, ORIGIN = map(ord, ".#o+")
+SOURCE = (500, 0)
 
 
 def parse_vector(input_str: str) -> list[tuple[int, int]]:
@@ -47,122 +20,61 @@ def parse_vector(input_str: str) -> list[tuple[int, int]]:
     return vector
 
 
-def set_terrain(
-    terrain: list[list[Terrain]], col: int, row: int, kind: Terrain, default=Terrain.AIR
-) -> list[list[Terrain]]:
-    for row_i, _ in enumerate(terrain):
-        while len(terrain[row_i]) <= col:
-            terrain[row_i].append(default)
-
-    while len(terrain) <= row:
-        terrain.append([default for _ in range(col + 1)])
-
-    terrain[row][col] = kind
+def parse(input_str: str) -> tuple[Grid, int]:
+    """
+    The cave down to the floor and the index of the sand source.
 
-    return terrain
-
-
-def gen_terrain(vectors: list[list[tuple[int, int]]]) -> list[list[Terrain]]:
-    terrain = []
-
-    for vector in vectors:
-        if len(vector) == 1:
-            terrain = set_terrain(terrain, *vector[0], Terrain.ROCK)
-
-        i = 0
-        while i + 1 < len(vector):
-            a, b = sorted(vector[i : i + 2])
-
-            if a[0] == b[0]:
-                low, high = a[1], b[1]
-                p = [(a[0], _j) for _j in range(low, high + 1)]
-            else:
-                low, high = a[0], b[0]
-                p = [(_i, a[1]) for _i in range(low, high + 1)]
-
-            for cord in p:
-                terrain = set_terrain(terrain, *cord, Terrain.ROCK)
-            # print(terrain_to_str(terrain))
-            i += 1
-
-    return terrain
-
-
-def parse(input_str) -> tuple[list[list[Terrain]], int]:
+    The sand piles up to a triangle below the source, the grid is just wide
+    enough to hold it, so falling sand never leaves the grid.
+    """
     vectors = list(map(parse_vector, input_str.splitlines()))
-    floor = max(max(r for _, r in vector) for vector in vectors) + 2
-    terrain = gen_terrain(vectors)
-    terrain = set_terrain(terrain, 500, 0, Terrain.ORIGIN)
-
-    return terrain, floor
-
-
-def simulate_sand(
-    terrain: list[list[Terrain]], sand: list[tuple[int, int]], floor: int
-) -> tuple[list[list[Terrain]], list[tuple[int, int]]]:
-
-    moving_sand: list[tuple[int, int]] = []
-    for col, row in sorted(
-        sorted(sand, key=lambda a: a[0]), key=lambda a: a[1], reverse=True
-    ):
-        row_below = row + 1
-        for row_i, _ in enumerate(terrain):
-            while len(terrain[row_i]) <= col + 1:
-                terrain[row_i].append(Terrain.AIR)
-
-        while len(terrain) <= row_below:
-            terrain.append([Terrain.AIR for _ in range(col + 2)])
-
-        # floor
-        if row_below >= floor:
-            terrain[row][col] = Terrain.SAND
-            continue
-
-        # below
-        if terrain[row_below][col] == Terrain.AIR:
-            terrain[row][col] = Terrain.AIR
-            terrain[row_below][col] = Terrain.SAND
-            moving_sand.append((col, row_below))
-            continue
-
-        # below left
-        if terrain[row_below][col - 1] == Terrain.AIR:
-            terrain[row][col] = Terrain.AIR
-            terrain[row_below][col - 1] = Terrain.SAND
-            moving_sand.append((col - 1, row_below))
-            continue
-
-        # below right
-        if terrain[row_below][col + 1] == Terrain.AIR:
-            terrain[row][col] = Terrain.AIR
-            terrain[row_below][col + 1] = Terrain.SAND
-            moving_sand.append((col + 1, row_below))
-            continue
-
-        terrain[row][col] = Terrain.SAND
-
-    return terrain, moving_sand
+    points = [point for vector in vectors for point in vector]
+    floor = max(y for _, y in points) + 2
+    left = min(min(x for x, _ in points), SOURCE[0] - floor) - 1
+    right = max(max(x for x, _ in points), SOURCE[0] + floor) + 1
+
+    grid = Grid(right - left + 1, floor + 1, AIR)
+    for col in range(grid.width):
+        grid[floor, col] = ROCK
+    for vector in vectors:
+        for (x0, y0), (x1, y1) in zip(vector, vector[1:]):
+            for y in range(min(y0, y1), max(y0, y1) + 1):
+                for x in range(min(x0, x1), max(x0, x1) + 1):
+                    grid[y, x - left] = ROCK
+    source = grid.index(SOURCE[1], SOURCE[0] - left)
+    grid.cells[source] = ORIGIN
+    return grid, source
+
+
+def pour_sand(grid: Grid, source: int) -> int:
+    """
+    Pours sand until it blocks the source, returns the units of sand at rest.
+
+    The path of the last unit is kept, the next unit starts falling from the
+    last position of the path instead of the source.
+    """
+    width = grid.width
+    cells = grid.cells
+    path = [source]
+    rested = 0
+    while path:
+        index = path[-1]
+        for below in (index + width, index + width - 1, index + width + 1):
+            if cells[below] == AIR:
+                path.append(below)
+                break
+        else:
+            cells[index] = SAND
+            path.pop()
+            rested += 1
+    return rested
 
 
 def compute(input_str: str) -> str:
-    terrain, floor = parse(input_str)
-    print(floor)
-    print(terrain_to_str(terrain, floor))
-
-    sand = []
-    i = 0
-    while i < 50000:
-        sand.append((500, 0))
-        i += 1
-
-        terrain, sand = simulate_sand(terrain, sand, floor)
-        # print(terrain_to_str(terrain))
-
-        print(len(sand))
-        if len(sand) <= 0:
-            break
-    print(terrain_to_str(terrain, floor))
-    return str(i - len(sand))
+    grid, source = parse(input_str)
+    rested = pour_sand(grid, source)
+    print(grid)
+    return str(rested)
 
 
 def test_parse_vector() -> None:
@@ -181,7 +93,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
@@ -0,0 +1,77 @@
+"""
+Day 15: Beacon Exclusion Zone - Input generator
+https://adventofcode.com/2022/day/15
+
+'scale' multiplies the number of sensors of the example input. Coordinates span
+the range of the real input. Like in the real input, the sensors cover the
+whole square up to 'limit' except the distress beacon.
+"""
+import random
+
+LIMIT = 4000000
+# sensors which enclose the distress beacon, one per diagonal direction
+ENCLOSING = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def sensor_line(sensor: tuple[int, int], beacon: tuple[int, int]) -> str:
+    return (
+        f"Sensor at x={sensor[0]}, y={sensor[1]}: "
+        f"closest beacon is at x={beacon[0]}, y={beacon[1]}"
+    )
+
+
+def generate(scale: int = 1, seed: int = 0, limit: int = LIMIT) -> str:
+    rng = random.Random(seed)
+    distress = rng.randint(0, limit), rng.randint(0, limit)
+
+    # a sensor at distress + (limit, limit) with the radius 2 * limit - 1 covers
+    # every cell of the box between both except the distress beacon, the four
+    # boxes together cover the square wherever the distress beacon is
+    lines = []
+    for sign_x, sign_y in ENCLOSING:
+        sensor = distress[0] + sign_x * limit, distress[1] + sign_y * limit
+        beacon = distress[0] + sign_x, distress[1]
+        lines.append(sensor_line(sensor, beacon))
+
+    # more sensors which don't reach the distress beacon
+    while len(lines) < 14 * scale:
+        x, y = rng.randint(0, limit), rng.randint(0, limit)
+        dist_distress = abs(x - distress[0]) + abs(y - distress[1])
+        if dist_distress < 2:
+            continue
+        dist = rng.randint(1, min(dist_distress - 1, limit // 4 or 1))
+        dx = rng.randint(-dist, dist)
+        dy = rng.choice([-1, 1]) * (dist - abs(dx))
+        lines.append(sensor_line((x, y), (x + dx, y + dy)))
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import parse
+
+    input_s = generate(10)
+    assert len(parse(input_s)) == 140
+
+
+def test_generate_distress() -> None:
+    from aoc_tools import manhattan_dist
+    from part2 import compute, parse
+
+    limit = 20
+    for seed in range(5):
+        input_s = generate(2, seed, limit)
+        sensors = [
+            (sensor[:2], manhattan_dist(sensor[:2], sensor[2:]))
+            for sensor in parse(input_s)
+        ]
+        # (row, column) as parsed by part 2
+        uncovered = [
+            (row, column)
+            for row in range(limit + 1)
+            for column in range(limit + 1)
+            if all(manhattan_dist((row, column), s) > r for s, r in sensors)
+        ]
+        assert len(uncovered) == 1
+        row, column = uncovered[0]
+        assert compute(input_s, limit) == str(column * 4000000 + row)
@@ -2,14 +2,12 @@ from __future__ import annotations
 
 import os
 
-from dotenv import load_dotenv
 from tqdm import tqdm
 
+from aoc import AOC, get_api_token
 from aoc_tools import manhattan_dist
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def get_row_coverage(
@@ -92,7 +90,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
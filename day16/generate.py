@@ -0,0 +1,56 @@
+"""
+Day 16: Proboscidea Volcanium - Input generator
+https://adventofcode.com/2022/day/16
+
+'scale' multiplies the number of valves of the example input, up to the 676
+two letter names. Like in the real input a quarter of the valves has a flow
+rate, the runtime grows exponentially with the number of these valves.
+"""
+from __future__ import annotations
+
+import random
+import string
+
+MAX_VALVES = 26 * 26
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    count = min(10 * scale, MAX_VALVES)
+    names = [a + b for a in string.ascii_uppercase for b in string.ascii_uppercase]
+    names = ["AA"] + rng.sample(names[1:], count - 1)
+
+    # a random spanning tree keeps every valve reachable, plus a few loops
+    tunnels: list[set[str]] = [set() for _ in names]
+    for i in range(1, count):
+        j = rng.randrange(i)
+        tunnels[i].add(names[j])
+        tunnels[j].add(names[i])
+    for _ in range(count // 4):
+        i, j = rng.sample(range(count), 2)
+        tunnels[i].add(names[j])
+        tunnels[j].add(names[i])
+
+    with_flow = set(rng.sample(range(1, count), max(count // 4, 1)))
+    lines = []
+    for i, name in enumerate(names):
+        rate = rng.randint(1, 25) if i in with_flow else 0
+        targets = sorted(tunnels[i])
+        if len(targets) > 1:
+            tunnel = "tunnels lead to valves"
+        else:
+            tunnel = "tunnel leads to valve"
+        lines.append(
+            f"Valve {name} has flow rate={rate}; {tunnel} {', '.join(targets)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def test_generate() -> None:
+    from day16.part1 import parse
+
+    input_s = generate(10)
+    valves = parse(input_s)
+    assert len(valves) == 100
+    assert valves["AA"][0] == 0
+    assert sum(1 for rate, _ in valves.values() if rate > 0) == 25
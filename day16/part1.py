@@ -7,18 +7,17 @@ from __future__ import annotations
 import os
 import re
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
+from instrument import count, spanned
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 Tunnel = tuple[str, int]
 Valve = tuple[int, list[Tunnel]]
 Valves = dict[str, Valve]
 
 
+@spanned()
 def parse(input_str: str) -> dict:
     patter = re.compile(
         "^Valve (.{2}) has flow rate=([0-9]+); tunnel(s)? lead(s)? to valve(s)? (.*)$"
@@ -69,6 +68,7 @@ def optimize_valve(valve: str, valves: Valves) -> Valve:
     return tmp[0], new_tunnels
 
 
+@spanned()
 def optimize_valves(valves: Valves, start="AA") -> Valves:
     new_valves = {k: v for k, v in valves.items()}
 
@@ -90,6 +90,7 @@ def max_pressure_single_path(paths: list[tuple[int, frozenset[str]]]) -> int:
     return max(p[0] for p in paths)
 
 
+@spanned()
 def max_releasable_pressure(
     start: str, time: int, valves: Valves, intermediate_paths=False
 ) -> list[tuple[int, frozenset[str]]]:
@@ -98,6 +99,7 @@ def max_releasable_pressure(
     max_flow = 0
     max_open_valves = len([v for v in valves.values() if v[0] > 0])
     paths: set[tuple[int, frozenset[str]]] = set()
+    expanded = visited_hits = pruned = 0
 
     while to_visit:
         remaining, valve, flow, open_valves = to_visit.pop()
@@ -118,15 +120,18 @@ def max_releasable_pressure(
             continue
 
         if (remaining, valve, flow, frozenset(open_valves)) in visited:
+            visited_hits += 1
             continue
 
         max_flow_unopened = sum(
             f for k, (f, _) in valves.items() if k not in open_valves
         )
         if flow + remaining * max_flow_unopened < max_flow:
+            pruned += 1
             continue
 
         visited.add((remaining, valve, flow, frozenset(open_valves)))
+        expanded += 1
 
         # print(remaining, valve, flow, sorted(open_valves))
         rate, tunnels = valves.get(valve)
@@ -145,6 +150,9 @@ def max_releasable_pressure(
                 continue
             to_visit.append((remaining - cost, dest, flow, open_valves))
 
+    count("states_expanded", expanded)
+    count("visited_hits", visited_hits)
+    count("states_pruned", pruned)
     return list(paths)
 
 
@@ -167,7 +175,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part)
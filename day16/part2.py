@@ -6,14 +6,11 @@ from __future__ import annotations
 
 import os
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 from day16.part1 import max_releasable_pressure, optimize_valves, parse
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def max_pressure_multi_path(paths: list[tuple[int, frozenset[str]]]) -> int:
@@ -58,7 +55,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part)
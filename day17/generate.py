@@ -0,0 +1,18 @@
+"""
+Day 17: Pyroclastic Flow - Input generator
+https://adventofcode.com/2022/day/17
+
+'scale' multiplies the length of the jet pattern of the example input.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "".join(rng.choices("<>", k=40 * scale)) + "\n"
+
+
+def test_generate() -> None:
+    input_s = generate(10)
+    assert len(input_s.strip()) == 400
+    assert set(input_s.strip()) == {"<", ">"}
@@ -3,13 +3,10 @@ from __future__ import annotations
 import os
 from enum import Enum
 
-from dotenv import load_dotenv
-
-from aoc import AOC
+from aoc import AOC, get_api_token
+from aoc_tools import extrapolate
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 class Terrain(Enum):
@@ -38,6 +35,33 @@ input_rocks = """\
 ##
 """
 
+SHAPES = [
+    [(0, 0), (0, 1), (0, 2), (0, 3)],  # line
+    [(0, 1), (1, 0), (1, 1), (1, 2), (2, 1)],  # cross
+    [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)],  # L
+    [(0, 0), (1, 0), (2, 0), (3, 0)],  # I
+    [(0, 0), (0, 1), (1, 0), (1, 1)],  # square
+]
+# rows below the highest rock in a column which are kept
+DEPTH = 50
+
+
+class Chamber:
+    """Settled rocks and how far the rock and jet patterns have been used."""
+
+    solid: set[tuple[int, int]]
+    col_floor: list[int]
+    rocks: int = 0
+    jet: int = 0
+
+    def __init__(self, width: int = 7) -> None:
+        self.solid = set()
+        self.col_floor = [-1 for _ in range(width)]
+
+    @property
+    def height(self) -> int:
+        return max(self.col_floor) + 1
+
 
 def chamber_to_str(
     solid: set[tuple[int, int]], falling: list[list[tuple[int, int]]], width: int
@@ -71,7 +95,7 @@ def make_solid(
     for field in rock:
         if field in solid:
             print(f"ups? {field}")
-        col_floor[field[1]] = field[0]
+        col_floor[field[1]] = max(col_floor[field[1]], field[0])
         solid.add(field)
     return solid, col_floor
 
@@ -128,46 +152,44 @@ def spawn_rock(
     return [(row + offset_row, col + offset_col) for row, col in shape]
 
 
+def drop_rock(chamber: Chamber, actions: str) -> Chamber:
+    """Lets the next rock fall until it comes to rest."""
+    width = len(chamber.col_floor)
+    falling = [spawn_rock(chamber.solid, SHAPES[chamber.rocks % len(SHAPES)])]
+    chamber.rocks += 1
+    while falling:
+        chamber.solid, falling, chamber.col_floor = simulate_chamber(
+            actions[chamber.jet], chamber.solid, falling, chamber.col_floor, width
+        )
+        chamber.jet = (chamber.jet + 1) % len(actions)
+
+    min_floor = chamber.height - 1
+    chamber.solid = {f for f in chamber.solid if f[0] > min_floor - DEPTH}
+    return chamber
+
+
+def chamber_fingerprint(chamber: Chamber) -> tuple:
+    """Next rock, next jet and the surface of the chamber relative to its top."""
+    top = max(chamber.col_floor)
+    surface = tuple(top - floor for floor in chamber.col_floor)
+    return chamber.rocks % len(SHAPES), chamber.jet, surface
+
+
+def tower_height(input_str: str, rocks: int) -> int:
+    """Height of the tower after 'rocks' rocks, extrapolated once it repeats."""
+    actions = input_str.strip()
+    (height,) = extrapolate(
+        Chamber(),
+        lambda chamber: drop_rock(chamber, actions),
+        chamber_fingerprint,
+        lambda chamber: (chamber.height,),
+        rocks,
+    )
+    return height
+
+
 def compute(input_str: str) -> str:
-    import cProfile
-
-    with cProfile.Profile() as pr:
-        shapes = [
-            [(0, 0), (0, 1), (0, 2), (0, 3)],  # line
-            [(0, 1), (1, 0), (1, 1), (1, 2), (2, 1)],  # cross
-            [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)],  # L
-            [(0, 0), (1, 0), (2, 0), (3, 0)],  # I
-            [(0, 0), (0, 1), (1, 0), (1, 1)],  # square
-        ]
-
-        shapes_index = 0
-        actions = input_str.strip()
-        solid = set()
-        falling = []
-        i = 0
-        width = 7
-        col_floor = [-1 for _ in range(width)]
-        target = 1_000_000_000_000
-
-        while shapes_index < target + 1:
-            if len(falling) < 1:
-                if shapes_index % 10_000 == 0:
-                    print(f"{shapes_index}/{target} ({shapes_index/target:.2%})")
-                    pass
-                rock = spawn_rock(solid, shapes[shapes_index % len(shapes)])
-                falling.append(rock)
-                shapes_index += 1
-
-            solid, falling, col_floor = simulate_chamber(
-                actions[i % len(actions)], solid, falling, col_floor, width
-            )
-            min_floor = max(col_floor)
-            solid = {f for f in solid if f[0] > min_floor - 50}
-
-            i += 1
-
-        pr.print_stats()
-        return str(max(r for r, _ in solid) + 1)
+    return str(tower_height(input_str, 2022))
 
 
 def test() -> None:
@@ -177,13 +199,6 @@ def test() -> None:
 
 
 def test_spawn_rock_simple() -> None:
-    shapes = [
-        [(0, 0), (0, 1), (0, 2), (0, 3)],  # line
-        [(0, 1), (1, 0), (1, 1), (1, 2), (2, 1)],  # cross
-        [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)],  # L
-        [(0, 0), (1, 0), (2, 0), (3, 0)],  # I
-        [(0, 0), (0, 1), (1, 0), (1, 1)],  # square
-    ]
     rocks = [
         [(3, 2), (3, 3), (3, 4), (3, 5)],
         [(3, 3), (4, 2), (4, 3), (4, 4), (5, 3)],
@@ -191,12 +206,25 @@ def test_spawn_rock_simple() -> None:
         [(3, 2), (4, 2), (5, 2), (6, 2)],
         [(3, 2), (3, 3), (4, 2), (4, 3)],
     ]
-    for shape, rock in zip(shapes, rocks):
+    for shape, rock in zip(SHAPES, rocks):
         assert spawn_rock(set(), shape) == rock
 
 
+def test_drop_rock() -> None:
+    with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
+        actions = file.read().strip()
+
+    # the simulation without extrapolation agrees with the extrapolated heights
+    chamber = Chamber()
+    heights = [0]
+    for _ in range(300):
+        heights.append(drop_rock(chamber, actions).height)
+    for rocks in (1, 10, 150, 300):
+        assert tower_height(actions, rocks) == heights[rocks]
+
+
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import os
+
+from aoc import AOC, get_api_token
+
+from part1 import tower_height
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def compute(input_str: str) -> str:
+    return str(tower_height(input_str, 1_000_000_000_000))
+
+
+def test() -> None:
+    with open(os.path.join(HERE, "test.txt"), encoding="utf-8") as file:
+        input_s = file.read()
+    assert compute(input_s) == "1514285714288"
+
+
+def main():
+    aoc = AOC(get_api_token(), HERE)
+    year, day, part = 2022, 0, 0
+
+    aoc.run_part(year, day, part, compute)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Day 18: Boiling Boulders - Input generator
+https://adventofcode.com/2022/day/18
+
+'scale' multiplies the number of cubes of the example input. The cubes fill a
+third of their bounding box like in the real input, which leaves air pockets.
+"""
+import math
+import random
+
+DENSITY = 0.35
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    count = 13 * scale
+    size = math.ceil((count / DENSITY) ** (1 / 3))
+    cubes = rng.sample(range(size**3), count)
+    lines = [f"{c % size},{c // size % size},{c // size // size}" for c in cubes]
+    return "\n".join(lines) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute, parse
+
+    input_s = generate(10)
+    assert len(parse(input_s)) == 130
+    assert 0 < int(compute(input_s)) <= 130 * 6
@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import os
+from typing import Iterator
 
-from dotenv import load_dotenv
-
-from aoc import AOC
+from aoc import AOC, get_api_token
+from aoc_tools import UNREACHED, bfs
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def parse(input_str: str) -> set[tuple[int, int, int]]:
@@ -91,25 +89,36 @@ def form_air2(
     xyz_min: tuple[int, int, int],
     xyz_max: tuple[int, int, int],
 ) -> set[tuple[int, int, int]]:
-    air = set()
-
-    to_visit = [cube]
-
-    while len(to_visit) > 0:
-        node = to_visit.pop()
-        air.add(node)
-        for (x, y, z) in get_neighbors(node):
-            if (x, y, z) in air or (x, y, z) in cubes:
-                continue
-            if x < xyz_min[0] or y < xyz_min[1] or z < xyz_min[2]:
-                continue
-            if x > xyz_max[0] or y > xyz_max[1] or z > xyz_max[2]:
-                continue
-            if (x, y, z) in to_visit:
-                continue
-
-            to_visit.append((x, y, z))
+    """Air connected to 'cube' inside of the box, found by a flood fill."""
+    x_min, y_min, z_min = xyz_min
+    size_x, size_y, size_z = (high - low + 1 for high, low in zip(xyz_max, xyz_min))
+    size = size_x * size_y * size_z
+    # a state is the index of (x, y, z) in the box, z varies fastest
+    solid = bytearray(size)
+    for x, y, z in cubes:
+        if all(low <= c <= high for c, low, high in zip((x, y, z), xyz_min, xyz_max)):
+            solid[((x - x_min) * size_y + y - y_min) * size_z + z - z_min] = 1
+
+    steps = (size_y * size_z, size_z, 1)
+
+    def neighbors(state: int) -> Iterator[int]:
+        rest, z = divmod(state, size_z)
+        x, y = divmod(rest, size_y)
+        for c, size_c, step in zip((x, y, z), (size_x, size_y, size_z), steps):
+            if c > 0 and not solid[state - step]:
+                yield state - step
+            if c < size_c - 1 and not solid[state + step]:
+                yield state + step
 
+    x, y, z = cube
+    start = ((x - x_min) * size_y + y - y_min) * size_z + z - z_min
+    result = bfs(size, [start], neighbors)
+    air = set()
+    for state, distance in enumerate(result.dist):
+        if distance != UNREACHED:
+            rest, z = divmod(state, size_z)
+            x, y = divmod(rest, size_y)
+            air.add((x + x_min, y + y_min, z + z_min))
     return air
 
 
@@ -199,7 +208,7 @@ def test_neighbors() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
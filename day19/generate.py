@@ -0,0 +1,32 @@
+"""
+Day 19: Not Enough Minerals - Input generator
+https://adventofcode.com/2022/day/19
+
+'scale' multiplies the number of blueprints of the example input. The costs
+stay in the ranges of the real input.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    blueprints = []
+    for i in range(1, 2 * scale + 1):
+        blueprints.append(
+            f"Blueprint {i}:"
+            f" Each ore robot costs {rng.randint(2, 4)} ore."
+            f" Each clay robot costs {rng.randint(2, 4)} ore."
+            f" Each obsidian robot costs {rng.randint(2, 4)} ore"
+            f" and {rng.randint(5, 20)} clay."
+            f" Each geode robot costs {rng.randint(2, 4)} ore"
+            f" and {rng.randint(5, 20)} obsidian."
+        )
+    return "\n".join(blueprints) + "\n"
+
+
+def test_generate() -> None:
+    from day19.part1 import parse
+
+    input_s = generate(10)
+    factories = parse(input_s)
+    assert [factory["id"] for factory in factories] == list(range(1, 21))
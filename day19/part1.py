@@ -3,13 +3,10 @@ from __future__ import annotations
 import os
 from typing import TypedDict
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 from tqdm import tqdm
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 resource_map: dict[str, int] = {
     "ore": 0,
@@ -200,7 +197,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute, test=True)
@@ -0,0 +1,27 @@
+"""
+Day 20: Grove Positioning System - Input generator
+https://adventofcode.com/2022/day/20
+
+'scale' multiplies the length of the file of the example input. The numbers
+are in the range of the real input and contain exactly one 0.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    numbers = [
+        rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(7 * scale - 1)
+    ]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+    return "\n".join(map(str, numbers)) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute
+
+    input_s = generate(10)
+    numbers = input_s.splitlines()
+    assert len(numbers) == 70
+    assert numbers.count("0") == 1
+    compute(input_s)
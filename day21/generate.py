@@ -0,0 +1,91 @@
+"""
+Day 21: Monkey Math - Input generator
+https://adventofcode.com/2022/day/21
+
+'scale' multiplies the number of monkeys of the example input. The monkeys form
+a single expression tree below 'root', 'humn' is one of its leaves. Divisions
+always divide evenly and never by an expression containing 'humn', products
+never multiply by zero and both sides of 'root' are equal, so the value 'humn'
+yells is the unique answer of part 2.
+"""
+from __future__ import annotations
+
+import random
+import string
+
+MAX_VALUE = 10**12
+
+# name, value, contains 'humn'
+Expression = tuple[str, int, bool]
+
+
+def generate_names(rng: random.Random, count: int) -> list[str]:
+    names = {"root", "humn"}
+    while len(names) < count + 2:
+        names.add("".join(rng.choices(string.ascii_lowercase, k=4)))
+    return rng.sample(sorted(names - {"root", "humn"}), count)
+
+
+def combine(
+    rng: random.Random, left: Expression, right: Expression
+) -> tuple[str, int]:
+    """Picks a valid operation for 'left' and 'right' and its result."""
+    _, a, left_humn = left
+    _, b, right_humn = right
+    operations = [("+", a + b), ("-", a - b)]
+    if a != 0 and b != 0 and abs(a * b) < MAX_VALUE:
+        operations.append(("*", a * b))
+    if b != 0 and not right_humn and a % b == 0:
+        operations.append(("/", a // b))
+    return rng.choice(operations)
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    # 'leaves' leaves, 'leaves - 2' operations, the balancing leaf and operation
+    # and 'root'
+    leaves = (15 * scale - 1) // 2
+    names = generate_names(rng, 2 * leaves - 1)
+
+    lines = []
+    expressions: list[Expression] = [("humn", rng.randint(1, 13), True)]
+    for _ in range(leaves - 1):
+        name, value = names.pop(), rng.randint(1, 13)
+        expressions.append((name, value, False))
+    lines.extend(f"{name}: {value}" for name, value, _ in expressions)
+
+    while len(expressions) > 2:
+        i, j = rng.sample(range(len(expressions)), 2)
+        left, right = expressions[i], expressions[j]
+        operation, value = combine(rng, left, right)
+        name = names.pop()
+        lines.append(f"{name}: {left[0]} {operation} {right[0]}")
+        expressions = [e for k, e in enumerate(expressions) if k not in (i, j)]
+        expressions.append((name, value, left[2] or right[2]))
+
+    # balance the side without 'humn' to the value of the side with 'humn'
+    (left, value_left, left_humn), (right, value_right, _) = expressions
+    if left_humn:
+        left, value_left, right, value_right = right, value_right, left, value_left
+    balance, balanced = names.pop(), names.pop()
+    lines.append(f"{balance}: {abs(value_right - value_left)}")
+    operation = "+" if value_right >= value_left else "-"
+    lines.append(f"{balanced}: {left} {operation} {balance}")
+
+    lines.append(f"root: {balanced} + {right}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import parse
+    from part2 import compute
+
+    input_s = generate(10)
+    monkeys = parse(input_s)
+    names = [monkey[0] for monkey in monkeys]
+    assert len(names) == len(set(names)) == 149
+    assert "root" in names and "humn" in names
+
+    humn = next(line for line in input_s.splitlines() if line.startswith("humn:"))
+    assert compute(input_s) == humn.split(" ")[1]
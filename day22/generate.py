@@ -0,0 +1,43 @@
+"""
+Day 22: Monkey Map - Input generator
+https://adventofcode.com/2022/day/22
+
+'scale' multiplies the size of the cube faces and the length of the path of the
+example input. The faces are laid out like in the real input, part 2 expects
+faces of size 50 ('scale' 12.5, so only part 1 is of use for benchmarks).
+"""
+import random
+
+# (row, column) of the faces in units of the face size
+LAYOUT = [(0, 1), (0, 2), (1, 1), (2, 0), (2, 1), (3, 0)]
+WALL_RATIO = 0.1
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = 4 * scale
+    rows = []
+    for row in range(4 * size):
+        columns = [col for r, col in LAYOUT if r == row // size]
+        start, end = min(columns) * size, (max(columns) + 1) * size
+        tiles = rng.choices(".#", [1 - WALL_RATIO, WALL_RATIO], k=end - start)
+        rows.append(" " * start + "".join(tiles))
+    # the path starts on the leftmost open tile of the top row
+    rows[0] = rows[0][:size] + "." + rows[0][size + 1 :]
+
+    path = [str(rng.randint(1, 2 * size))]
+    for _ in range(7 * scale - 1):
+        path.append(rng.choice("LR"))
+        path.append(str(rng.randint(1, 2 * size)))
+
+    return "\n".join(rows) + "\n\n" + "".join(path) + "\n"
+
+
+def test_generate() -> None:
+    from day22.part1 import compute, parse
+
+    input_s = generate(10)
+    (terrain, _), actions = parse(input_s)
+    assert len(terrain) == 160
+    assert len(actions) == 2 * 70 - 1
+    assert int(compute(input_s)) > 0
@@ -3,8 +3,7 @@ from __future__ import annotations
 import os
 
 import pytest
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 from day22.part1 import (
     DOWN,
@@ -18,8 +17,6 @@ from day22.part1 import (
 )
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 Terrain = tuple[list[range], list[range], Solids]
 
@@ -186,7 +183,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
@@ -0,0 +1,24 @@
+"""
+Day 23: Unstable Diffusion - Input generator
+https://adventofcode.com/2022/day/23
+
+'scale' multiplies the width and the height of the scan of the example input,
+about half of the ground is covered by elves.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = 7 * scale
+    rows = ["".join(rng.choices(".#", k=size)) for _ in range(size)]
+    return "\n".join(rows) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import compute, parse
+
+    input_s = generate(5)
+    assert len(input_s.splitlines()) == 35
+    assert len(parse(input_s)) == input_s.count("#")
+    assert int(compute(input_s)) > 0
@@ -11,13 +11,10 @@ from collections import defaultdict
 from typing import Callable
 
 import pytest
-from dotenv import load_dotenv
 
-from aoc import AOC
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 Elf = tuple[int, int]
 Elves = set[Elf]
@@ -169,7 +166,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
@@ -9,9 +9,8 @@ import os
 import sys
 
 import pytest
-from dotenv import load_dotenv
 
-from aoc import AOC
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.dirname(HERE))
@@ -25,9 +24,6 @@ from day23.part1 import (
     parse,
 )
 
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
-
 
 def compute(input_str: str) -> str:
     elves = parse(input_str)
@@ -72,7 +68,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part, compute)
@@ -0,0 +1,38 @@
+"""
+Day 24: Blizzard Basin - Input generator
+https://adventofcode.com/2022/day/24
+
+'scale' multiplies the width and the height of the valley of the example input.
+Like in the real input no vertical blizzard crosses the start or the end column.
+"""
+import random
+
+BLIZZARD_RATIO = 0.6
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    height, width = 4 * scale, 6 * scale
+    rows = ["#." + "#" * width]
+    for _ in range(height):
+        cells = []
+        for col in range(1, width + 1):
+            if rng.random() >= BLIZZARD_RATIO:
+                cells.append(".")
+            elif col in (1, width):
+                cells.append(rng.choice("<>"))
+            else:
+                cells.append(rng.choice("<>^v"))
+        rows.append("#" + "".join(cells) + "#")
+    rows.append("#" * width + ".#")
+    return "\n".join(rows) + "\n"
+
+
+def test_generate() -> None:
+    from day24.part1 import parse
+
+    input_s = generate(5)
+    start, end, _, maxs = parse(input_s)
+    assert start == (0, 1)
+    assert end == (21, 30)
+    assert maxs == (21, 31)
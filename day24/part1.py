@@ -5,22 +5,20 @@ https://adventofcode.com/2022/day/24
 from __future__ import annotations
 
 import math
-import operator
 import os
-from collections import defaultdict, deque
+from collections import defaultdict
+from typing import Iterator
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
+from aoc_tools import UNREACHED, bfs
+from instrument import count, enabled, spanned
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 Position = tuple[int, int]  # row, column
 Blizzards = defaultdict[Position, list[str]]  # (row, column) -> [direction, ...]
-Weather = defaultdict[
-    tuple[int, int, int], list[str]
-]  # (cycle, row, column) -> [direction, ...]
+# 1 where (minute of the blizzard cycle, row, column) is blocked, row by row
+Weather = bytearray
 
 RIGHT, DOWN, LEFT, UP = ">", "v", "<", "^"
 EMPTY, SOLID = ".", "#"
@@ -48,6 +46,7 @@ def print_board(
         print("".join(row))
 
 
+@spanned()
 def parse(input_str: str) -> tuple[Position, Position, Blizzards, Position]:
     lines = input_str.splitlines()
 
@@ -97,85 +96,73 @@ def move_blizzard(
     return row, col
 
 
-def update_blizzards(blizzards: Blizzards, max_row: int, max_col: int) -> Blizzards:
-    new_blizzards: Blizzards = defaultdict(list)
-    for position, directions in blizzards.items():
-        for direction in directions:
-            new_blizzards[move_blizzard(position, direction, max_row, max_col)].append(
-                direction
-            )
-    return new_blizzards
-
-
+@spanned()
 def predict_weather_n(_initial: Blizzards, maxs: tuple[int, int]) -> Weather:
-    max_row, max_col = maxs
-    magic = (max_row - 1) * (max_col - 1)
+    """
+    Cells blocked by a blizzard or a wall in every minute of a blizzard cycle.
 
-    weather: Weather = defaultdict(list)
-    updated = _initial
-    for i in range(magic):
-        weather.update({(i, *k): v for k, v in updated.items()})
-        updated = update_blizzards(updated, max_row, max_col)
+    The blizzards repeat after the lcm of the inner width and height. Each
+    blizzard repeats after the inner width or height alone, so every position
+    it takes is written for all of its minutes of the cycle at once.
+    """
+    max_row, max_col = maxs
+    inner_rows, inner_cols = max_row - 1, max_col - 1
+    cycle = math.lcm(inner_rows, inner_cols)
+    area = (max_row + 1) * (max_col + 1)
+    weather = bytearray(cycle * area)
+    for position, directions in _initial.items():
+        for direction in directions:
+            period = 1 if direction == SOLID else inner_cols
+            if direction in (UP, DOWN):
+                period = inner_rows
+            ones = b"\x01" * (cycle // period)
+            row, col = position
+            for minute in range(period):
+                index = minute * area + row * (max_col + 1) + col
+                weather[index :: period * area] = ones
+                row, col = move_blizzard((row, col), direction, max_row, max_col)
 
     return weather
 
 
+@spanned()
 def find_path_length(
     position: Position,
     target: Position,
     weather: Weather,
-    cycle_length: int,
+    maxs: tuple[int, int],
     time_offset=0,
 ) -> int:
-    max_row = max(blizzard[1] for blizzard in weather)
-    max_col = max(blizzard[2] for blizzard in weather)
-    to_visit: deque[tuple[int, Position]] = deque()
-    to_visit.append((0, position))
-    visited: set[tuple[int, int, int]] = set()
-    while to_visit:
-        length, _position = to_visit.popleft()
-        if _position == target:
-            return length
-
-        # visited.add(((time_offset + length) % cycle_length, _position[0], _position[1]))
-
-        # get possible moves
-        for direction in (0, 1), (1, 0), (0, 0), (0, -1), (-1, 0):
-            new_position: tuple[int, int] = tuple(
-                map(operator.add, _position, direction)
-            )
-            # tuple(p + o for p, o in zip(_position, direction))
-            # new_position = _move(direction, _position)
-
-            # blizzard at position
-            new_time_state = (
-                ((time_offset + length + 1) % cycle_length),
-                *new_position,
-            )
-            if new_time_state in weather:
-                continue
-
-            if new_position[0] < 0 or new_position[0] > max_row:
-                continue
-
-            if new_time_state in visited:
-                continue
-
-            to_visit.append((length + 1, new_position))
-            visited.add(new_time_state)
-
-    return math.inf
+    """Minutes from 'position' to 'target', starting 'time_offset' minutes in."""
+    cols = maxs[1] + 1
+    area = (maxs[0] + 1) * cols
+    size = len(weather)
+    target_cell = target[0] * cols + target[1]
+
+    # a state is the index of (minute of the cycle, row, column) in 'weather'
+    def neighbors(state: int) -> Iterator[int]:
+        following = (state // area + 1) * area % size
+        cell = state % area
+        for offset in (1, cols, 0, -1, -cols):
+            if 0 <= cell + offset < area and not weather[following + cell + offset]:
+                yield following + cell + offset
+
+    start = time_offset * area % size + position[0] * cols + position[1]
+    result = bfs(size, [start], neighbors, lambda state: state % area == target_cell)
+    if enabled():
+        count("states_reached", size - result.dist.count(UNREACHED))
+    distance = result.distance()
+    return math.inf if distance is None else distance
 
 
 def compute(input_str: str) -> str:
     start, end, blizzards, maxs = parse(input_str)
 
-    magic = math.lcm((maxs[0] - 1), (maxs[1] - 1))
     print("predicting weather")
     weather = predict_weather_n(blizzards, maxs)
 
     print("start solving")
-    res = find_path_length(start, end, weather, magic)
+    res = find_path_length(start, end, weather, maxs)
     return str(res)
 
 
@@ -195,7 +182,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part)
@@ -6,8 +6,7 @@ from __future__ import annotations
 
 import os
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 from day24.part1 import (
     parse,
@@ -18,17 +17,15 @@ from day24.part1 import (
 )
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 
 def find_path_length_for_path(
-        path: list[Position], weather: Weather, magic: int
+        path: list[Position], weather: Weather, maxs: tuple[int, int]
 ) -> int:
     distances = []
     for i in range(len(path) - 1):
         start, end = path[i: i + 2]
-        res = find_path_length(start, end, weather, magic, sum(distances))
+        res = find_path_length(start, end, weather, maxs, sum(distances))
         print(f"{start} -> {end}: {res}")
         distances.append(res)
     return sum(distances)
@@ -36,13 +33,12 @@ def find_path_length_for_path(
 
 def compute(input_str: str) -> str:
     start, end, blizzards, maxs = parse(input_str)
-    magic = (maxs[0] - 1) * (maxs[1] - 1)
     path = [start, end, start, end]
     print("predicting weather")
     weather = predict_weather_n(blizzards, maxs)
 
     print("start solving")
-    res = find_path_length_for_path(path, weather, magic)
+    res = find_path_length_for_path(path, weather, maxs)
 
     return str(res)
 
@@ -55,7 +51,7 @@ def test() -> None:
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part)
@@ -0,0 +1,25 @@
+"""
+Day 25: Full of Hot Air - Input generator
+https://adventofcode.com/2022/day/25
+
+'scale' multiplies the number of SNAFU numbers of the example input.
+"""
+import random
+
+
+def generate(scale: int = 1, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    numbers = [
+        rng.choice("12") + "".join(rng.choices("=-012", k=rng.randint(0, 19)))
+        for _ in range(13 * scale)
+    ]
+    return "\n".join(numbers) + "\n"
+
+
+def test_generate() -> None:
+    from part1 import base10_to_snafu, compute, snafu_to_int
+
+    input_s = generate(10)
+    numbers = input_s.splitlines()
+    assert len(numbers) == 130
+    assert compute(input_s) == base10_to_snafu(sum(map(snafu_to_int, numbers)))
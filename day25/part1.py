@@ -1,13 +1,11 @@
 from __future__ import annotations
 
 import os
+from typing import Iterable
 
-from aoc import AOC
-from dotenv import load_dotenv
+from aoc import AOC, get_api_token
 
 HERE = os.path.dirname(os.path.abspath(__file__))
-load_dotenv(os.path.join(HERE, "../.env"))
-API_TOKEN = os.getenv("API_TOKEN")
 
 DIGIT_SNAFU_TO_BASE10 = {"2": 2, "1": 1, "0": 0, "-": -1, "=": -2}
 DIGIT_BAS10 = _TO_SNAFU = "=-012"
@@ -36,8 +34,12 @@ def base10_to_snafu(number: int) -> str:
     return "".join(reversed(digits))
 
 
+def compute_lines(lines: Iterable[str]) -> str:
+    return str(base10_to_snafu(sum(map(snafu_to_int, lines))))
+
+
 def compute(input_str: str) -> str:
-    return str(base10_to_snafu(sum(map(snafu_to_int, input_str.splitlines()))))
+    return compute_lines(input_str.splitlines())
 
 
 def test_snafu_to_int() -> None:
@@ -88,10 +90,11 @@ def test() -> None:
         input_s = file.read()
 
     assert compute(input_s) == "2=-1=0"
+    assert compute_lines(iter(input_s.splitlines())) == "2=-1=0"
 
 
 def main():
-    aoc = AOC(API_TOKEN, HERE)
+    aoc = AOC(get_api_token(), HERE)
     year, day, part = 2022, 0, 0
 
     aoc.run_part(year, day, part)